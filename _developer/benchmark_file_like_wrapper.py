@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+Microbenchmark comparing attribute access of "file.Object" with and without
+the previously used "__getattribute__()" based delegation.
+
+Usage: PYTHONPATH=src python _developer/benchmark_file_like_wrapper.py
+"""
+
+# pylint: disable=import-error,protected-access
+
+from os import path
+from tempfile import mkdtemp
+from shutil import rmtree
+from timeit import timeit
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_runtime.exceptions import IOException
+from dpt_vfs.dpt_vfs.file.object import Object
+
+class LegacyObject(Object):
+    """
+"file.Object" delegating file IO methods with "__getattribute__()".
+    """
+
+    __slots__ = ( )
+
+    def __getattribute__(self, name):
+        """
+python.org: Called unconditionally to implement attribute accesses for
+instances of the class.
+        """
+
+        if (name == "__class__"
+            or name not in self.__class__._FILE_WRAPPED_METHODS
+           ): _return = object.__getattribute__(self, name)
+        else:
+            if (self._wrapped_resource is None): self._open_wrapped_resource()
+            if (self._wrapped_resource is None): raise IOException("'{0}' not available for {1!r}".format(name, self))
+
+            _return = getattr(self._wrapped_resource, name)
+        #
+
+        return _return
+    #
+#
+
+def benchmark(vfs_object_class, file_url, number):
+    """
+Runs the benchmark for the given VFS object class.
+
+:param vfs_object_class: VFS object class
+:param file_url: VFS URL of the file to read
+:param number: Number of iterations
+
+:return: (tuple) Seconds for attribute access and seek and read calls
+    """
+
+    vfs_object = vfs_object_class()
+    vfs_object.open(file_url, True)
+
+    attribute_time = timeit(lambda: (vfs_object.file_path_name, vfs_object.supported_features, vfs_object.implementing_scheme), number = number)
+    read_time = timeit(lambda: (vfs_object.seek(0), vfs_object.read(16)), number = number)
+
+    vfs_object.close()
+
+    return ( attribute_time, read_time )
+#
+
+if (__name__ == "__main__"):
+    base_directory = mkdtemp()
+
+    try:
+        file_path_name = path.join(base_directory, "benchmark.bin")
+        with open(file_path_name, "wb") as file_object: file_object.write(b"x" * 4096)
+
+        file_url = "file:///{0}".format(quote_plus(file_path_name, "/"))
+        number = 100000
+
+        legacy_times = benchmark(LegacyObject, file_url, number)
+        current_times = benchmark(Object, file_url, number)
+
+        print("{0:d} iterations       __getattribute__  descriptor".format(number))
+        print("attribute access      {0:13.3f}s  {1:9.3f}s".format(legacy_times[0], current_times[0]))
+        print("seek(0) and read(16)  {0:13.3f}s  {1:9.3f}s".format(legacy_times[1], current_times[1]))
+    finally: rmtree(base_directory)
+#
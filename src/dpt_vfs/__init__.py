@@ -21,4 +21,17 @@ from .abstract import Abstract
 from .abstract_watcher import AbstractWatcher
 from .file_like_wrapper_mixin import FileLikeWrapperMixin
 from .implementation import Implementation
+from .mimetype_table import MimetypeTable
+from .object_pool import ObjectPool
+from .stat_record import StatRecord
+from .vfs_url import VfsUrl
+from .watcher_callback_executor import WatcherCallbackExecutor
+from .watcher_event import WatcherEvent
+from .watcher_event_coalescer import WatcherEventCoalescer
 from .watcher_implementation import WatcherImplementation
+
+try:
+    from .async_implementation import AsyncImplementation
+    from .async_object import AsyncObject
+    from .async_watcher_event_stream import AsyncWatcherEventStream
+except (ImportError, SyntaxError): pass
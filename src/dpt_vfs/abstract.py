@@ -19,10 +19,18 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=unused-argument
 
+from io import IOBase
+from operator import attrgetter
+from time import time
+import os
+
 from dpt_runtime import SupportsMixin
 from dpt_runtime.exceptions import IOException, NotImplementedException, OperationNotSupportedException, ValueException
 from dpt_runtime.io import FileLikeCopyMixin
 
+from .stat_record import StatRecord
+from .vfs_url import VfsUrl
+
 class Abstract(FileLikeCopyMixin, SupportsMixin):
     """
 Provides the abstract VFS implementation for an object.
@@ -49,9 +57,15 @@ File type
 Link type
     """
 
+    _SUPPORTED_FEATURES = { }
+    """
+Features supported by all instances of this class. The value is either a
+boolean or the name of a method returning a boolean.
+    """
+
     # pylint: disable=invalid-name
 
-    __slots__ = ( "__weakref__", ) + FileLikeCopyMixin._mixin_slots_ + SupportsMixin._mixin_slots_
+    __slots__ = ( "__weakref__", "_supported_features" ) + FileLikeCopyMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -64,8 +78,17 @@ Constructor __init__(Abstract)
 :since: v1.0.0
         """
 
+        # "SupportsMixin.__init__()" is not called to avoid creating the
+        # dictionary of supported features for each instance.
+        # pylint: disable=super-init-not-called
+
         FileLikeCopyMixin.__init__(self)
-        SupportsMixin.__init__(self)
+
+        self._supported_features = None
+        """
+Dictionary of features supported by this instance. Created from the ones
+defined for its class on first access of "supported_features".
+        """
     #
 
     def __del__(self):
@@ -202,6 +225,44 @@ Returns the size in bytes.
         raise NotImplementedException()
     #
 
+    @property
+    def supported_features(self):
+        """
+Returns the dictionary of features supported by this instance. It is
+created from the features defined for its class on first access. Changes
+override the class defaults for this instance only. The value is either a
+boolean or a callback.
+
+:return: (dict) Supported features of this instance
+:since:  v1.1.0
+        """
+
+        if (self._supported_features is None):
+            supported_features = { }
+
+            for feature, value in self.__class__._SUPPORTED_FEATURES.items():
+                supported_features[feature] = (value if (type(value) is bool) else getattr(self, value))
+            #
+
+            self._supported_features = supported_features
+        #
+
+        return self._supported_features
+    #
+
+    @supported_features.setter
+    def supported_features(self, supported_features):
+        """
+Sets the dictionary of features supported by this instance.
+
+:param supported_features: Supported features of this instance
+
+:since: v1.1.0
+        """
+
+        self._supported_features = supported_features
+    #
+
     @property
     def time_created(self):
         """
@@ -260,6 +321,52 @@ python.org: Flush and close this stream.
         raise NotImplementedException()
     #
 
+    def copy_data(self, target, timeout = None):
+        """
+Copy data to the target. Data is read into a reused buffer if "readinto()"
+is supported.
+
+:param target: Any object providing a "write()" method
+:param timeout: Timeout for copying data
+
+:since: v1.1.0
+        """
+
+        if (not self.is_supported("readinto")): FileLikeCopyMixin.copy_data(self, target, timeout)
+        else:
+            timeout_time = (0 if (timeout is None) else time() + timeout)
+            self.seek(0)
+
+            buffer_view = memoryview(bytearray(self.file_like_copy_io_chunk_size))
+            is_buffer_supported = isinstance(target, IOBase)
+
+            while ((not self.is_eof)
+                   and (timeout_time < 1 or time() < timeout_time)
+                  ):
+                size = self.readinto(buffer_view)
+                if (not size): break
+
+                target.write(buffer_view[:size] if (is_buffer_supported) else buffer_view[:size].tobytes())
+            #
+
+            if (not self.is_eof): raise IOException("Timeout occurred before EOF")
+        #
+    #
+
+    def copy_to(self, target, timeout = None):
+        """
+Copies all data of this VFS object to the given target at its current
+position. The position of this VFS object is undefined afterwards.
+
+:param target: Target VFS object or any object providing a "write()" method
+:param timeout: Timeout for copying data
+
+:since: v1.1.0
+        """
+
+        self.copy_data(target, timeout)
+    #
+
     def flush(self):
         """
 python.org: Flush the write buffers of the stream if applicable.
@@ -270,6 +377,46 @@ python.org: Flush the write buffers of the stream if applicable.
         raise OperationNotSupportedException()
     #
 
+    def is_supported(self, feature):
+        """
+Returns true if the feature requested is supported by this instance.
+Features defined for its class are used until "supported_features" has
+been accessed for this instance.
+
+:param feature: Feature name string
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        if (self._supported_features is not None): _return = SupportsMixin.is_supported(self, feature)
+        else:
+            _return = self.__class__._SUPPORTED_FEATURES.get(feature, False)
+            if (type(_return) is not bool): _return = getattr(self, _return)()
+        #
+
+        return _return
+    #
+
+    def iter_scan(self, sort = False, batch_size = None):
+        """
+Returns an iterator over objects of a collection like a directory. Child
+objects are yielded as soon as they are available.
+
+:param sort: True to yield child objects sorted by name
+:param batch_size: Yield lists of up to the given number of child objects
+                   instead of single ones
+
+:return: (object) Child VFS object iterator
+:since:  v1.1.0
+        """
+
+        children = self.scan()
+        if (sort): children = sorted(children, key = attrgetter("name"))
+
+        return Abstract._get_batched_iterator(iter(children), batch_size)
+    #
+
     def new(self, _type, vfs_url):
         """
 Creates a new VFS object.
@@ -311,6 +458,48 @@ python.org: Read up to n bytes from the object and return them.
         raise OperationNotSupportedException()
     #
 
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b,
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.1.0
+        """
+
+        raise OperationNotSupportedException()
+    #
+
+    def reopen(self, vfs_url, readonly = False):
+        """
+Closes this VFS object and opens it again for the given VFS URL. This
+allows reusing instances instead of creating a new one for each VFS URL.
+Settings and feature overrides of this instance are reset.
+
+:param vfs_url: VFS URL
+:param readonly: Open object in readonly mode
+
+:since: v1.1.0
+        """
+
+        self.close()
+        self._reset_state()
+        self.open(vfs_url, readonly)
+    #
+
+    def _reset_state(self):
+        """
+Resets settings and feature overrides of this closed instance to the
+defaults of a new one.
+
+:since: v1.1.0
+        """
+
+        self._supported_features = None
+    #
+
     def scan(self):
         """
 Scan over objects of a collection like a directory.
@@ -335,6 +524,47 @@ python.org: Change the stream position to the given byte offset.
         raise OperationNotSupportedException()
     #
 
+    def send_to_fd(self, fd, offset = 0, count = None, timeout = None):
+        """
+Sends data of this VFS object to the given blocking file descriptor. The
+position of this VFS object is undefined afterwards.
+
+:param fd: Target file descriptor
+:param offset: Offset to start sending data from
+:param count: Number of bytes to send; None to send until EOF
+:param timeout: Timeout for sending data
+
+:return: (int) Number of bytes sent
+:since:  v1.1.0
+        """
+
+        _return = 0
+
+        timeout_time = (0 if (timeout is None) else time() + timeout)
+        self.seek(offset)
+
+        while ((count is None or _return < count)
+               and (not self.is_eof)
+               and (timeout_time < 1 or time() < timeout_time)
+              ):
+            size = (self.file_like_copy_io_chunk_size if (count is None) else min(self.file_like_copy_io_chunk_size, count - _return))
+
+            data = self.read(size)
+            if (not data): break
+
+            data_view = memoryview(data)
+
+            while (len(data_view) > 0): data_view = data_view[os.write(fd, data_view):]
+            _return += len(data)
+        #
+
+        if ((count is None or _return < count)
+            and (not self.is_eof)
+           ): raise IOException("Timeout occurred before EOF")
+
+        return _return
+    #
+
     def tell(self):
         """
 python.org: Return the current stream position as an opaque number.
@@ -359,6 +589,44 @@ python.org: Resize the stream to the given size in bytes.
         raise OperationNotSupportedException()
     #
 
+    def walk(self, max_depth = None, filter_callback = None, descend_callback = None, max_workers = None, queue_size = 1024):
+        """
+Returns an iterator over all objects below a collection like a directory.
+Linked directories are not descended into. Directory objects yielded must
+not be closed before the iterator has been continued.
+
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+:param filter_callback: Callback returning true if the given child VFS
+                        object should be yielded
+:param descend_callback: Callback returning true if the given child
+                         directory VFS object should be descended into
+:param max_workers: Maximum number of concurrent workers (if supported by
+                    implementation)
+:param queue_size: Maximum number of child VFS objects read ahead (if
+                   supported by implementation)
+
+:return: (object) VFS object iterator
+:since:  v1.1.0
+        """
+
+        vfs_directories = [ ( self, 1 ) ]
+
+        while (len(vfs_directories) > 0):
+            vfs_directory, depth = vfs_directories.pop()
+
+            for vfs_child_object in vfs_directory.iter_scan(True):
+                if (vfs_child_object.is_directory
+                    and (not vfs_child_object.is_link)
+                    and (max_depth is None or depth < max_depth)
+                    and (descend_callback is None or descend_callback(vfs_child_object))
+                   ): vfs_directories.append(( vfs_child_object, 1 + depth ))
+
+                if (filter_callback is None or filter_callback(vfs_child_object)): yield vfs_child_object
+            #
+        #
+    #
+
     def write(self, b, timeout = -1):
         """
 python.org: Write the given bytes or bytearray object, b, to the underlying
@@ -374,28 +642,72 @@ raw stream and return the number of bytes written.
         raise OperationNotSupportedException()
     #
 
-    @staticmethod
-    def _get_id_from_vfs_url(vfs_url):
+    @classmethod
+    def stat_many(cls, vfs_urls):
         """
-Returns the ID part of the VFS URL given.
+Returns the metadata of all given VFS URLs. Errors are reported for each
+VFS URL in the corresponding record.
 
-:return: (str) VFS URL ID
-:since:  v1.0.0
+:param cls: Python class
+:param vfs_urls: Iterable of VFS URLs of this VFS object class
+
+:return: (list) StatRecord instances in the order of the VFS URLs given
+:since:  v1.1.0
         """
 
-        if (type(vfs_url) is not str): raise ValueException("VFS URL given is invalid")
+        # pylint: disable=broad-except
+
+        _return = [ ]
+
+        for vfs_url in vfs_urls:
+            vfs_object = cls()
+
+            try:
+                vfs_object.open(vfs_url, True)
+                _return.append(StatRecord.from_vfs_object(vfs_object, vfs_url))
+            except Exception as handled_exception: _return.append(StatRecord.from_error(vfs_url, handled_exception))
+            finally:
+                try: vfs_object.close()
+                except Exception: pass
+            #
+        #
 
-        vfs_url_data = vfs_url.split("://", 1)
-        if (len(vfs_url_data) == 1): raise ValueException("VFS URL '{0}' is invalid".format(vfs_url))
+        return _return
+    #
 
-        _return = vfs_url_data[1]
+    @staticmethod
+    def _get_batched_iterator(iterator, batch_size = None):
+        """
+Returns an iterator yielding lists of up to the given number of items read
+from the given iterator.
 
-        if (_return in ( "", "/" )): _return = ""
-        else: _return = (_return[1:] if (_return[:1] == "/") else _return).strip()
+:param iterator: Source iterator
+:param batch_size: Maximum number of items in a batch; None to return the
+                   source iterator unchanged
+
+:return: (object) Iterator
+:since:  v1.1.0
+        """
+
+        if (batch_size is None): _return = iterator
+        elif (batch_size < 1): raise ValueException("Batch size given is invalid")
+        else: _return = Abstract._iter_batches(iterator, batch_size)
 
         return _return
     #
 
+    @staticmethod
+    def _get_id_from_vfs_url(vfs_url):
+        """
+Returns the ID part of the VFS URL given.
+
+:return: (str) VFS URL ID
+:since:  v1.0.0
+        """
+
+        return VfsUrl.parse(vfs_url).id
+    #
+
     @staticmethod
     def _get_scheme_from_vfs_url(vfs_url):
         """
@@ -405,11 +717,37 @@ Returns the scheme of the VFS URL given.
 :since:  v1.0.0
         """
 
-        if (type(vfs_url) is not str): raise ValueException("VFS URL given is invalid")
+        return VfsUrl.parse(vfs_url).scheme
+    #
+
+    @staticmethod
+    def _iter_batches(iterator, batch_size):
+        """
+Yields lists of up to the given number of items read from the given
+iterator. The source iterator is closed if this one is closed early.
+
+:param iterator: Source iterator
+:param batch_size: Maximum number of items in a batch
+
+:return: (object) Iterator of item lists
+:since:  v1.1.0
+        """
+
+        batch = [ ]
+
+        try:
+            for item in iterator:
+                batch.append(item)
 
-        vfs_url_data = vfs_url.split("://", 1)
-        if (len(vfs_url_data) == 1): raise ValueException("VFS URL '{0}' is invalid".format(vfs_url))
+                if (len(batch) >= batch_size):
+                    yield batch
+                    batch = [ ]
+                #
+            #
 
-        return vfs_url_data[0].lower()
+            if (len(batch) > 0): yield batch
+        finally:
+            if (hasattr(iterator, "close")): iterator.close()
+        #
     #
 #
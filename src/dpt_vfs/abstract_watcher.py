@@ -19,7 +19,10 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=unused-argument
 
-from dpt_runtime.exceptions import NotImplementedException
+from dpt_runtime.exceptions import NotImplementedException, OperationNotSupportedException
+
+try: from .async_watcher_event_stream import AsyncWatcherEventStream
+except (ImportError, SyntaxError): AsyncWatcherEventStream = None
 
 class AbstractWatcher(object):
     """
@@ -46,6 +49,10 @@ Deleted event
     """
 Created event
     """
+    EVENT_TYPE_REPLACED = 4
+    """
+Replaced event (deleted and created again)
+    """
 
     __slots__ = ( "__weakref__", )
     """
@@ -90,6 +97,26 @@ Checks a given URL for changes if "is_synchronous()" is true.
         raise NotImplementedException()
     #
 
+    def events(self, url, loop = None, max_size = None):
+        """
+Returns an asynchronous iterator of change events for the given URL. The
+URL is watched until the iterator is closed. Synchronous watchers only
+report events after "check()" has been called.
+
+:param url: Resource URL to be watched
+:param loop: Event loop to deliver events to
+:param max_size: Maximum number of events queued
+
+:return: (object) AsyncWatcherEventStream instance
+:since:  v1.1.0
+        """
+
+        # global: AsyncWatcherEventStream
+
+        if (AsyncWatcherEventStream is None): raise OperationNotSupportedException("asyncio is not supported")
+        return AsyncWatcherEventStream(self, url, loop, max_size)
+    #
+
     def free(self):
         """
 Frees all watcher callbacks for garbage collection.
@@ -116,12 +143,14 @@ if a callback is given but not defined for the watched URL.
         raise NotImplementedException()
     #
 
-    def register(self, url, callback):
+    def register(self, url, callback, recursive = False):
         """
 Handles registration of resource URL watches and its callbacks.
 
 :param url: Resource URL to be watched
 :param callback: Callback for the path
+:param recursive: True to watch the collection and all of its descendants
+                  (v1.1.0)
 
 :return: (bool) True on success
 :since:  v1.0.0
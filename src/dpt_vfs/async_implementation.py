@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
+from dpt_runtime import Settings
+from dpt_threading import ThreadLock
+
+from .implementation import Implementation
+
+class AsyncImplementation(object):
+    """
+"AsyncImplementation" provides implementation independent asyncio
+coroutines to access VFS objects. Blocking calls are executed in a
+dedicated, bounded thread pool.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    TYPE_DIRECTORY = Implementation.TYPE_DIRECTORY
+    """
+Directory (or collection like) type
+    """
+    TYPE_FILE = Implementation.TYPE_FILE
+    """
+File type
+    """
+    TYPE_LINK = Implementation.TYPE_LINK
+    """
+Link type
+    """
+
+    __slots__ = ( )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _executor = None
+    """
+Thread pool executing blocking VFS calls
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+
+    @staticmethod
+    def get_executor():
+        """
+Returns the thread pool executing blocking VFS calls. The number of
+threads is limited by the "dpt_vfs_async_max_workers" setting.
+
+:return: (object) "concurrent.futures.Executor" instance
+:since:  v1.1.0
+        """
+
+        _return = AsyncImplementation._executor
+
+        if (_return is None):
+            with AsyncImplementation._lock:
+                _return = AsyncImplementation._executor
+
+                if (_return is None):
+                    _return = ThreadPoolExecutor(max_workers = Settings.get("dpt_vfs_async_max_workers", 4))
+                    AsyncImplementation._executor = _return
+                #
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    async def load_vfs_url(vfs_url, readonly = False):
+        """
+Returns the initialized asynchronous object instance for the given VFS
+URL.
+
+:param vfs_url: VFS URL
+:param readonly: Open object in readonly mode
+
+:return: (object) Asynchronous VFS object instance
+:since:  v1.1.0
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        from .async_object import AsyncObject
+
+        vfs_object = await AsyncImplementation.run(Implementation.load_vfs_url, vfs_url, readonly)
+        return AsyncObject(vfs_object)
+    #
+
+    @staticmethod
+    async def new_vfs_url(_type, vfs_url):
+        """
+Returns a new asynchronous object instance for the given VFS URL.
+
+:param _type: VFS object type
+:param vfs_url: VFS URL
+
+:return: (object) Asynchronous VFS object instance
+:since:  v1.1.0
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        from .async_object import AsyncObject
+
+        vfs_object = await AsyncImplementation.run(Implementation.new_vfs_url, _type, vfs_url)
+        return AsyncObject(vfs_object)
+    #
+
+    @staticmethod
+    def run(callable_object, *args, **kwargs):
+        """
+Executes the given blocking callable in the VFS thread pool.
+
+:param callable_object: Callable to execute
+
+:return: (object) Awaitable future of the result
+:since:  v1.1.0
+        """
+
+        if (len(kwargs) > 0): callable_object = partial(callable_object, **kwargs)
+        return asyncio.get_event_loop().run_in_executor(AsyncImplementation.get_executor(), callable_object, *args)
+    #
+
+    @staticmethod
+    def shutdown_executor(wait = True):
+        """
+Shuts down the thread pool executing blocking VFS calls. A new one is
+created on demand.
+
+:param wait: True to wait for pending calls
+
+:since: v1.1.0
+        """
+
+        with AsyncImplementation._lock:
+            executor = AsyncImplementation._executor
+            AsyncImplementation._executor = None
+        #
+
+        if (executor is not None): executor.shutdown(wait)
+    #
+#
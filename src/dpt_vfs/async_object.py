@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime.exceptions import OperationNotSupportedException, TypeException
+
+from .abstract import Abstract
+from .async_implementation import AsyncImplementation
+
+class AsyncObject(object):
+    """
+"AsyncObject" provides asyncio coroutines for an VFS object. Each
+coroutine executes the blocking call of the VFS object in the thread pool
+of "AsyncImplementation".
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _STAT_ATTRIBUTES = ( "mimetype", "name", "size", "time_created", "time_updated", "type", "url" )
+    """
+VFS object attributes read by "stat()"
+    """
+
+    __slots__ = ( "_vfs_object", )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, vfs_object):
+        """
+Constructor __init__(AsyncObject)
+
+:param vfs_object: VFS object
+
+:since: v1.1.0
+        """
+
+        if (not isinstance(vfs_object, Abstract)): raise TypeException("VFS object given is invalid")
+
+        self._vfs_object = vfs_object
+        """
+Wrapped VFS object
+        """
+    #
+
+    async def __aenter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:return: (object) This instance
+:since:  v1.1.0
+        """
+
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:param exc_type: Exception type
+:param exc_value: Exception
+:param traceback: Traceback
+
+:return: (bool) True to suppress exceptions
+:since:  v1.1.0
+        """
+
+        await self.close()
+        return False
+    #
+
+    def __aiter__(self):
+        """
+python.org: Return an asynchronous iterator object.
+
+:return: (object) Asynchronous iterator of child VFS objects
+:since:  v1.1.0
+        """
+
+        return self.iter_scan()
+    #
+
+    @property
+    def vfs_object(self):
+        """
+Returns the wrapped VFS object.
+
+:return: (object) VFS object
+:since:  v1.1.0
+        """
+
+        return self._vfs_object
+    #
+
+    async def close(self):
+        """
+python.org: Flush and close this stream.
+
+:since: v1.1.0
+        """
+
+        await AsyncImplementation.run(self._vfs_object.close)
+    #
+
+    async def copy_to(self, target, timeout = None):
+        """
+Copies all data of this VFS object to the given target at its current
+position.
+
+:param target: Target VFS object or any object providing a "write()" method
+:param timeout: Timeout for copying data
+
+:since: v1.1.0
+        """
+
+        if (isinstance(target, AsyncObject)): target = target.vfs_object
+        await AsyncImplementation.run(self._vfs_object.copy_to, target, timeout)
+    #
+
+    async def flush(self):
+        """
+python.org: Flush the write buffers of the stream if applicable.
+
+:since: v1.1.0
+        """
+
+        await AsyncImplementation.run(self._vfs_object.flush)
+    #
+
+    def _get_stat(self):
+        """
+Reads the metadata of this VFS object.
+
+:return: (dict) Metadata
+:since:  v1.1.0
+        """
+
+        _return = { }
+
+        for name in AsyncObject._STAT_ATTRIBUTES:
+            try: _return[name] = getattr(self._vfs_object, name)
+            except OperationNotSupportedException: _return[name] = None
+        #
+
+        return _return
+    #
+
+    def is_supported(self, feature):
+        """
+Checks if the given feature is supported by the wrapped VFS object. This
+check does not block as long as no file IO is required for it.
+
+:param feature: Feature name
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        return self._vfs_object.is_supported(feature)
+    #
+
+    async def iter_scan(self, sort = False, batch_size = 64):
+        """
+Scan over objects of a collection like a directory. Child VFS objects are
+read in batches of the given size. The directory is closed if iteration
+ends early.
+
+:param sort: True to sort children by name
+:param batch_size: Number of child VFS objects read per blocking call
+
+:return: (object) Asynchronous iterator of child VFS objects
+:since:  v1.1.0
+        """
+
+        iterator = await AsyncImplementation.run(self._vfs_object.iter_scan, sort, batch_size)
+
+        try:
+            while True:
+                batch = await AsyncImplementation.run(next, iterator, None)
+                if (batch is None): break
+
+                for vfs_object in batch: yield AsyncObject(vfs_object)
+            #
+        finally:
+            if (hasattr(iterator, "close")): await AsyncImplementation.run(iterator.close)
+        #
+    #
+
+    async def open(self, vfs_url, readonly = False):
+        """
+Opens a VFS object. The handle is set at the beginning of the object.
+
+:param vfs_url: VFS URL
+:param readonly: Open object in readonly mode
+
+:since: v1.1.0
+        """
+
+        await AsyncImplementation.run(self._vfs_object.open, vfs_url, readonly)
+    #
+
+    async def read(self, n = 0, timeout = -1):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+:param timeout: Timeout to use
+
+:return: (bytes) Data; None if EOF
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.read, n, timeout)
+    #
+
+    async def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b,
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.readinto, b)
+    #
+
+    async def scan(self):
+        """
+Scan over objects of a collection like a directory.
+
+:return: (list) Child asynchronous VFS objects
+:since:  v1.1.0
+        """
+
+        vfs_objects = await AsyncImplementation.run(self._vfs_object.scan)
+        return [ AsyncObject(vfs_object) for vfs_object in vfs_objects ]
+    #
+
+    async def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.seek, offset)
+    #
+
+    async def stat(self):
+        """
+Returns the metadata of this VFS object read with one blocking call.
+Metadata not supported by the VFS object is set to None.
+
+:return: (dict) Metadata with the keys "mimetype", "name", "size",
+         "time_created", "time_updated", "type" and "url"
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._get_stat)
+    #
+
+    async def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.tell)
+    #
+
+    async def truncate(self, new_size):
+        """
+python.org: Resize the stream to the given size in bytes.
+
+:param new_size: Cut file at the given byte position
+
+:return: (int) New file size
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.truncate, new_size)
+    #
+
+    async def write(self, b, timeout = -1):
+        """
+python.org: Write the given bytes or bytearray object, b, to the underlying
+raw stream and return the number of bytes written.
+
+:param b: (Over)write file with b
+:param timeout: Timeout to use
+
+:return: (int) Number of bytes written
+:since:  v1.1.0
+        """
+
+        return await AsyncImplementation.run(self._vfs_object.write, b, timeout)
+    #
+#
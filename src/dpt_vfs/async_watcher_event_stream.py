@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import deque
+import asyncio
+
+from dpt_runtime import Settings
+from dpt_runtime.exceptions import IOException
+
+from .watcher_event import WatcherEvent
+
+class AsyncWatcherEventStream(object):
+    """
+"AsyncWatcherEventStream" is an asynchronous iterator of the change events
+of a watched URL. Events are queued by the thread of the watcher without
+blocking and handed over to the event loop with at most one pending
+wake-up call.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_callback",
+                  "dropped_events",
+                  "_events",
+                  "_is_closed",
+                  "_is_wakeup_scheduled",
+                  "_loop",
+                  "_url",
+                  "_waiter",
+                  "_watcher"
+                )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, watcher, url, loop = None, max_size = None):
+        """
+Constructor __init__(AsyncWatcherEventStream)
+
+:param watcher: Watcher instance
+:param url: Resource URL to be watched
+:param loop: Event loop to deliver events to
+:param max_size: Maximum number of events queued; the oldest ones are
+                 dropped if the consumer is too slow
+
+:since: v1.1.0
+        """
+
+        if (max_size is None): max_size = Settings.get("dpt_vfs_watcher_event_stream_max_size", 1024)
+
+        self._callback = self._on_event
+        """
+Bound callback registered with the watcher
+        """
+        self.dropped_events = 0
+        """
+Number of events dropped because the queue was full
+        """
+        self._events = deque(maxlen = max_size)
+        """
+Queued events not yet consumed
+        """
+        self._is_closed = False
+        """
+True if the stream has been closed
+        """
+        self._is_wakeup_scheduled = False
+        """
+True if a wake-up call is pending in the event loop
+        """
+        self._loop = (asyncio.get_event_loop() if (loop is None) else loop)
+        """
+Event loop events are delivered to
+        """
+        self._url = url
+        """
+Resource URL watched
+        """
+        self._waiter = None
+        """
+Future the consumer waits on for new events
+        """
+        self._watcher = watcher
+        """
+Watcher instance
+        """
+
+        if (not watcher.register(url, self._callback)):
+            self._is_closed = True
+            raise IOException("Failed to watch '{0}'".format(url))
+        #
+    #
+
+    def __aiter__(self):
+        """
+python.org: Return an asynchronous iterator object.
+
+:return: (object) Asynchronous iterator
+:since:  v1.1.0
+        """
+
+        return self
+    #
+
+    async def __aenter__(self):
+        """
+python.org: Enter the runtime context related to this object.
+
+:return: (object) This instance
+:since:  v1.1.0
+        """
+
+        return self
+    #
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+python.org: Exit the runtime context related to this object.
+
+:param exc_type: Exception type
+:param exc_value: Exception
+:param traceback: Traceback
+
+:return: (bool) True to suppress exceptions
+:since:  v1.1.0
+        """
+
+        self.close()
+        return False
+    #
+
+    async def __anext__(self):
+        """
+python.org: Must return an awaitable resulting in a next value of the
+iterator.
+
+:return: (object) WatcherEvent instance
+:since:  v1.1.0
+        """
+
+        while (len(self._events) < 1):
+            if (self._is_closed): raise StopAsyncIteration()
+
+            self._waiter = self._loop.create_future()
+
+            try: await self._waiter
+            finally: self._waiter = None
+        #
+
+        return self._events.popleft()
+    #
+
+    @property
+    def is_closed(self):
+        """
+Returns true if the stream has been closed.
+
+:return: (bool) True if closed
+:since:  v1.1.0
+        """
+
+        return self._is_closed
+    #
+
+    @property
+    def url(self):
+        """
+Returns the resource URL watched.
+
+:return: (str) Resource URL
+:since:  v1.1.0
+        """
+
+        return self._url
+    #
+
+    def close(self):
+        """
+Unregisters the stream from the watcher. Events already queued are still
+returned.
+
+:since: v1.1.0
+        """
+
+        if (not self._is_closed):
+            self._is_closed = True
+            self._watcher.unregister(self._url, self._callback)
+
+            self._schedule_wakeup()
+        #
+    #
+
+    def _on_event(self, event_type, url, changed_value = None):
+        """
+Callback called by the watcher thread for each event. It never blocks.
+
+:param event_type: Event type
+:param url: Resource URL watched
+:param changed_value: Changed value if reported
+
+:since: v1.1.0
+        """
+
+        if (len(self._events) == self._events.maxlen): self.dropped_events += 1
+        self._events.append(WatcherEvent(event_type, url, changed_value))
+
+        self._schedule_wakeup()
+    #
+
+    def _schedule_wakeup(self):
+        """
+Schedules a wake-up call in the event loop if none is pending.
+
+:since: v1.1.0
+        """
+
+        if (not self._is_wakeup_scheduled):
+            self._is_wakeup_scheduled = True
+
+            try: self._loop.call_soon_threadsafe(self._wakeup)
+            except RuntimeError: self._is_wakeup_scheduled = False
+        #
+    #
+
+    def _wakeup(self):
+        """
+Wakes up the consumer waiting for new events in the event loop.
+
+:since: v1.1.0
+        """
+
+        self._is_wakeup_scheduled = False
+        if (self._waiter is not None and (not self._waiter.done())): self._waiter.set_result(None)
+    #
+#
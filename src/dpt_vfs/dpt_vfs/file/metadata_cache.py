@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+from collections import OrderedDict
+from os import path
+from stat import S_ISDIR
+import os
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_runtime import Settings
+from dpt_runtime.exceptions import OperationNotSupportedException
+from dpt_threading import ThreadLock
+
+from ...abstract import Abstract
+
+class MetadataCache(object):
+    """
+"MetadataCache" provides a process-wide, size-bounded LRU cache of
+"file:///" object metadata. Cached entries are invalidated by events of the
+"file:///" watcher. Paths are only cached while being watched successfully.
+
+Synchronous watchers are checked for changes before a cached entry is
+returned.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _entries = OrderedDict()
+    """
+Cached metadata entries in least recently used order
+    """
+    _generation = 0
+    """
+Counter increased for each invalidation
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _max_size = None
+    """
+Maximum number of cached entries
+    """
+    _stale_paths = [ ]
+    """
+Paths invalidated by watcher events and not yet unregistered
+    """
+    _watcher = None
+    """
+"file:///" watcher instance
+    """
+
+    @staticmethod
+    def clear():
+        """
+Removes all cached entries.
+
+:since: v1.1.0
+        """
+
+        with MetadataCache._lock:
+            removed_paths = list(MetadataCache._entries.keys())
+            removed_paths += MetadataCache._stale_paths
+
+            MetadataCache._entries.clear()
+            MetadataCache._generation += 1
+            MetadataCache._stale_paths = [ ]
+        #
+
+        MetadataCache._unregister_paths(removed_paths)
+    #
+
+    @staticmethod
+    def get(_path):
+        """
+Returns the cached metadata for the given absolute filesystem path.
+
+:param _path: Absolute filesystem path
+
+:return: (dict) Metadata dict; None if not cached
+:since:  v1.1.0
+        """
+
+        with MetadataCache._lock:
+            _return = MetadataCache._entries.pop(_path, None)
+            if (_return is not None): MetadataCache._entries[_path] = _return
+        #
+
+        if (_return is not None):
+            watcher = MetadataCache._get_watcher()
+
+            if (watcher.is_synchronous): watcher.check(_return['url'])
+
+            if (not watcher.is_watched(_return['url'], MetadataCache._on_watcher_event)):
+                MetadataCache.invalidate(_path)
+                _return = None
+            else:
+                with MetadataCache._lock:
+                    if (_path not in MetadataCache._entries): _return = None
+                #
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def get_or_load(_path):
+        """
+Returns the cached metadata for the given absolute filesystem path. The
+metadata is read and cached if not already done.
+
+:param _path: Absolute filesystem path
+
+:return: (dict) Metadata dict; None if not available
+:since:  v1.1.0
+        """
+
+        # pylint: disable=broad-except
+
+        MetadataCache._unregister_stale_paths()
+
+        _return = MetadataCache.get(_path)
+
+        if (_return is None):
+            url = "file:///{0}".format(quote_plus(_path, "/"))
+
+            with MetadataCache._lock: generation = MetadataCache._generation
+
+            try: is_watched = MetadataCache._get_watcher().register(url, MetadataCache._on_watcher_event)
+            except OperationNotSupportedException: is_watched = False
+
+            try: stat_result = os.stat(_path)
+            except OSError: stat_result = None
+
+            if (stat_result is not None):
+                is_directory = S_ISDIR(stat_result.st_mode)
+
+                _return = { "is_accessible": os.access(_path, (os.X_OK if (is_directory) else os.R_OK)),
+                            "mimetype": None,
+                            "stat_result": (None if (is_directory) else stat_result),
+                            "type": (Abstract.TYPE_DIRECTORY if (is_directory) else Abstract.TYPE_FILE),
+                            "url": url
+                          }
+            #
+
+            if (is_watched): MetadataCache._set(_path, _return, generation)
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def invalidate(_path):
+        """
+Removes the cached metadata for the given absolute filesystem path.
+
+:param _path: Absolute filesystem path
+
+:since: v1.1.0
+        """
+
+        with MetadataCache._lock:
+            MetadataCache._generation += 1
+
+            if (MetadataCache._entries.pop(_path, None) is not None): MetadataCache._stale_paths.append(_path)
+        #
+    #
+
+    @staticmethod
+    def is_enabled():
+        """
+Returns true if the metadata cache is enabled.
+
+:return: (bool) True if enabled
+:since:  v1.1.0
+        """
+
+        if (MetadataCache._max_size is None):
+            MetadataCache._max_size = int(Settings.get("dpt_vfs_file_metadata_cache_size", 0))
+        #
+
+        return (MetadataCache._max_size > 0)
+    #
+
+    @staticmethod
+    def set_max_size(max_size):
+        """
+Sets the maximum number of cached entries. The cache is disabled for a
+size of 0.
+
+:param max_size: Maximum number of cached entries
+
+:since: v1.1.0
+        """
+
+        with MetadataCache._lock:
+            MetadataCache._max_size = max_size
+            removed_paths = MetadataCache._shrink()
+        #
+
+        MetadataCache._unregister_paths(removed_paths)
+    #
+
+    @staticmethod
+    def set_mimetype(_path, mimetype):
+        """
+Sets the mime type for the cached metadata of the given absolute filesystem
+path.
+
+:param _path: Absolute filesystem path
+:param mimetype: Mime type
+
+:since: v1.1.0
+        """
+
+        with MetadataCache._lock:
+            entry = MetadataCache._entries.get(_path)
+            if (entry is not None): entry['mimetype'] = mimetype
+        #
+    #
+
+    @staticmethod
+    def _get_watcher():
+        """
+Returns the "file:///" watcher instance used for invalidation. Watcher
+implementations are only imported if the cache is used.
+
+:return: (object) Watcher instance
+:since:  v1.1.0
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        from .watcher import Watcher
+
+        if (MetadataCache._watcher is None): MetadataCache._watcher = Watcher()
+        return MetadataCache._watcher
+    #
+
+    @staticmethod
+    def _on_watcher_event(event_type, url, changed_value = None):
+        """
+Invalidates cached metadata for the path of the given watcher event.
+
+:param event_type: Watcher event type
+:param url: Filesystem URL watched
+:param changed_value: Changed filesystem value
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=import-outside-toplevel,protected-access
+
+        from .watcher import Watcher
+
+        _path = Watcher._get_path(url)
+
+        if (_path is not None):
+            if (changed_value is not None): _path = path.join(_path, changed_value)
+            MetadataCache.invalidate(_path)
+        #
+    #
+
+    @staticmethod
+    def _set(_path, entry, generation):
+        """
+Caches the given metadata entry if no invalidation happened since the given
+generation.
+
+:param _path: Absolute filesystem path
+:param entry: Metadata dict; None if the path does not exist
+:param generation: Invalidation counter value read before the metadata
+
+:since: v1.1.0
+        """
+
+        removed_paths = [ ]
+
+        with MetadataCache._lock:
+            if (entry is None or generation != MetadataCache._generation): removed_paths.append(_path)
+            elif (MetadataCache.is_enabled()):
+                MetadataCache._entries[_path] = entry
+                removed_paths = MetadataCache._shrink()
+            #
+        #
+
+        MetadataCache._unregister_paths(removed_paths)
+    #
+
+    @staticmethod
+    def _shrink():
+        """
+Removes least recently used entries exceeding the maximum size. The lock
+must be held by the caller.
+
+:return: (list) Removed paths
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        while (len(MetadataCache._entries) > MetadataCache._max_size):
+            _return.append(MetadataCache._entries.popitem(False)[0])
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _unregister_paths(paths):
+        """
+Unregisters watches for the given paths.
+
+:param paths: List of absolute filesystem paths
+
+:since: v1.1.0
+        """
+
+        if (len(paths) > 0):
+            watcher = MetadataCache._get_watcher()
+
+            for _path in paths:
+                watcher.unregister("file:///{0}".format(quote_plus(_path, "/")), MetadataCache._on_watcher_event)
+            #
+        #
+    #
+
+    @staticmethod
+    def _unregister_stale_paths():
+        """
+Unregisters watches for paths invalidated by watcher events. This is done
+outside of watcher callbacks to not interfere with the event processing.
+
+:since: v1.1.0
+        """
+
+        if (len(MetadataCache._stale_paths) > 0):
+            with MetadataCache._lock:
+                removed_paths = [ _path for _path in MetadataCache._stale_paths if _path not in MetadataCache._entries ]
+                MetadataCache._stale_paths = [ ]
+            #
+
+            MetadataCache._unregister_paths(removed_paths)
+        #
+    #
+#
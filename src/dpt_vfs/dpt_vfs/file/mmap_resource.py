@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+from os import path
+import os
+
+from dpt_runtime.exceptions import IOException, OperationNotSupportedException
+
+try: import mmap
+except ImportError: mmap = None
+
+class MmapResource(object):
+    """
+"MmapResource" provides read-only access to a memory-mapped file. Data is
+read from the mapped memory without any further system call.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "file_size", "_handle", "_mmap", "_memoryview", "_position" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(MmapResource)
+
+:since: v1.1.0
+        """
+
+        self.file_size = 0
+        """
+Size of the memory-mapped file
+        """
+        self._handle = None
+        """
+Python file object of the memory-mapped file
+        """
+        self._mmap = None
+        """
+"mmap.mmap" instance
+        """
+        self._memoryview = None
+        """
+"memoryview" instance over the mapped memory
+        """
+        self._position = 0
+        """
+Current stream position
+        """
+    #
+
+    def __del__(self):
+        """
+Destructor __del__(MmapResource)
+
+:since: v1.1.0
+        """
+
+        self.close()
+    #
+
+    @property
+    def handle(self):
+        """
+Returns the Python file object of the memory-mapped file.
+
+:return: (object) Python file object
+:since:  v1.1.0
+        """
+
+        return self._handle
+    #
+
+    @property
+    def is_eof(self):
+        """
+Checks if the pointer is at EOF.
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        return (self._position >= self.file_size)
+    #
+
+    @property
+    def is_valid(self):
+        """
+Returns true if the file is memory-mapped.
+
+:return: (bool) True if memory-mapped
+:since:  v1.1.0
+        """
+
+        return (self._mmap is not None)
+    #
+
+    @property
+    def memoryview(self):
+        """
+Returns a read-only "memoryview" over the memory-mapped file.
+
+:return: (object) "memoryview" instance
+:since:  v1.1.0
+        """
+
+        if (self._mmap is None): raise IOException("File not memory-mapped")
+
+        if (self._memoryview is None):
+            try: self._memoryview = memoryview(self._mmap)
+            except TypeError: raise OperationNotSupportedException("memoryview is not supported for mmap objects")
+        #
+
+        return self._memoryview
+    #
+
+    def close(self):
+        """
+Closes the memory-mapped file. The mapped memory is freed by the garbage
+collector if "memoryview" slices are still referenced.
+
+:since: v1.1.0
+        """
+
+        if (self._memoryview is not None):
+            try: self._memoryview.release()
+            except BufferError: pass
+            finally: self._memoryview = None
+        #
+
+        if (self._mmap is not None):
+            try: self._mmap.close()
+            except BufferError: pass
+            finally: self._mmap = None
+        #
+
+        if (self._handle is not None):
+            try: self._handle.close()
+            finally: self._handle = None
+        #
+
+        self.file_size = 0
+        self._position = 0
+    #
+
+    def flush(self):
+        """
+python.org: Flush the write buffers of the stream if applicable.
+
+:since: v1.1.0
+        """
+
+        pass
+    #
+
+    def lock(self, lock_mode):
+        """
+Memory-mapped files can only be read.
+
+:param lock_mode: Lock mode requested
+
+:return: (bool) True if reading is requested
+:since:  v1.1.0
+        """
+
+        return (self._mmap is not None and lock_mode == "r")
+    #
+
+    def open(self, file_path_name):
+        """
+Maps the given file read-only into memory.
+
+:param file_path_name: File path and name
+
+:return: (bool) True on success; False for empty or unmappable files
+:since:  v1.1.0
+        """
+
+        # global: mmap
+
+        if (self._mmap is not None): raise IOException("Can't open memory-mapped file on already opened instance")
+
+        _return = False
+
+        if (mmap is not None and path.isfile(file_path_name)):
+            handle = open(file_path_name, "rb")
+
+            try:
+                file_size = os.fstat(handle.fileno()).st_size
+
+                if (file_size > 0):
+                    self._mmap = mmap.mmap(handle.fileno(), 0, access = mmap.ACCESS_READ)
+                    self._handle = handle
+
+                    self.file_size = len(self._mmap)
+                    self._position = 0
+
+                    _return = True
+                #
+            except (EnvironmentError, ValueError): pass
+            finally:
+                if (not _return): handle.close()
+            #
+        #
+
+        return _return
+    #
+
+    def read(self, n = 0, timeout = -1):
+        """
+python.org: Read up to n bytes from the object and return them.
+
+:param n: How many bytes to read from the current position (0 means until
+          EOF)
+:param timeout: Timeout to use (unused)
+
+:return: (bytes) Data; empty if EOF
+:since:  v1.1.0
+        """
+
+        if (self._mmap is None): raise IOException("File not memory-mapped")
+
+        position = self._position
+        end_position = (self.file_size if (n < 1) else min(position + n, self.file_size))
+
+        _return = self._mmap[position:end_position]
+        self._position = max(position, end_position)
+
+        return _return
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b,
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.1.0
+        """
+
+        if (self._mmap is None): raise IOException("File not memory-mapped")
+
+        target = (b if (isinstance(b, memoryview)) else memoryview(b))
+
+        position = self._position
+        _return = max(0, min(len(target), self.file_size - position))
+
+        if (_return > 0):
+            target[:_return] = self._mmap[position:position + _return]
+            self._position = position + _return
+        #
+
+        return _return
+    #
+
+    def seek(self, offset):
+        """
+python.org: Change the stream position to the given byte offset.
+
+:param offset: Seek to the given offset
+
+:return: (int) Return the new absolute position.
+:since:  v1.1.0
+        """
+
+        if (self._mmap is None): raise IOException("File not memory-mapped")
+        if (offset < 0): raise IOException("Negative seek position {0:d}".format(offset))
+
+        self._position = offset
+        return offset
+    #
+
+    def tell(self):
+        """
+python.org: Return the current stream position as an opaque number.
+
+:return: (int) Stream position
+:since:  v1.1.0
+        """
+
+        return self._position
+    #
+
+    def truncate(self, new_size = None):
+        """
+Memory-mapped files are read-only.
+
+:param new_size: Cut file at the given byte position
+
+:since: v1.1.0
+        """
+
+        raise IOException("Memory-mapped file is read-only")
+    #
+
+    def write(self, b, timeout = -1):
+        """
+Memory-mapped files are read-only.
+
+:param b: (Over)write file with b
+:param timeout: Timeout to use
+
+:since: v1.1.0
+        """
+
+        raise IOException("Memory-mapped file is read-only")
+    #
+
+    @staticmethod
+    def is_available():
+        """
+True if memory-mapped files are supported.
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        # global: mmap
+
+        return (mmap is not None)
+    #
+#
@@ -19,25 +19,50 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=import-error,invalid-name,no-member,no-name-in-module
 
+from operator import attrgetter
 from os import path
+import errno
+from stat import S_ISDIR
+from time import time
 import os
 
-try: from urllib.parse import quote_plus, unquote_plus
-except ImportError: from urllib import quote_plus, unquote_plus
+try: from concurrent.futures import ThreadPoolExecutor
+except ImportError: ThreadPoolExecutor = None
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
 
 from dpt_file import File
 from dpt_logging import LogLine
-from dpt_mime_type import MimeType
-from dpt_runtime.exceptions import IOException, OperationNotSupportedException
+from dpt_runtime import Settings
+from dpt_runtime.exceptions import IOException, OperationNotSupportedException, ValueException
 
 from ...abstract import Abstract
 from ...file_like_wrapper_mixin import FileLikeWrapperMixin
+from ...mimetype_table import MimetypeTable
+from ...stat_record import StatRecord
+from ...vfs_url import VfsUrl
+from .metadata_cache import MetadataCache
+from .mmap_resource import MmapResource
+from .scan_record import ScanRecord
+from .scan_table import ScanTable
+from .tree_walker import TreeWalker
 
 if (hasattr(os, "PathLike")): _PathLike = os.PathLike
 else:
     class _PathLike(object): pass
 #
 
+_copy_file_range = getattr(os, "copy_file_range", None)
+_scandir = getattr(os, "scandir", None)
+_sendfile = getattr(os, "sendfile", None)
+
+_KERNEL_COPY_UNSUPPORTED_ERRNOS = frozenset(getattr(errno, name)
+                                            for name in ( "EINVAL", "ENOSYS", "ENOTSUP", "EOPNOTSUPP", "EXDEV" )
+                                            if hasattr(errno, name)
+                                           )
+
+@FileLikeWrapperMixin.install_wrapped_attributes
 class Object(FileLikeWrapperMixin, _PathLike, Abstract):
     """
 Provides the VFS implementation for 'file' objects.
@@ -53,19 +78,39 @@ Provides the VFS implementation for 'file' objects.
 
     # pylint: disable=unused-argument
 
-    _FILE_WRAPPED_METHODS = ( "flush",
-                              "is_eof",
+    _FILE_WRAPPED_METHODS = ( "is_eof",
                               "read",
                               "seek",
-                              "tell",
-                              "truncate",
-                              "write"
+                              "tell"
                             )
     """
-File IO methods implemented by an wrapped resource.
+File IO methods implemented by an wrapped resource. Methods changing the
+file are implemented to discard cached metadata.
+    """
+
+    _SUPPORTED_FEATURES = { "filesystem_path_name": True,
+                            "flush": "_supports_flush",
+                            "implementing_instance": "_supports_implementing_instance",
+                            "memoryview": "_supports_memoryview",
+                            "readinto": "_supports_seek",
+                            "seek": "_supports_seek",
+                            "time_created": True,
+                            "time_updated": True
+                          }
+    """
+Features supported by all "file" VFS objects
     """
 
-    __slots__ = ( "dir_path_name", "file_path_name", "object_readonly" ) + FileLikeWrapperMixin._mixin_slots_
+    __slots__ = ( "dir_path_name",
+                  "_dir_entry",
+                  "file_path_name",
+                  "_is_accessible",
+                  "object_readonly",
+                  "stat_cache_ttl",
+                  "_stat_cache_timeout",
+                  "_stat_result",
+                  "use_mmap"
+                ) + FileLikeWrapperMixin._mixin_slots_
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
@@ -84,22 +129,40 @@ Constructor __init__(Object)
         self.dir_path_name = None
         """
 Directory path and name set for "TYPE_DIRECTORY"
+        """
+        self._dir_entry = None
+        """
+"os.DirEntry" instance this object has been opened from while scanning
         """
         self.file_path_name = None
         """
 File path and name set for "TYPE_FILE"
+        """
+        self._is_accessible = None
+        """
+Cached "os.access()" result
         """
         self.object_readonly = None
         """
 True to open the object and nested ones read-only
         """
-
-        self.supported_features['filesystem_path_name'] = True
-        self.supported_features['flush'] = self._supports_flush
-        self.supported_features['implementing_instance'] = self._supports_implementing_instance
-        self.supported_features['seek'] = self._supports_seek
-        self.supported_features['time_created'] = True
-        self.supported_features['time_updated'] = True
+        self.stat_cache_ttl = Settings.get("dpt_vfs_file_stat_cache_ttl")
+        """
+Seconds metadata read once is reused for; 0 to reuse it until "refresh()"
+is called and None to disable caching
+        """
+        self._stat_cache_timeout = None
+        """
+UNIX timestamp cached metadata expires at; 0 if it does not expire
+        """
+        self._stat_result = None
+        """
+Cached "os.stat()" result
+        """
+        self.use_mmap = Settings.get("dpt_vfs_file_mmap", False)
+        """
+True to memory-map files opened in readonly mode
+        """
     #
 
     def __fspath__(self):
@@ -176,12 +239,42 @@ Returns true if the object is available.
         _return = False
 
         if (self._wrapped_resource is not None): _return = self._wrapped_resource.is_valid
-        elif (self.dir_path_name is not None): _return = os.access(self.dir_path_name, os.X_OK)
-        elif (self.file_path_name is not None): _return = os.access(self.file_path_name, os.R_OK)
+        elif (self.dir_path_name is not None or self.file_path_name is not None):
+            access_mode = (os.R_OK if (self.dir_path_name is None) else os.X_OK)
+
+            if (self.stat_cache_ttl is None):
+                metadata = self._get_metadata()
+                _return = (os.access(self.filesystem_path_name, access_mode) if (metadata is None) else metadata['is_accessible'])
+            else:
+                if (self._is_stat_cache_expired()): self.refresh()
+
+                if (self._is_accessible is None):
+                    self._is_accessible = os.access(self.filesystem_path_name, access_mode)
+                    self._start_stat_cache()
+                #
+
+                _return = self._is_accessible
+            #
+        #
 
         return _return
     #
 
+    @property
+    def memoryview(self):
+        """
+Returns a read-only "memoryview" over the memory-mapped file.
+
+:return: (object) "memoryview" instance
+:since:  v1.1.0
+        """
+
+        _file = (None if (self.file_path_name is None) else self.implementing_instance)
+        if (not isinstance(_file, MmapResource)): raise OperationNotSupportedException()
+
+        return _file.memoryview
+    #
+
     @property
     def mimetype(self):
         """
@@ -195,10 +288,13 @@ Returns the mime type of this VFS object.
 
         if (self.dir_path_name is not None): _return = "text/directory"
         elif (self.file_path_name is not None):
-            file_data = path.splitext(self.file_path_name)
-            mimetype_definition = MimeType.get_instance().get(file_data[1][1:])
+            metadata = self._get_metadata()
+            if (metadata is not None): _return = metadata['mimetype']
 
-            _return = ("application/octet-stream" if (mimetype_definition is None) else mimetype_definition['type'])
+            if (_return is None):
+                _return = MimetypeTable.get(self.file_path_name)
+                if (metadata is not None): MetadataCache.set_mimetype(self.file_path_name, _return)
+            #
         else: raise IOException("VFS object not opened")
 
         return _return
@@ -234,7 +330,7 @@ Returns the size in bytes.
         _return = None
 
         if (self.dir_path_name is not None): _return = 0
-        elif (self.file_path_name is not None): _return = os.stat(self.file_path_name).st_size
+        elif (self.file_path_name is not None): _return = self._get_stat_result().st_size
         else: raise IOException("VFS object not opened")
 
         return _return
@@ -251,9 +347,8 @@ Returns the UNIX timestamp this object was created.
 
         _return = None
 
-        if (self.dir_path_name is not None): _return = os.stat(self.dir_path_name).st_ctime
-        elif (self.file_path_name is not None): _return = os.stat(self.file_path_name).st_ctime
-        else: raise IOException("VFS object not opened")
+        if (self.dir_path_name is None and self.file_path_name is None): raise IOException("VFS object not opened")
+        _return = self._get_stat_result().st_ctime
 
         return _return
     #
@@ -269,9 +364,8 @@ Returns the UNIX timestamp this object was updated.
 
         _return = None
 
-        if (self.dir_path_name is not None): _return = os.stat(self.dir_path_name).st_mtime
-        elif (self.file_path_name is not None): _return = os.stat(self.file_path_name).st_mtime
-        else: raise IOException("VFS object not opened")
+        if (self.dir_path_name is None and self.file_path_name is None): raise IOException("VFS object not opened")
+        _return = self._get_stat_result().st_mtime
 
         return _return
     #
@@ -320,6 +414,8 @@ python.org: Flush and close this stream.
 :since: v1.0.0
         """
 
+        self.refresh()
+
         if (self.dir_path_name is not None): self.dir_path_name = None
         else:
             try: FileLikeWrapperMixin.close(self)
@@ -327,6 +423,51 @@ python.org: Flush and close this stream.
         #
     #
 
+    def copy_to(self, target, timeout = None):
+        """
+Copies all data of this VFS object to the given target at its current
+position. Data is copied within the kernel if the target is a "file:///"
+VFS object.
+
+:param target: Target VFS object or any object providing a "write()" method
+:param timeout: Timeout for copying data
+
+:since: v1.1.0
+        """
+
+        # global: _sendfile
+
+        is_copied = False
+
+        if (_sendfile is not None
+            and self.file_path_name is not None
+            and isinstance(target, Object)
+            and target.file_path_name is not None
+           ):
+            target_file = target.implementing_instance
+
+            if (target_file is not None and target_file.lock("w")):
+                target_handle = target_file.handle
+                target_position = target_handle.tell()
+
+                target_handle.flush()
+                target_handle.seek(target_position)
+
+                size = self._send_to_fd_in_kernel(target_handle.fileno(), 0, None, timeout, target_position)
+
+                if (size is not None):
+                    target_position += size
+                    target_handle.seek(target_position)
+
+                    if (target_file.file_size < target_position): target_file.file_size = target_position
+                    is_copied = True
+                #
+            #
+        #
+
+        if (not is_copied): self.copy_data(target, timeout)
+    #
+
     def _ensure_directory_readable(self, vfs_url, dir_path_name):
         """
 Ensures that the given directory path readable.
@@ -353,6 +494,272 @@ Ensures that the given directory path writable.
         if (not os.access(dir_path_name, os.X_OK)): raise IOException("VFS URL '{0}' is invalid".format(vfs_url))
     #
 
+    def flush(self):
+        """
+python.org: Flush the write buffers of the stream if applicable.
+
+:since: v1.0.0
+        """
+
+        try: self._get_wrapped_resource_attribute("flush")()
+        finally: self.refresh()
+    #
+
+    def _get_metadata(self):
+        """
+Returns the process-wide cached metadata for this VFS object if the
+metadata cache is enabled.
+
+:return: (dict) Metadata dict; None if not available
+:since:  v1.1.0
+        """
+
+        return (MetadataCache.get_or_load(self.filesystem_path_name) if (MetadataCache.is_enabled()) else None)
+    #
+
+    def _get_stat_result(self):
+        """
+Returns the "os.stat()" result for the VFS object. Objects opened while
+scanning reuse the data cached by the "os.DirEntry" instance once; it is
+only kept afterwards if a stat cache TTL is set.
+
+:return: (object) "os.stat_result" instance
+:since:  v1.1.0
+        """
+
+        if (self._is_stat_cache_expired()): self.refresh()
+
+        _return = self._stat_result
+
+        if (_return is None):
+            if (self._dir_entry is None):
+                metadata = self._get_metadata()
+                if (metadata is not None): _return = metadata['stat_result']
+
+                if (_return is None): _return = os.stat(self.filesystem_path_name)
+                if (self.stat_cache_ttl is not None): self._set_stat_result(_return)
+            else:
+                _return = self._dir_entry.stat()
+                self._dir_entry = None
+
+                if (self.stat_cache_ttl is not None): self._set_stat_result(_return)
+            #
+        #
+
+        return _return
+    #
+
+    def _is_stat_cache_expired(self):
+        """
+Returns true if cached metadata has expired.
+
+:return: (bool) True if expired
+:since:  v1.1.0
+        """
+
+        return (self._stat_cache_timeout is not None
+                and self._stat_cache_timeout > 0
+                and time() > self._stat_cache_timeout
+               )
+    #
+
+    def iter_scan(self, sort = False, batch_size = None):
+        """
+Returns an iterator over objects of a collection like a directory. Child
+objects are yielded while the directory is read.
+
+:param sort: True to yield child objects sorted by name
+:param batch_size: Yield lists of up to the given number of child objects
+                   instead of single ones
+
+:return: (object) Child VFS object iterator
+:since:  v1.1.0
+        """
+
+        if (self.file_path_name is not None): raise OperationNotSupportedException("VFS object can not be scanned")
+        if (self.dir_path_name is None): raise IOException("VFS object not opened")
+
+        iterator = (self._iter_listdir(sort) if (_scandir is None) else self._iter_dir_entries(sort))
+        return Abstract._get_batched_iterator(iterator, batch_size)
+    #
+
+    def _iter_dir_entries(self, sort):
+        """
+Iterates over objects of a directory using "os.scandir()". Child objects
+are opened with the type information read from the directory.
+
+:param sort: True to yield child objects sorted by name
+
+:return: (object) Child VFS object iterator
+:since:  v1.1.0
+        """
+
+        # global: _scandir
+
+        dir_entries = _scandir(self.dir_path_name)
+        if (sort): dir_entries = sorted(dir_entries, key = attrgetter("name"))
+
+        try:
+            for dir_entry in dir_entries:
+                if (dir_entry.name[0] != "."):
+                    try: vfs_child_object = self._new_child_from_dir_entry(dir_entry)
+                    except (IOException, OSError) as handled_exception:
+                        LogLine.error(handled_exception, context = "dpt_vfs")
+                        continue
+                    #
+
+                    yield vfs_child_object
+                #
+            #
+        finally:
+            if (hasattr(dir_entries, "close")): dir_entries.close()
+        #
+    #
+
+    def _iter_dir_entry_records(self, with_stat):
+        """
+Iterates over records of a directory using "os.scandir()".
+
+:param with_stat: True to read the size and the UNIX timestamp of the last
+                  update of each entry
+
+:return: (object) ScanRecord iterator
+:since:  v1.1.0
+        """
+
+        # global: _scandir
+
+        dir_entries = _scandir(self.dir_path_name)
+
+        try:
+            for dir_entry in dir_entries:
+                name = dir_entry.name
+                if (name[0] == "."): continue
+
+                size = None
+                time_updated = None
+
+                try:
+                    is_directory = dir_entry.is_dir()
+
+                    if (with_stat):
+                        stat_result = dir_entry.stat()
+
+                        size = (0 if (is_directory) else stat_result.st_size)
+                        time_updated = stat_result.st_mtime
+                    #
+                except OSError as handled_exception:
+                    LogLine.error(handled_exception, context = "dpt_vfs")
+                    continue
+                #
+
+                yield ScanRecord(name,
+                                 dir_entry.path,
+                                 (Object.TYPE_DIRECTORY if (is_directory) else Object.TYPE_FILE),
+                                 size,
+                                 time_updated
+                                )
+            #
+        finally:
+            if (hasattr(dir_entries, "close")): dir_entries.close()
+        #
+    #
+
+    def _iter_listdir(self, sort):
+        """
+Iterates over objects of a directory using "os.listdir()".
+
+:param sort: True to yield child objects sorted by name
+
+:return: (object) Child VFS object iterator
+:since:  v1.1.0
+        """
+
+        entry_list = os.listdir(self.dir_path_name)
+        if (sort): entry_list.sort()
+
+        dir_path_url = self.url
+
+        for entry in entry_list:
+            if (entry[0] != "."):
+                vfs_child_object = self._new_child()
+
+                try: vfs_child_object.open("{0}/{1}".format(dir_path_url, entry), self.object_readonly)
+                except IOException as handled_exception:
+                    LogLine.error(handled_exception, context = "dpt_vfs")
+                    continue
+                #
+
+                yield vfs_child_object
+            #
+        #
+    #
+
+    def _iter_listdir_records(self):
+        """
+Iterates over records of a directory using "os.listdir()" and
+"os.stat()".
+
+:return: (object) ScanRecord iterator
+:since:  v1.1.0
+        """
+
+        for name in os.listdir(self.dir_path_name):
+            if (name[0] == "."): continue
+
+            entry_path_name = path.join(self.dir_path_name, name)
+
+            try: stat_result = os.stat(entry_path_name)
+            except OSError as handled_exception:
+                LogLine.error(handled_exception, context = "dpt_vfs")
+                continue
+            #
+
+            is_directory = S_ISDIR(stat_result.st_mode)
+
+            yield ScanRecord(name,
+                             entry_path_name,
+                             (Object.TYPE_DIRECTORY if (is_directory) else Object.TYPE_FILE),
+                             (0 if (is_directory) else stat_result.st_size),
+                             stat_result.st_mtime
+                            )
+        #
+    #
+
+    def _iter_walk(self, max_depth, filter_callback, descend_callback):
+        """
+Walks over all objects below this directory without worker threads.
+Symbolic links to directories are detected with "os.path.islink()" as
+they are not typed as links.
+
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+:param filter_callback: Callback returning true if the given child VFS
+                        object should be yielded
+:param descend_callback: Callback returning true if the given child
+                         directory VFS object should be descended into
+
+:return: (object) VFS object iterator
+:since:  v1.1.0
+        """
+
+        vfs_directories = [ ( self, 1 ) ]
+
+        while (len(vfs_directories) > 0):
+            vfs_directory, depth = vfs_directories.pop()
+
+            for vfs_child_object in vfs_directory.iter_scan(True):
+                if (vfs_child_object.is_directory
+                    and (not path.islink(vfs_child_object.dir_path_name))
+                    and (max_depth is None or depth < max_depth)
+                    and (descend_callback is None or descend_callback(vfs_child_object))
+                   ): vfs_directories.append(( vfs_child_object, 1 + depth ))
+
+                if (filter_callback is None or filter_callback(vfs_child_object)): yield vfs_child_object
+            #
+        #
+    #
+
     def new(self, _type, vfs_url):
         """
 Creates a new VFS object.
@@ -377,18 +784,20 @@ Creates a new VFS file object.
 :since: v1.0.0
         """
 
-        file_path_name = unquote_plus(Abstract._get_id_from_vfs_url(vfs_url))
+        file_path_name = VfsUrl.parse(vfs_url).path
         self._ensure_directory_writable(vfs_url, path.dirname(file_path_name))
 
         self._open_file(vfs_url, file_path_name)
     #
 
-    def open(self, vfs_url, readonly = False):
+    def open(self, vfs_url, readonly = False, use_mmap = None):
         """
 Opens a VFS object. The handle is set at the beginning of the object.
 
 :param vfs_url: VFS URL
 :param readonly: Open object in readonly mode
+:param use_mmap: True to memory-map the file if opened in readonly mode;
+                 None to use the default
 
 :since: v1.0.0
         """
@@ -397,23 +806,101 @@ Opens a VFS object. The handle is set at the beginning of the object.
             or self.file_path_name is not None
            ): raise IOException("Can't create new VFS object on already opened instance")
 
-        object_path_name = unquote_plus(Abstract._get_id_from_vfs_url(vfs_url))
+        if (use_mmap is not None): self.use_mmap = use_mmap
+
+        object_path_name = VfsUrl.parse(vfs_url).path
+        metadata = (MetadataCache.get_or_load(path.abspath(object_path_name)) if (MetadataCache.is_enabled()) else None)
 
-        if (path.isdir(object_path_name)): self._open_directory(vfs_url, object_path_name, readonly)
+        if (metadata is None):
+            try: stat_result = os.stat(object_path_name)
+            except OSError: stat_result = None
+
+            is_directory = (stat_result is not None and S_ISDIR(stat_result.st_mode))
+            is_readable = None
+        else:
+            is_directory = (metadata['type'] == Object.TYPE_DIRECTORY)
+            is_readable = metadata['is_accessible']
+            stat_result = metadata['stat_result']
+        #
+
+        if (is_directory): self._open_directory(vfs_url, object_path_name, readonly, is_readable)
         else: self._open_file(vfs_url, object_path_name, readonly)
+
+        if (stat_result is not None and self.stat_cache_ttl is not None): self._set_stat_result(stat_result)
+    #
+
+    def _open_dir_entry(self, dir_entry, readonly = False):
+        """
+Opens a VFS object based on the given "os.DirEntry" instance. The type
+information already read from the directory is used and no further
+filesystem lookup is done.
+
+:param dir_entry: "os.DirEntry" instance of an absolute directory path
+:param readonly: Open object in readonly mode
+
+:since: v1.1.0
+        """
+
+        if (self.dir_path_name is not None
+            or self.file_path_name is not None
+           ): raise IOException("Can't create new VFS object on already opened instance")
+
+        if (dir_entry.is_dir()): self.dir_path_name = dir_entry.path
+        else: self.file_path_name = dir_entry.path
+
+        self._dir_entry = dir_entry
+        self.object_readonly = readonly
+    #
+
+    def _new_child(self):
+        """
+Returns a new child VFS object not yet opened using the settings of this
+directory VFS object.
+
+:return: (object) Child VFS object
+:since:  v1.1.0
+        """
+
+        _return = self.__class__()
+        _return.stat_cache_ttl = self.stat_cache_ttl
+        _return.use_mmap = self.use_mmap
+
+        return _return
     #
 
-    def _open_directory(self, vfs_url, dir_path_name, readonly = False):
+    def _new_child_from_dir_entry(self, dir_entry):
+        """
+Returns a new child VFS object opened with the settings of this directory
+VFS object.
+
+:param dir_entry: "os.DirEntry" instance read from this directory
+
+:return: (object) Child VFS object
+:since:  v1.1.0
+        """
+
+        # pylint: disable=protected-access
+
+        _return = self._new_child()
+        _return._open_dir_entry(dir_entry, self.object_readonly)
+
+        return _return
+    #
+
+    def _open_directory(self, vfs_url, dir_path_name, readonly = False, is_readable = None):
         """
 Opens a VFS directory object.
 
 :param vfs_url: VFS URL
 :param dir_path_name: Directory path and name
+:param readonly: Open object in readonly mode
+:param is_readable: Known directory accessibility; None to check it
 
 :since: v1.0.0
         """
 
-        self._ensure_directory_readable(vfs_url, dir_path_name)
+        if (is_readable is None): self._ensure_directory_readable(vfs_url, dir_path_name)
+        elif (not is_readable): raise IOException("VFS URL '{0}' is invalid".format(vfs_url))
 
         self.dir_path_name = path.abspath(dir_path_name)
         self.object_readonly = readonly
@@ -443,10 +930,64 @@ Opens the wrapped resource once needed for an file IO request.
 
         if (self.file_path_name is None): raise IOException("VFS object not opened")
 
-        file_mode = ("rb" if (self.object_readonly) else "r+b")
+        if (self.object_readonly and self.use_mmap and MmapResource.is_available()):
+            mmap_resource = MmapResource()
+            if (mmap_resource.open(self.file_path_name)): self._set_wrapped_resource(mmap_resource)
+        #
+
+        if (self._wrapped_resource is None):
+            file_mode = ("rb" if (self.object_readonly) else "r+b")
+
+            _file = File()
+            if (_file.open(self.file_path_name, self.object_readonly, file_mode)): self._set_wrapped_resource(_file)
+        #
+    #
+
+    def readinto(self, b):
+        """
+python.org: Read bytes into a pre-allocated, writable bytes-like object b,
+and return the number of bytes read.
+
+:param b: Pre-allocated, writable bytes-like object
+
+:return: (int) Number of bytes read; 0 if EOF
+:since:  v1.1.0
+        """
+
+        if (self.file_path_name is None): raise OperationNotSupportedException()
+
+        _file = self.implementing_instance
+        if (_file is None or (not _file.lock("r"))): raise IOException("VFS object can not be read")
+
+        return (_file.readinto(b) if (isinstance(_file, MmapResource)) else _file.handle.readinto(b))
+    #
+
+    def refresh(self):
+        """
+Discards all cached metadata of this VFS object.
+
+:since: v1.1.0
+        """
+
+        self._dir_entry = None
+        self._is_accessible = None
+        self._stat_cache_timeout = None
+        self._stat_result = None
+    #
+
+    def _reset_state(self):
+        """
+Resets settings and feature overrides of this closed instance to the
+defaults of a new one.
+
+:since: v1.1.0
+        """
+
+        Abstract._reset_state(self)
+        self.refresh()
 
-        _file = File()
-        if (_file.open(self.file_path_name, self.object_readonly, file_mode)): self._set_wrapped_resource(_file)
+        self.stat_cache_ttl = Settings.get("dpt_vfs_file_stat_cache_ttl")
+        self.use_mmap = Settings.get("dpt_vfs_file_mmap", False)
     #
 
     def scan(self):
@@ -457,30 +998,234 @@ Scan over objects of a collection like a directory.
 :since:  v1.0.0
         """
 
+        return list(self.iter_scan(True))
+    #
+
+    def scan_records(self, sort = False, with_stat = True):
+        """
+Scan over entries of a directory returning compact, immutable records
+instead of VFS objects. Records are built from the data read by
+"os.scandir()".
+
+:param sort: True to sort records by name
+:param with_stat: True to read the size and the UNIX timestamp of the last
+                  update of each entry
+
+:return: (list) ScanRecord instances
+:since:  v1.1.0
+        """
+
+        # global: _scandir
+
         if (self.file_path_name is not None): raise OperationNotSupportedException("VFS object can not be scanned")
         if (self.dir_path_name is None): raise IOException("VFS object not opened")
 
-        _return = [ ]
+        iterator = (self._iter_listdir_records() if (_scandir is None) else self._iter_dir_entry_records(with_stat))
+        _return = list(iterator)
 
-        entry_list = os.listdir(self.dir_path_name)
-        entry_list.sort()
+        if (sort): _return.sort(key = attrgetter("name"))
 
-        dir_path_url = self.url
+        return _return
+    #
 
-        for entry in entry_list:
-            if (entry[0] != "."):
-                vfs_child_object = Object()
+    def scan_table(self):
+        """
+Scan over entries of a directory filling array-backed columns instead of
+creating VFS objects.
 
-                try:
-                    vfs_child_object.open("{0}/{1}".format(dir_path_url, entry), self.object_readonly)
-                    _return.append(vfs_child_object)
-                except IOException as handled_exception: LogLine.error(handled_exception, context = "dpt_vfs")
+:return: (object) ScanTable instance
+:since:  v1.1.0
+        """
+
+        if (self.file_path_name is not None): raise OperationNotSupportedException("VFS object can not be scanned")
+        if (self.dir_path_name is None): raise IOException("VFS object not opened")
+
+        return ScanTable().scan(self.dir_path_name)
+    #
+
+    def send_to_fd(self, fd, offset = 0, count = None, timeout = None):
+        """
+Sends data of this VFS object to the given blocking file descriptor. Data
+is sent within the kernel using "os.sendfile()" if supported.
+
+:param fd: Target file descriptor
+:param offset: Offset to start sending data from
+:param count: Number of bytes to send; None to send until EOF
+:param timeout: Timeout for sending data
+
+:return: (int) Number of bytes sent
+:since:  v1.1.0
+        """
+
+        # global: _sendfile
+
+        _return = (None
+                   if (_sendfile is None or self.file_path_name is None) else
+                   self._send_to_fd_in_kernel(fd, offset, count, timeout)
+                  )
+
+        if (_return is None): _return = Abstract.send_to_fd(self, fd, offset, count, timeout)
+        return _return
+    #
+
+    def _send_to_fd_in_kernel(self, fd, offset, count, timeout, fd_offset = None):
+        """
+Sends data of this VFS object to the given file descriptor within the
+kernel. "os.copy_file_range()" is used if the target file descriptor
+offset is given and "os.sendfile()" otherwise.
+
+:param fd: Target file descriptor
+:param offset: Offset to start sending data from
+:param count: Number of bytes to send; None to send until EOF
+:param timeout: Timeout for sending data
+:param fd_offset: Offset of the target file descriptor if it is a file
+
+:return: (int) Number of bytes sent; None if not supported for the file
+         descriptors given
+:since:  v1.1.0
+        """
+
+        # global: _copy_file_range, _KERNEL_COPY_UNSUPPORTED_ERRNOS, _sendfile
+
+        _file = self.implementing_instance
+        if (_file is None or (not _file.lock("r"))): raise IOException("VFS object can not be read")
+
+        file_fd = _file.handle.fileno()
+        if (count is None): count = max(0, os.fstat(file_fd).st_size - offset)
+
+        _return = 0
+
+        timeout_time = (0 if (timeout is None) else time() + timeout)
+        use_copy_file_range = (fd_offset is not None and _copy_file_range is not None)
+
+        while (_return is not None and _return < count):
+            if (timeout_time > 0 and time() >= timeout_time): raise IOException("Timeout occurred before EOF")
+
+            try:
+                size = (_copy_file_range(file_fd, fd, count - _return, offset + _return, fd_offset + _return)
+                        if (use_copy_file_range) else
+                        _sendfile(fd, file_fd, offset + _return, count - _return)
+                       )
+
+                if (size < 1): break
+                _return += size
+            except OSError as handled_exception:
+                if (_return > 0 or handled_exception.errno not in _KERNEL_COPY_UNSUPPORTED_ERRNOS): raise
+                elif (use_copy_file_range): use_copy_file_range = False
+                else: _return = None
             #
         #
 
         return _return
     #
 
+    def truncate(self, new_size = None):
+        """
+python.org: Resize the stream to the given size in bytes.
+
+:param new_size: Cut file at the given byte position
+
+:return: (int) New file size
+:since:  v1.0.0
+        """
+
+        try: _return = self._get_wrapped_resource_attribute("truncate")(new_size)
+        finally: self.refresh()
+
+        return _return
+    #
+
+    def walk(self, max_depth = None, filter_callback = None, descend_callback = None, max_workers = None, queue_size = 1024):
+        """
+Returns an iterator over all objects below a collection like a directory.
+Subdirectories are scanned concurrently by a pool of worker threads. Given
+callbacks are called from these threads. Symbolic links to directories are
+not descended into.
+
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+:param filter_callback: Callback returning true if the given child VFS
+                        object should be yielded
+:param descend_callback: Callback returning true if the given child
+                         directory VFS object should be descended into
+:param max_workers: Maximum number of worker threads
+:param queue_size: Maximum number of child VFS objects read ahead
+
+:return: (object) VFS object iterator
+:since:  v1.1.0
+        """
+
+        if (self.file_path_name is not None): raise OperationNotSupportedException("VFS object can not be scanned")
+        if (self.dir_path_name is None): raise IOException("VFS object not opened")
+
+        if (TreeWalker.is_available()):
+            tree_walker = TreeWalker(max_depth, filter_callback, descend_callback, max_workers, queue_size)
+            _return = tree_walker.walk(self)
+        else: _return = self._iter_walk(max_depth, filter_callback, descend_callback)
+
+        return _return
+    #
+
+    def walk_table(self, max_depth = None):
+        """
+Walks over all entries below a directory filling array-backed columns
+instead of creating VFS objects. Names are relative to this directory.
+Symbolic links to directories are not descended into.
+
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+
+:return: (object) ScanTable instance
+:since:  v1.1.0
+        """
+
+        if (self.file_path_name is not None): raise OperationNotSupportedException("VFS object can not be scanned")
+        if (self.dir_path_name is None): raise IOException("VFS object not opened")
+
+        return ScanTable().scan(self.dir_path_name, max_depth)
+    #
+
+    def write(self, b, timeout = -1):
+        """
+python.org: Write the given bytes or bytearray object, b, to the underlying
+raw stream and return the number of bytes written.
+
+:param b: (Over)write file with the given data at the current position
+:param timeout: Timeout to use (defaults to construction time value)
+
+:return: (int) Number of bytes written
+:since:  v1.0.0
+        """
+
+        try: _return = self._get_wrapped_resource_attribute("write")(b, timeout)
+        finally: self.refresh()
+
+        return _return
+    #
+
+    def _set_stat_result(self, stat_result):
+        """
+Caches the given "os.stat()" result.
+
+:param stat_result: "os.stat_result" instance
+
+:since: v1.1.0
+        """
+
+        self._stat_result = stat_result
+        self._start_stat_cache()
+    #
+
+    def _start_stat_cache(self):
+        """
+Sets the expiry time of cached metadata if not already done.
+
+:since: v1.1.0
+        """
+
+        if (self._stat_cache_timeout is None): self._stat_cache_timeout = (time() + self.stat_cache_ttl if (self.stat_cache_ttl) else 0)
+    #
+
     def _supports_flush(self):
         """
 Returns false if flushing buffers is not supported.
@@ -503,6 +1248,21 @@ Returns false if no underlying, implementing instance can be returned.
         return (self._wrapped_resource is not None)
     #
 
+    def _supports_memoryview(self):
+        """
+Returns false if the file is not memory-mapped.
+
+:return: (bool) True if "memoryview" is supported
+:since:  v1.1.0
+        """
+
+        return (self.file_path_name is not None
+                and self.object_readonly
+                and self.use_mmap
+                and isinstance(self.implementing_instance, MmapResource)
+               )
+    #
+
     def _supports_seek(self):
         """
 Returns false if seek is not supported.
@@ -513,4 +1273,76 @@ Returns false if seek is not supported.
 
         return (self.file_path_name is not None)
     #
+
+    @classmethod
+    def stat_many(cls, vfs_urls, max_workers = None):
+        """
+Returns the metadata of all given VFS URLs. "os.stat()" is called for
+chunks of VFS URLs in a bounded thread pool. Errors are reported for each
+VFS URL in the corresponding record.
+
+:param cls: Python class
+:param vfs_urls: Iterable of "file:///" VFS URLs
+:param max_workers: Maximum number of worker threads
+
+:return: (list) StatRecord instances in the order of the VFS URLs given
+:since:  v1.1.0
+        """
+
+        # global: ThreadPoolExecutor
+
+        if (max_workers is None): max_workers = Settings.get("dpt_vfs_file_stat_max_workers", 8)
+
+        vfs_urls = list(vfs_urls)
+        vfs_urls_count = len(vfs_urls)
+
+        if (ThreadPoolExecutor is None or max_workers < 2 or vfs_urls_count < 2): _return = Object._get_stat_records(vfs_urls)
+        else:
+            max_workers = min(max_workers, vfs_urls_count)
+
+            # Chunks keep the number of futures low for large batches
+            chunk_size = max(1, min(256, -(-vfs_urls_count // max_workers)))
+            chunks = [ vfs_urls[position:position + chunk_size] for position in range(0, vfs_urls_count, chunk_size) ]
+
+            _return = [ ]
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                for records in executor.map(Object._get_stat_records, chunks): _return += records
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_stat_records(vfs_urls):
+        """
+Returns the metadata of the given "file:///" VFS URLs.
+
+:param vfs_urls: List of "file:///" VFS URLs
+
+:return: (list) StatRecord instances in the order of the VFS URLs given
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        for vfs_url in vfs_urls:
+            try:
+                stat_result = os.stat(VfsUrl.parse(vfs_url).path)
+                is_directory = S_ISDIR(stat_result.st_mode)
+
+                _return.append(StatRecord(vfs_url,
+                                          (Object.TYPE_DIRECTORY if (is_directory) else Object.TYPE_FILE),
+                                          (0 if (is_directory) else stat_result.st_size),
+                                          stat_result.st_ctime,
+                                          stat_result.st_mtime,
+                                          None
+                                         )
+                              )
+            except (OSError, ValueException) as handled_exception: _return.append(StatRecord.from_error(vfs_url, handled_exception))
+        #
+
+        return _return
+    #
 #
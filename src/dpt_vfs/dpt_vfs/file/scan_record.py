@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import namedtuple
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+class ScanRecord(namedtuple("_ScanRecord", ( "name", "path", "type", "size", "time_updated" ))):
+    """
+"ScanRecord" is an immutable record of a directory entry read while
+scanning a "file:///" directory. "size" and "time_updated" are None if
+the directory has been scanned without reading metadata.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @property
+    def url(self):
+        """
+Returns the URL of this directory entry.
+
+:return: (str) VFS URL
+:since:  v1.1.0
+        """
+
+        return "file:///{0}".format(quote_plus(self.path, "/"))
+    #
+
+    def to_object(self, readonly = False):
+        """
+Returns a VFS object opened for this directory entry.
+
+:param readonly: Open object in readonly mode
+
+:return: (object) VFS object
+:since:  v1.1.0
+        """
+
+        from .object import Object
+
+        _return = Object()
+        _return.open(self.url, readonly)
+
+        return _return
+    #
+#
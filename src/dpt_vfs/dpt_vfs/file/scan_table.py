@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+from array import array
+import os
+
+try: import numpy
+except ImportError: numpy = None
+
+from dpt_logging import LogLine
+from dpt_runtime.exceptions import OperationNotSupportedException
+
+from ...abstract import Abstract
+
+_fsdecode = getattr(os, "fsdecode", None)
+_fsencode = getattr(os, "fsencode", None)
+_scandir = getattr(os, "scandir", None)
+
+try:
+    array("q")
+    _INT64_TYPECODE = "q"
+except ValueError: _INT64_TYPECODE = "l"
+
+try:
+    array("Q")
+    _UINT64_TYPECODE = "Q"
+except ValueError: _UINT64_TYPECODE = "L"
+
+class ScanTable(object):
+    """
+"ScanTable" stores metadata of directory entries in array-backed columns
+instead of one Python object per entry. Names are encoded into one buffer
+and referenced by offsets. Columns are handed over as NumPy arrays without
+copying if NumPy is installed. Tables handed over can not be appended to
+anymore because the arrays would reference released memory otherwise.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "inodes", "_is_frozen", "mtimes_ns", "name_offsets", "_names", "sizes", "types" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(ScanTable)
+
+:since: v1.1.0
+        """
+
+        self.inodes = array(_UINT64_TYPECODE)
+        """
+Inode number column
+        """
+        self._is_frozen = False
+        """
+True if columns have been handed over as NumPy arrays sharing their memory
+        """
+        self.mtimes_ns = array(_INT64_TYPECODE)
+        """
+Time of the last update in nanoseconds column
+        """
+        self.name_offsets = array(_INT64_TYPECODE, [ 0 ])
+        """
+Offsets of the encoded names in the name buffer. The name of entry "n" is
+stored between the offsets "n" and "n + 1".
+        """
+        self._names = bytearray()
+        """
+Buffer of encoded names
+        """
+        self.sizes = array(_INT64_TYPECODE)
+        """
+Size column
+        """
+        self.types = array("B")
+        """
+VFS object type column
+        """
+    #
+
+    def __len__(self):
+        """
+python.org: Called to implement the built-in function len().
+
+:return: (int) Number of entries
+:since:  v1.1.0
+        """
+
+        return len(self.sizes)
+    #
+
+    @property
+    def columns(self):
+        """
+Returns the columns of this table.
+
+:return: (dict) Column name and "array.array" instance
+:since:  v1.1.0
+        """
+
+        return { "inodes": self.inodes,
+                 "mtimes_ns": self.mtimes_ns,
+                 "name_offsets": self.name_offsets,
+                 "sizes": self.sizes,
+                 "types": self.types
+               }
+    #
+
+    @property
+    def is_frozen(self):
+        """
+Returns true if columns have been handed over as NumPy arrays and the table
+can not be appended to anymore.
+
+:return: (bool) True if frozen
+:since:  v1.1.0
+        """
+
+        return self._is_frozen
+    #
+
+    @property
+    def names(self):
+        """
+Returns the names of all entries.
+
+:return: (list) Entry names
+:since:  v1.1.0
+        """
+
+        return [ self.get_name(position) for position in range(len(self)) ]
+    #
+
+    @property
+    def names_buffer(self):
+        """
+Returns the buffer of encoded names referenced by "name_offsets".
+
+:return: (bytes) Encoded names
+:since:  v1.1.0
+        """
+
+        return bytes(self._names)
+    #
+
+    def append(self, name, _type, size, mtime_ns, inode):
+        """
+Appends an entry to this table.
+
+:param name: Entry name
+:param _type: VFS object type
+:param size: Size
+:param mtime_ns: Time of the last update in nanoseconds
+:param inode: Inode number
+
+:since: v1.1.0
+        """
+
+        # global: _fsencode
+
+        if (self._is_frozen): raise OperationNotSupportedException("ScanTable columns have been handed over as NumPy arrays")
+
+        self._names.extend(name if (_fsencode is None) else _fsencode(name))
+        self.name_offsets.append(len(self._names))
+
+        self.inodes.append(inode)
+        self.mtimes_ns.append(mtime_ns)
+        self.sizes.append(size)
+        self.types.append(_type)
+    #
+
+    def _append_dir_entry(self, dir_entry, name):
+        """
+Appends an entry read by "os.scandir()".
+
+:param dir_entry: "os.DirEntry" instance
+:param name: Entry name
+
+:return: (bool) True if the entry is a directory to be descended into
+:since:  v1.1.0
+        """
+
+        stat_result = dir_entry.stat()
+        is_directory = dir_entry.is_dir()
+
+        self.append(name,
+                    (Abstract.TYPE_DIRECTORY if (is_directory) else Abstract.TYPE_FILE),
+                    (0 if (is_directory) else stat_result.st_size),
+                    ScanTable._get_mtime_ns(stat_result),
+                    dir_entry.inode()
+                   )
+
+        return (is_directory and (not dir_entry.is_symlink()))
+    #
+
+    def _append_path(self, entry_path_name, name):
+        """
+Appends an entry read by "os.stat()".
+
+:param entry_path_name: Entry path and name
+:param name: Entry name
+
+:return: (bool) True if the entry is a directory to be descended into
+:since:  v1.1.0
+        """
+
+        stat_result = os.stat(entry_path_name)
+        is_directory = os.path.isdir(entry_path_name)
+
+        self.append(name,
+                    (Abstract.TYPE_DIRECTORY if (is_directory) else Abstract.TYPE_FILE),
+                    (0 if (is_directory) else stat_result.st_size),
+                    ScanTable._get_mtime_ns(stat_result),
+                    stat_result.st_ino
+                   )
+
+        return (is_directory and (not os.path.islink(entry_path_name)))
+    #
+
+    def get_name(self, position):
+        """
+Returns the name of the entry at the given position.
+
+:param position: Entry position
+
+:return: (str) Entry name
+:since:  v1.1.0
+        """
+
+        # global: _fsdecode
+
+        _return = bytes(self._names[self.name_offsets[position]:self.name_offsets[1 + position]])
+        if (_fsdecode is not None): _return = _fsdecode(_return)
+
+        return _return
+    #
+
+    def scan(self, dir_path_name, max_depth = 1):
+        """
+Appends all entries below the given directory. Names of entries in
+subdirectories are relative to the given directory. Symbolic links to
+directories are not descended into.
+
+:param dir_path_name: Directory path and name
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+
+:return: (object) This table
+:since:  v1.1.0
+        """
+
+        # global: _scandir
+
+        pending_directories = [ ( dir_path_name, "", 1 ) ]
+
+        while (len(pending_directories) > 0):
+            current_path_name, name_prefix, depth = pending_directories.pop()
+            is_descending = (max_depth is None or depth < max_depth)
+
+            try:
+                if (_scandir is None):
+                    entries = [ ( os.path.join(current_path_name, name), name ) for name in os.listdir(current_path_name) ]
+                else: entries = _scandir(current_path_name)
+
+                try:
+                    for entry in entries:
+                        if (_scandir is None): entry_path_name, name = entry
+                        else: entry_path_name, name = entry.path, entry.name
+
+                        if (name[0] == "."): continue
+                        name = name_prefix + name
+
+                        try: is_directory = (self._append_path(entry_path_name, name) if (_scandir is None) else self._append_dir_entry(entry, name))
+                        except OSError as handled_exception:
+                            LogLine.error(handled_exception, context = "dpt_vfs")
+                            continue
+                        #
+
+                        if (is_directory and is_descending): pending_directories.append(( entry_path_name, name + os.sep, 1 + depth ))
+                    #
+                finally:
+                    if (hasattr(entries, "close")): entries.close()
+                #
+            except OSError as handled_exception: LogLine.error(handled_exception, context = "dpt_vfs")
+        #
+
+        return self
+    #
+
+    def to_numpy(self):
+        """
+Returns the columns of this table as NumPy arrays sharing the memory of the
+underlying "array.array" instances. The table is frozen afterwards.
+
+:return: (dict) Column name and NumPy array
+:since:  v1.1.0
+        """
+
+        # global: numpy
+
+        if (numpy is None): raise OperationNotSupportedException("NumPy is not available")
+
+        self._is_frozen = True
+
+        return dict(( column_name, numpy.frombuffer(column, dtype = column.typecode) )
+                    for column_name, column in self.columns.items()
+                   )
+    #
+
+    @staticmethod
+    def _get_mtime_ns(stat_result):
+        """
+Returns the time of the last update in nanoseconds of the given stat
+result.
+
+:param stat_result: "os.stat_result" instance
+
+:return: (int) Time of the last update in nanoseconds
+:since:  v1.1.0
+        """
+
+        _return = getattr(stat_result, "st_mtime_ns", None)
+        if (_return is None): _return = int(stat_result.st_mtime * 1000000000)
+
+        return _return
+    #
+
+    @staticmethod
+    def is_numpy_available():
+        """
+Returns true if columns can be handed over as NumPy arrays.
+
+:return: (bool) True if available
+:since:  v1.1.0
+        """
+
+        # global: numpy
+
+        return (numpy is not None)
+    #
+#
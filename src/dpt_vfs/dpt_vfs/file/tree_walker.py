@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error
+
+import os
+
+try: from concurrent.futures import ThreadPoolExecutor
+except ImportError: ThreadPoolExecutor = None
+
+try: from queue import Full, Queue
+except ImportError: from Queue import Full, Queue
+
+from dpt_logging import LogLine
+from dpt_runtime.exceptions import IOException
+from dpt_threading import ThreadLock
+
+_scandir = getattr(os, "scandir", None)
+
+class TreeWalker(object):
+    """
+"TreeWalker" scans a "file:///" directory tree with a pool of worker
+threads. Subdirectories are scanned concurrently while child VFS objects
+are passed to the consumer through a bounded queue.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _DONE = object()
+    """
+Queue item signaling that all directories have been scanned
+    """
+
+    __slots__ = ( "descend_callback",
+                  "_executor",
+                  "filter_callback",
+                  "_lock",
+                  "max_depth",
+                  "_pending_directories",
+                  "_queue",
+                  "_stopped",
+                  "_vfs_object"
+                )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_depth = None, filter_callback = None, descend_callback = None, max_workers = None, queue_size = 1024):
+        """
+Constructor __init__(TreeWalker)
+
+:param max_depth: Maximum depth to descend to (1 for direct children
+                  only); None for no limit
+:param filter_callback: Callback returning true if the given child VFS
+                        object should be yielded
+:param descend_callback: Callback returning true if the given child
+                         directory VFS object should be descended into
+:param max_workers: Maximum number of worker threads
+:param queue_size: Maximum number of child VFS objects read ahead
+
+:since: v1.1.0
+        """
+
+        # global: ThreadPoolExecutor
+
+        self.descend_callback = descend_callback
+        """
+Callback returning true if a directory should be descended into
+        """
+        self._executor = ThreadPoolExecutor(max_workers)
+        """
+Thread pool executor
+        """
+        self.filter_callback = filter_callback
+        """
+Callback returning true if a child VFS object should be yielded
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self.max_depth = max_depth
+        """
+Maximum depth to descend to
+        """
+        self._pending_directories = 0
+        """
+Number of directories scheduled but not yet scanned completely
+        """
+        self._queue = Queue(queue_size)
+        """
+Bounded queue of child VFS objects
+        """
+        self._stopped = False
+        """
+True if the consumer stopped iterating
+        """
+        self._vfs_object = None
+        """
+Directory VFS object walked
+        """
+    #
+
+    def _put(self, item):
+        """
+Puts the given item into the bounded queue. Blocks until space is available
+or the consumer stopped iterating.
+
+:param item: Queue item
+
+:return: (bool) True if the item has been queued
+:since:  v1.1.0
+        """
+
+        _return = False
+
+        while ((not _return) and (not self._stopped)):
+            try:
+                self._queue.put(item, timeout = 0.5)
+                _return = True
+            except Full: pass
+        #
+
+        return _return
+    #
+
+    def _scan(self, dir_path_name, depth):
+        """
+Scans the given directory and schedules subdirectories to be scanned.
+
+:param dir_path_name: Directory path and name
+:param depth: Depth of the children of the directory
+
+:since: v1.1.0
+        """
+
+        # global: _scandir
+        # pylint: disable=broad-except,protected-access
+
+        try:
+            dir_entries = _scandir(dir_path_name)
+
+            try:
+                for dir_entry in dir_entries:
+                    if (self._stopped): break
+                    if (dir_entry.name[0] == "."): continue
+
+                    # Entries failing to be read are skipped without aborting the directory
+                    try:
+                        vfs_child_object = self._vfs_object._new_child_from_dir_entry(dir_entry)
+                        is_directory = (vfs_child_object.is_directory and (not dir_entry.is_symlink()))
+                    except (IOException, OSError) as handled_exception:
+                        LogLine.error(handled_exception, context = "dpt_vfs")
+                        continue
+                    #
+
+                    if (is_directory
+                        and (self.max_depth is None or depth < self.max_depth)
+                        and (self.descend_callback is None or self.descend_callback(vfs_child_object))
+                       ): self._schedule(dir_entry.path, 1 + depth)
+
+                    if (self.filter_callback is None or self.filter_callback(vfs_child_object)): self._put(vfs_child_object)
+                #
+            finally:
+                if (hasattr(dir_entries, "close")): dir_entries.close()
+            #
+        # Errors reading the directory itself skip it
+        except (IOException, OSError) as handled_exception: LogLine.error(handled_exception, context = "dpt_vfs")
+        except Exception as handled_exception: self._put(handled_exception)
+        finally:
+            with self._lock:
+                self._pending_directories -= 1
+                is_done = (self._pending_directories < 1)
+            #
+
+            if (is_done): self._put(TreeWalker._DONE)
+        #
+    #
+
+    def _schedule(self, dir_path_name, depth):
+        """
+Schedules the given directory to be scanned.
+
+:param dir_path_name: Directory path and name
+:param depth: Depth of the children of the directory
+
+:since: v1.1.0
+        """
+
+        with self._lock: self._pending_directories += 1
+        self._executor.submit(self._scan, dir_path_name, depth)
+    #
+
+    def walk(self, vfs_object):
+        """
+Returns an iterator over all objects below the given directory VFS object.
+
+:param vfs_object: Opened directory VFS object
+
+:return: (object) VFS object iterator
+:since:  v1.1.0
+        """
+
+        self._vfs_object = vfs_object
+        self._schedule(vfs_object.filesystem_path_name, 1)
+
+        try:
+            while True:
+                item = self._queue.get()
+
+                if (item is TreeWalker._DONE): break
+                if (isinstance(item, Exception)): raise item
+
+                yield item
+            #
+        finally:
+            self._stopped = True
+            self._executor.shutdown(False)
+        #
+    #
+
+    @staticmethod
+    def is_available():
+        """
+Returns true if concurrent tree walks are supported by the Python runtime.
+
+:return: (bool) True if available
+:since:  v1.1.0
+        """
+
+        # global: _scandir, ThreadPoolExecutor
+
+        return (_scandir is not None and ThreadPoolExecutor is not None)
+    #
+#
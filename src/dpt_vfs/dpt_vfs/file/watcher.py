@@ -19,16 +19,13 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=import-error,invalid-name,no-name-in-module
 
-try: from urllib.parse import unquote_plus, urlsplit
-except ImportError:
-    from urllib import unquote_plus
-    from urlparse import urlsplit
-#
-
 from dpt_logging import LogLine
+from dpt_runtime import Binary, Settings
+from dpt_runtime.exceptions import ValueException
 from dpt_threading import InstanceLock
 
 from ...abstract_watcher import AbstractWatcher
+from ...vfs_url import VfsUrl
 from .watcher_mtime import WatcherMtime
 
 _IMPLEMENTATION_INOTIFY = 1
@@ -43,6 +40,10 @@ _IMPLEMENTATION_MTIME = 3
 """
 Filesystem mtime implementation
 """
+_IMPLEMENTATION_INOTIFY_NATIVE = 4
+"""
+Native inotify implementation
+"""
 
 try:
     from .watcher_pyinotify import WatcherPyinotify
@@ -53,6 +54,8 @@ except ImportError:
     WatcherPyinotify = None
 #
 
+from .watcher_inotify import WatcherInotify
+
 class Watcher(AbstractWatcher):
     """
 "file:///" watcher for change events.
@@ -69,6 +72,10 @@ class Watcher(AbstractWatcher):
     IMPLEMENTATION_INOTIFY = _IMPLEMENTATION_INOTIFY
     """
 pyinotify implementation
+    """
+    IMPLEMENTATION_INOTIFY_NATIVE = _IMPLEMENTATION_INOTIFY_NATIVE
+    """
+Native inotify implementation
     """
     IMPLEMENTATION_INOTIFY_SYNC = _IMPLEMENTATION_INOTIFY_SYNC
     """
@@ -133,7 +140,13 @@ called.
 :since:  v1.0.0
         """
 
-        with Watcher._lock: return (WatcherPyinotify is None or (not isinstance(Watcher._instance, WatcherPyinotify)))
+        with Watcher._lock:
+            return (not ((WatcherPyinotify is not None and isinstance(Watcher._instance, WatcherPyinotify))
+                         or isinstance(Watcher._instance, WatcherInotify)
+                         or (isinstance(Watcher._instance, WatcherMtime) and Watcher._instance.is_polling)
+                        )
+                   )
+        #
     #
 
     def check(self, url):
@@ -190,11 +203,15 @@ if a callback is given but not defined for the watched URL.
         #
     #
 
-    def register(self, url, callback):
+    def register(self, url, callback, recursive = False):
         """
-Handles registration of resource URL watches and its callbacks.
+Handles registration of resource URL watches and its callbacks. Recursive
+watches are supported by the inotify based implementations.
 
 :param url: Resource URL to be watched
+:param callback: Callback for the path
+:param recursive: True to watch the directory and all subdirectories
+                  (v1.1.0)
 
 :return: (bool) True on success
 :since:  v1.0.0
@@ -205,21 +222,27 @@ Handles registration of resource URL watches and its callbacks.
         with Watcher._lock:
             return (False
                     if (Watcher._instance is None or _path is None or _path.strip() == "") else
-                    Watcher._instance.register(_path, callback)
+                    Watcher._instance.register(_path, callback, recursive)
                    )
         #
     #
 
     def set_implementation(self, implementation = None):
         """
-Set the filesystem watcher implementation to use.
+Set the filesystem watcher implementation to use. The native inotify
+implementation is used by default if the setting
+"dpt_vfs_file_watcher_inotify_native" is true.
 
 :param implementation: Implementation identifier
 
 :since: v1.0.0
         """
 
-        # global: _IMPLEMENTATION_INOTIFY, _IMPLEMENTATION_INOTIFY_SYNC, _IMPLEMENTATION_MTIME, _mode
+        # global: _IMPLEMENTATION_INOTIFY, _IMPLEMENTATION_INOTIFY_NATIVE, _IMPLEMENTATION_INOTIFY_SYNC, _IMPLEMENTATION_MTIME, _mode
+
+        if (implementation is None
+            and Settings.get("dpt_vfs_file_watcher_inotify_native", False)
+           ): implementation = _IMPLEMENTATION_INOTIFY_NATIVE
 
         with Watcher._lock:
             if (Watcher._instance is not None): Watcher._instance.stop()
@@ -230,6 +253,9 @@ Set the filesystem watcher implementation to use.
             elif (_mode == _IMPLEMENTATION_INOTIFY
                 and implementation == _IMPLEMENTATION_INOTIFY_SYNC
                 ): Watcher._implementation = _IMPLEMENTATION_INOTIFY_SYNC
+            elif (implementation == _IMPLEMENTATION_INOTIFY_NATIVE
+                  and WatcherInotify.is_available()
+                 ): Watcher._implementation = _IMPLEMENTATION_INOTIFY_NATIVE
             else: Watcher._implementation = _IMPLEMENTATION_MTIME
 
             Watcher._init_watcher()
@@ -297,8 +323,10 @@ Return the local filesystem path for the given "file:///" URL.
 :since:  v1.0.0
         """
 
-        url_elements = urlsplit(url)
-        return (unquote_plus(url_elements.path[1:]) if (url_elements.scheme == "file") else None)
+        try: vfs_url = VfsUrl.parse(Binary.str(url))
+        except ValueException: vfs_url = None
+
+        return (vfs_url.path if (vfs_url is not None and vfs_url.scheme == "file") else None)
     #
 
     @staticmethod
@@ -311,7 +339,8 @@ Initializes the watcher instance.
 
         instance_callable = WatcherMtime
 
-        if (WatcherPyinotify is not None):
+        if (Watcher._implementation == _IMPLEMENTATION_INOTIFY_NATIVE): instance_callable = WatcherInotify.get_singleton
+        elif (WatcherPyinotify is not None):
             if (Watcher._implementation == _IMPLEMENTATION_INOTIFY): instance_callable = WatcherPyinotify.get_singleton
             elif (Watcher._implementation == _IMPLEMENTATION_INOTIFY_SYNC): instance_callable = WatcherPyinotifySync.get_singleton
         #
@@ -321,5 +350,9 @@ Initializes the watcher instance.
             if (instance_callable is WatcherMtime): raise
             Watcher._instance = WatcherMtime()
         #
+
+        if (isinstance(Watcher._instance, WatcherMtime)
+            and Settings.get("dpt_vfs_file_watcher_mtime_polling", False)
+           ): Watcher._instance.start_polling()
     #
 #
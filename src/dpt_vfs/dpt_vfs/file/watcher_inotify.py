@@ -0,0 +1,999 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+from ctypes.util import find_library
+from os import path
+from struct import Struct
+from time import time
+from weakref import ref
+import ctypes
+import errno
+import os
+import select
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+try: import selectors
+except ImportError: selectors = None
+
+from dpt_logging import ExceptionLogTrap, LogLine
+from dpt_runtime import Binary
+from dpt_threading import InstanceLock, ThreadLock
+from dpt_threading.encapsulated import Thread
+
+from ...abstract_watcher import AbstractWatcher
+from .watcher_path_index import WatcherPathIndex
+
+IN_ATTRIB = 0x00000004
+"""
+Metadata changed
+"""
+IN_CLOSE_WRITE = 0x00000008
+"""
+Writable file was closed
+"""
+IN_MOVED_FROM = 0x00000040
+"""
+File was moved from the watched directory
+"""
+IN_MOVED_TO = 0x00000080
+"""
+File was moved to the watched directory
+"""
+IN_CREATE = 0x00000100
+"""
+File or directory was created
+"""
+IN_DELETE = 0x00000200
+"""
+File or directory was deleted
+"""
+IN_DELETE_SELF = 0x00000400
+"""
+Watched directory was deleted
+"""
+IN_MOVE_SELF = 0x00000800
+"""
+Watched directory was moved
+"""
+IN_Q_OVERFLOW = 0x00004000
+"""
+Event queue overflowed
+"""
+IN_IGNORED = 0x00008000
+"""
+Watch was removed
+"""
+IN_ONLYDIR = 0x01000000
+"""
+Only watch the path if it is a directory
+"""
+IN_DONT_FOLLOW = 0x02000000
+"""
+Don't follow a symbolic link
+"""
+IN_ISDIR = 0x40000000
+"""
+Event subject is a directory
+"""
+IN_CLOEXEC = 0o2000000
+"""
+"inotify_init1()" flag to close the file descriptor on exec
+"""
+IN_NONBLOCK = 0o4000
+"""
+"inotify_init1()" flag for non-blocking reads
+"""
+
+_EVENT_STRUCT = Struct("iIII")
+"""
+"struct inotify_event" header without the variable-length name
+"""
+
+_scandir = getattr(os, "scandir", None)
+"""
+"os.scandir()" if available
+"""
+
+try:
+    _libc = ctypes.CDLL((find_library("c") or "libc.so.6"), use_errno = True)
+
+    _inotify_add_watch = _libc.inotify_add_watch
+    _inotify_add_watch.argtypes = [ ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32 ]
+    _inotify_add_watch.restype = ctypes.c_int
+
+    _inotify_init1 = _libc.inotify_init1
+    _inotify_init1.argtypes = [ ctypes.c_int ]
+    _inotify_init1.restype = ctypes.c_int
+
+    _inotify_rm_watch = _libc.inotify_rm_watch
+    _inotify_rm_watch.argtypes = [ ctypes.c_int, ctypes.c_int ]
+    _inotify_rm_watch.restype = ctypes.c_int
+except (AttributeError, OSError): _libc = None
+
+class WatcherInotify(object):
+    """
+"file:///" watcher using the Linux inotify API directly. Events are read
+by a thread waiting on a selector if threaded. Otherwise "fileno()" can be
+registered in a "selectors" or asyncio event loop calling
+"process_events()" if readable.
+
+Directories registered recursively are watched including all of their
+subdirectories. Directories created or moved into the tree are watched
+automatically. Each watch descriptor of a recursive tree is indexed by its
+parent watch descriptor and name only.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    RECURSIVE_MOVE_TIMEOUT = 1.0
+    """
+Seconds a recursively watched subdirectory moved away is kept watched
+while waiting for the related "IN_MOVED_TO" event
+    """
+    WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_MOVED_FROM | IN_MOVED_TO)
+    """
+inotify events watched for each directory
+    """
+
+    __slots__ = ( "__weakref__",
+                  "_fd",
+                  "_lock",
+                  "_path_index",
+                  "_read_size",
+                  "_recursive_callbacks",
+                  "_recursive_children",
+                  "_recursive_moves",
+                  "_recursive_roots",
+                  "_recursive_wds",
+                  "_thread",
+                  "_wakeup_fds"
+                )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _instance_lock = InstanceLock()
+    """
+Thread safety instance lock
+    """
+    _weakref_instance = None
+    """
+WatcherInotify weakref instance
+    """
+
+    def __init__(self, threaded = True):
+        """
+Constructor __init__(WatcherInotify)
+
+:param threaded: True to read events in a dedicated thread
+
+:since: v1.1.0
+        """
+
+        # global: _inotify_init1, _libc
+
+        self._fd = (-1 if (_libc is None) else _inotify_init1(IN_CLOEXEC | IN_NONBLOCK))
+        """
+inotify file descriptor
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._path_index = WatcherPathIndex()
+        """
+Callbacks and watch descriptors of watched paths
+        """
+        self._read_size = 65536
+        """
+Bytes read from the inotify file descriptor at once
+        """
+        self._recursive_callbacks = { }
+        """
+Callbacks for recursively watched directories
+        """
+        self._recursive_children = { }
+        """
+Watch descriptors of recursively watched subdirectories for each tuple of
+the parent watch descriptor and name
+        """
+        self._recursive_moves = { }
+        """
+Tuple of the watch descriptor of a recursively watched subdirectory moved
+away and the UNIX timestamp of the move for each inotify cookie
+        """
+        self._recursive_roots = { }
+        """
+Watch descriptors for each recursively watched directory
+        """
+        self._recursive_wds = { }
+        """
+Tuple of the parent watch descriptor (None for recursively watched
+directories) and the name (or path) for each recursive watch descriptor
+        """
+        self._thread = None
+        """
+Thread reading events
+        """
+        self._wakeup_fds = None
+        """
+Pipe file descriptors used to wake up the thread reading events
+        """
+
+        if (_libc is None): raise OSError(errno.ENOSYS, "inotify is not supported")
+
+        if (self._fd < 0):
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number))
+        #
+
+        if (threaded): self._init_thread()
+    #
+
+    def __del__(self):
+        """
+Destructor __del__(WatcherInotify)
+
+:since: v1.1.0
+        """
+
+        self.stop()
+    #
+
+    def _add_recursive_watches(self, parent_wd, name, directory_path):
+        """
+Adds watches for the given directory and all of its subdirectories. The
+lock must be held by the caller.
+
+:param parent_wd: Parent watch descriptor; None for a recursively watched
+                  directory
+:param name: Directory name (or path if "parent_wd" is None)
+:param directory_path: Directory path
+
+:return: (int) Watch descriptor of the given directory; None on error
+:since:  v1.1.0
+        """
+
+        # global: _inotify_add_watch, _scandir
+
+        _return = None
+
+        directories = [ ( parent_wd, name, directory_path ) ]
+        mask = (self.__class__.WATCH_MASK | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+        while (len(directories) > 0):
+            parent_wd, name, directory_path = directories.pop()
+            wd = _inotify_add_watch(self._fd, Binary.utf8_bytes(directory_path), mask)
+
+            if (wd < 0):
+                if (parent_wd is None): break
+
+                LogLine.warning("{0!r} failed to watch '{1}': {2}", self, directory_path, os.strerror(ctypes.get_errno()), context = "dpt_vfs")
+                continue
+            #
+
+            # Directories already watched recursively are not indexed twice
+            if (wd in self._recursive_wds and self._recursive_wds[wd] != ( parent_wd, name )): continue
+
+            if (parent_wd is None): _return = wd
+            else: self._recursive_children[( parent_wd, name )] = wd
+
+            self._recursive_wds[wd] = ( parent_wd, name )
+
+            try:
+                if (_scandir is None):
+                    for entry_name in os.listdir(directory_path):
+                        entry_path = path.join(directory_path, entry_name)
+
+                        if (path.isdir(entry_path) and (not path.islink(entry_path))):
+                            directories.append(( wd, entry_name, entry_path ))
+                        #
+                    #
+                else:
+                    for dir_entry in _scandir(directory_path):
+                        if (dir_entry.is_dir(follow_symlinks = False)):
+                            directories.append(( wd, dir_entry.name, dir_entry.path ))
+                        #
+                    #
+                #
+            except OSError: pass
+        #
+
+        return _return
+    #
+
+    def check(self, _path):
+        """
+Checks a given path for changes if "is_synchronous()" is true.
+
+:param _path: Filesystem path
+
+:return: (bool) True if the given path URL has been changed since last check
+         and "is_synchronous()" is true.
+:since:  v1.1.0
+        """
+
+        _return = False
+        if (self._thread is None and self._fd >= 0): _return = (self.process_events() > 0)
+
+        return _return
+    #
+
+    def _expire_recursive_moves(self, timestamp = None):
+        """
+Removes watches of recursively watched subdirectories moved away if the
+related "IN_MOVED_TO" event has not been received in time. These
+subdirectories have been moved out of the tree.
+
+:param timestamp: UNIX timestamp; None for the current time
+
+:since: v1.1.0
+        """
+
+        if (timestamp is None): timestamp = time()
+        timeout = self.__class__.RECURSIVE_MOVE_TIMEOUT
+
+        with self._lock:
+            for cookie, ( moved_wd, moved_timestamp ) in list(self._recursive_moves.items()):
+                if (timestamp - moved_timestamp >= timeout):
+                    del(self._recursive_moves[cookie])
+                    self._remove_recursive_watches(moved_wd)
+                #
+            #
+        #
+    #
+
+    def fileno(self):
+        """
+Returns the inotify file descriptor for registration in a selector.
+
+:return: (int) File descriptor
+:since:  v1.1.0
+        """
+
+        return self._fd
+    #
+
+    def free(self):
+        """
+Frees all watcher callbacks for garbage collection.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            if (len(self._path_index.watched_paths) > 0 or len(self._recursive_wds) > 0):
+                for wd in set(self._path_index.clear()).union(self._recursive_wds): _inotify_rm_watch(self._fd, wd)
+
+                self._recursive_callbacks = { }
+                self._recursive_children = { }
+                self._recursive_moves = { }
+                self._recursive_roots = { }
+                self._recursive_wds = { }
+            #
+        #
+    #
+
+    def get_callbacks(self, _path):
+        """
+Returns all registered callbacks for the given path.
+
+:param _path: Filesystem path
+
+:return: (list) List of watcher callbacks
+:since:  v1.1.0
+        """
+
+        return self._path_index.get_callbacks(_path)
+    #
+
+    def _get_recursive_path(self, wd):
+        """
+Returns the recursively watched directory and path of the given watch
+descriptor. The lock must be held by the caller.
+
+:param wd: Recursive watch descriptor
+
+:return: (tuple) Recursively watched directory and path; None if unknown
+:since:  v1.1.0
+        """
+
+        _return = None
+        names = [ ]
+
+        while (wd in self._recursive_wds):
+            parent_wd, name = self._recursive_wds[wd]
+
+            if (parent_wd is None):
+                names.append(name)
+                names.reverse()
+
+                _return = ( name, path.join(*names) )
+                break
+            #
+
+            names.append(name)
+            wd = parent_wd
+        #
+
+        return _return
+    #
+
+    def _init_thread(self):
+        """
+Initializes the thread reading events.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            if (self._thread is None):
+                LogLine.debug("{0!r} mode is asynchronous", self, context = "dpt_vfs")
+
+                self._wakeup_fds = os.pipe()
+
+                self._thread = Thread(target = self._run, args = ( self._wakeup_fds[0], ))
+                self._thread.daemon = True
+                self._thread.start()
+            #
+        #
+    #
+
+    def is_watched(self, _path, callback = None):
+        """
+Returns true if the filesystem path is already watched. It will return false
+if a callback is given but not defined for the watched path.
+
+:param _path: Filesystem path
+:param callback: Callback to be checked for the watched filesystem path
+
+:return: (bool) True if watched with the defined callback or any if not
+         defined.
+:since:  v1.1.0
+        """
+
+        _return = self._path_index.is_watched(_path, callback)
+
+        with self._lock:
+            if ((not _return) and _path in self._recursive_callbacks):
+                _return = (True if (callback is None) else (callback in self._recursive_callbacks[_path]))
+            #
+        #
+
+        return _return
+    #
+
+    def _process_callbacks(self, event_type, _path, changed_value = None):
+        """
+Calls all callbacks registered for the given event.
+
+:param event_type: Event type defined in AbstractWatcher
+:param _path: Filesystem path
+:param changed_value: Changed value (e.g. name of deleted or created file)
+
+:since: v1.1.0
+        """
+
+        changed_path = (_path if (changed_value is None) else path.join(_path, changed_value))
+
+        if (self.is_watched(changed_path)):
+            callbacks = self.get_callbacks(changed_path)
+            url = "file:///{0}".format(quote_plus(_path, "/"))
+
+            for callback in callbacks:
+                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url, changed_value)
+            #
+        #
+    #
+
+    def _process_event(self, wd, mask, cookie, name):
+        """
+Handles a single inotify event.
+
+:param wd: inotify watch descriptor
+:param mask: inotify event mask
+:param cookie: inotify cookie relating move events
+:param name: Name of the changed directory entry; None for the directory
+             itself
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            directory_path = self._path_index.get_directory_path(wd)
+            is_recursive = (wd in self._recursive_wds)
+        #
+
+        if (is_recursive): self._process_recursive_event(wd, mask, cookie, name)
+
+        if (mask & IN_Q_OVERFLOW):
+            LogLine.warning("{0!r} event queue overflowed", self, context = "dpt_vfs")
+            self.resync()
+        elif (directory_path is not None):
+            if (mask & IN_IGNORED):
+                with self._lock:
+                    if (self._path_index.get_directory_path(wd) == directory_path): self._path_index.discard_wd(wd)
+                #
+            elif (mask & (IN_DELETE_SELF | IN_MOVE_SELF)):
+                self.unregister(directory_path, None, True)
+                self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, directory_path)
+            elif (mask & (IN_CREATE | IN_MOVED_TO)):
+                self._process_callbacks(AbstractWatcher.EVENT_TYPE_CREATED, directory_path, name)
+            elif (mask & (IN_DELETE | IN_MOVED_FROM)):
+                self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, directory_path, name)
+            elif (mask & (IN_ATTRIB | IN_CLOSE_WRITE)):
+                self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED,
+                                        (directory_path if (name is None) else path.join(directory_path, name))
+                                       )
+            #
+        #
+    #
+
+    def process_events(self):
+        """
+Reads and handles all inotify events available without blocking.
+
+:return: (int) Number of events handled
+:since:  v1.1.0
+        """
+
+        # global: _EVENT_STRUCT
+
+        _return = 0
+
+        event_header_size = _EVENT_STRUCT.size
+        unpack_from = _EVENT_STRUCT.unpack_from
+
+        while True:
+            try: data = os.read(self._fd, self._read_size)
+            except OSError as handled_exception:
+                if (handled_exception.errno in ( errno.EAGAIN, errno.EWOULDBLOCK, errno.EBADF )): break
+                if (handled_exception.errno != errno.EINVAL): raise
+
+                # The buffer is too small for the next event
+                self._read_size *= 2
+                continue
+            #
+
+            data_size = len(data)
+            if (data_size < 1): break
+
+            events = [ ]
+            offset = 0
+
+            while (offset < data_size):
+                wd, mask, cookie, name_size = unpack_from(data, offset)
+                offset += event_header_size
+
+                name = (Binary.str(data[offset:offset + name_size].rstrip(b"\0")) if (name_size > 0) else None)
+                offset += name_size
+
+                events.append(( wd, mask, cookie, name ))
+            #
+
+            for event in events: self._process_event(*event)
+            _return += len(events)
+
+            self._expire_recursive_moves()
+        #
+
+        return _return
+    #
+
+    def _process_recursive_event(self, wd, mask, cookie, name):
+        """
+Handles a single inotify event of a recursively watched directory.
+
+:param wd: inotify watch descriptor
+:param mask: inotify event mask
+:param cookie: inotify cookie relating move events
+:param name: Name of the changed directory entry; None for the directory
+             itself
+
+:since: v1.1.0
+        """
+
+        callbacks = None
+        event_type = None
+
+        with self._lock:
+            recursive_path = self._get_recursive_path(wd)
+
+            if (recursive_path is not None):
+                root_path, directory_path = recursive_path
+                is_root = (self._recursive_wds[wd][0] is None)
+
+                if (mask & (IN_DELETE_SELF | IN_IGNORED | IN_MOVE_SELF)):
+                    # Deleted subdirectories are handled by the parent event
+                    if (is_root):
+                        if (not mask & IN_IGNORED): event_type = AbstractWatcher.EVENT_TYPE_DELETED
+                        callbacks = self._recursive_callbacks.pop(root_path, [ ])
+
+                        del(self._recursive_roots[root_path])
+                        self._remove_recursive_watches(wd, True)
+                    elif (mask & IN_IGNORED): self._remove_recursive_watches(wd, True)
+                elif (mask & (IN_CREATE | IN_MOVED_TO)):
+                    event_type = AbstractWatcher.EVENT_TYPE_CREATED
+
+                    if (mask & IN_ISDIR):
+                        child_wd = self._recursive_moves.pop(cookie, ( None, None ))[0]
+
+                        if (child_wd is None or child_wd not in self._recursive_wds):
+                            self._add_recursive_watches(wd, name, path.join(directory_path, name))
+                        else:
+                            # Directory moved within recursively watched directories
+                            self._recursive_children.pop(self._recursive_wds[child_wd], None)
+                            self._recursive_wds[child_wd] = ( wd, name )
+                            self._recursive_children[( wd, name )] = child_wd
+                        #
+                    #
+                elif (mask & (IN_DELETE | IN_MOVED_FROM)):
+                    event_type = AbstractWatcher.EVENT_TYPE_DELETED
+                    child_wd = (self._recursive_children.get(( wd, name )) if (mask & IN_ISDIR) else None)
+
+                    if (child_wd is not None):
+                        if (mask & IN_MOVED_FROM): self._recursive_moves[cookie] = ( child_wd, time() )
+                        else: self._remove_recursive_watches(child_wd, True)
+                    #
+                elif (mask & (IN_ATTRIB | IN_CLOSE_WRITE)):
+                    event_type = AbstractWatcher.EVENT_TYPE_MODIFIED
+
+                    if (name is not None):
+                        directory_path = path.join(directory_path, name)
+                        name = None
+                    #
+                #
+
+                if (callbacks is None and event_type is not None): callbacks = list(self._recursive_callbacks.get(root_path, [ ]))
+            #
+        #
+
+        if (event_type is not None):
+            url = "file:///{0}".format(quote_plus(directory_path, "/"))
+
+            for callback in callbacks:
+                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url, name)
+            #
+        #
+    #
+
+    def register(self, _path, callback, recursive = False):
+        """
+Handles registration of filesystem watches and its callbacks.
+
+:param _path: Filesystem path to be watched
+:param callback: Callback for the path
+:param recursive: True to watch the directory and all subdirectories
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        # global: _inotify_add_watch
+
+        _return = True
+
+        if (recursive): _return = self._register_recursive(_path, callback)
+        else:
+            if (path.isdir(_path)): directory_path = _path
+            else: directory_path = path.split(_path)[0]
+
+            with self._lock:
+                wd = self._path_index.get_wd(directory_path)
+                if (wd is None): wd = _inotify_add_watch(self._fd, Binary.utf8_bytes(directory_path), self.__class__.WATCH_MASK)
+
+                if (wd < 0): _return = False
+                else: self._path_index.add(_path, directory_path, wd, callback)
+            #
+        #
+
+        return _return
+    #
+
+    def _register_recursive(self, _path, callback):
+        """
+Handles registration of recursive directory watches and its callbacks.
+
+:param _path: Directory path to be watched
+:param callback: Callback for the directory
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        _return = True
+        is_directory = path.isdir(_path)
+
+        with self._lock:
+            if (_path not in self._recursive_roots):
+                wd = (self._add_recursive_watches(None, _path, _path) if (is_directory) else None)
+
+                if (wd is None): _return = False
+                else:
+                    self._recursive_callbacks[_path] = [ ]
+                    self._recursive_roots[_path] = wd
+                #
+            #
+
+            if (_return and callback not in self._recursive_callbacks[_path]): self._recursive_callbacks[_path].append(callback)
+        #
+
+        return _return
+    #
+
+    def _remove_recursive_watches(self, wd, _deleted = False):
+        """
+Removes the watch descriptor given and all of its recursively watched
+subdirectories. The lock must be held by the caller.
+
+:param wd: Recursive watch descriptor
+:param _deleted: Directory has been deleted
+
+:since: v1.1.0
+        """
+
+        # global: _inotify_rm_watch
+
+        children = { }
+
+        for ( parent_wd, _ ), child_wd in self._recursive_children.items():
+            if (parent_wd in children): children[parent_wd].append(child_wd)
+            else: children[parent_wd] = [ child_wd ]
+        #
+
+        wds = [ wd ]
+
+        while (len(wds) > 0):
+            wd = wds.pop()
+            if (wd not in self._recursive_wds): continue
+
+            parent_wd, name = self._recursive_wds.pop(wd)
+            if (self._recursive_children.get(( parent_wd, name )) == wd): del(self._recursive_children[( parent_wd, name )])
+
+            # Watch descriptors are shared with non-recursive watches of the same directory
+            if ((not _deleted) and self._path_index.get_directory_path(wd) is None): _inotify_rm_watch(self._fd, wd)
+
+            wds.extend(children.get(wd, [ ]))
+        #
+    #
+
+    def resync(self):
+        """
+Reports all watched paths as modified (or deleted if they do not exist
+anymore). It is called if events have been lost. Deleted entries are
+reported with the URL of their directory and their name as for live
+events.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            watched_paths = [ ( _path, (_path in self._path_index.watched_paths) ) for _path in self._path_index.watched_callbacks ]
+            watched_recursive_callbacks = [ ( _path, list(callbacks) ) for _path, callbacks in self._recursive_callbacks.items() ]
+        #
+
+        for _path, is_directory in watched_paths:
+            if (path.exists(_path)): self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED, _path)
+            elif (is_directory): self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, _path)
+            else:
+                directory_path, name = path.split(_path)
+                self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, directory_path, name)
+            #
+        #
+
+        for _path, callbacks in watched_recursive_callbacks:
+            event_type = (AbstractWatcher.EVENT_TYPE_MODIFIED if (path.exists(_path)) else AbstractWatcher.EVENT_TYPE_DELETED)
+            url = "file:///{0}".format(quote_plus(_path, "/"))
+
+            for callback in callbacks:
+                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url, None)
+            #
+        #
+    #
+
+    def _run(self, wakeup_fd):
+        """
+Waits for inotify events until woken up by "stop()".
+
+:param wakeup_fd: Pipe file descriptor written to if stopped
+
+:since: v1.1.0
+        """
+
+        # global: selectors
+
+        inotify_fd = self._fd
+        selector = None
+
+        try:
+            if (selectors is not None):
+                selector = selectors.DefaultSelector()
+                selector.register(inotify_fd, selectors.EVENT_READ)
+                selector.register(wakeup_fd, selectors.EVENT_READ)
+            #
+
+            is_running = True
+
+            while (is_running):
+                with ExceptionLogTrap("dpt_vfs"):
+                    if (selector is None): readable_fds = select.select([ inotify_fd, wakeup_fd ], [ ], [ ])[0]
+                    else: readable_fds = [ key.fd for key, _ in selector.select() ]
+
+                    if (wakeup_fd in readable_fds): is_running = False
+                    elif (inotify_fd in readable_fds): self.process_events()
+                #
+            #
+        finally:
+            if (selector is not None): selector.close()
+            os.close(wakeup_fd)
+        #
+    #
+
+    def stop(self):
+        """
+Stops all watchers.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            if (self._fd >= 0): self.free()
+
+            thread = self._thread
+            wakeup_fds = self._wakeup_fds
+
+            self._thread = None
+            self._wakeup_fds = None
+        #
+
+        if (thread is not None):
+            # The thread may have stopped already and closed the read end
+            try: os.write(wakeup_fds[1], b"\0")
+            except OSError: pass
+            finally: os.close(wakeup_fds[1])
+
+            thread.join()
+        #
+
+        with self._lock:
+            if (self._fd >= 0):
+                os.close(self._fd)
+                self._fd = -1
+            #
+        #
+    #
+
+    def unregister(self, _path, callback, _deleted = False):
+        """
+Handles deregistration of filesystem watches.
+
+:param _path: Filesystem path watched
+:param callback: Callback for the path
+:param _deleted: File has been deleted
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        # global: _inotify_rm_watch
+
+        _return = self._unregister_recursive(_path, callback, _deleted)
+
+        with self._lock:
+            unused_wds = self._path_index.remove(_path, callback, _deleted)
+
+            if (unused_wds is not None):
+                # Watch descriptors are shared with recursive watches of the same directory
+                if (not _deleted):
+                    for wd in unused_wds:
+                        if (wd not in self._recursive_wds): _inotify_rm_watch(self._fd, wd)
+                    #
+                #
+
+                _return = True
+            #
+        #
+
+        return _return
+    #
+
+    def _unregister_recursive(self, _path, callback, _deleted = False):
+        """
+Handles deregistration of recursive directory watches.
+
+:param _path: Directory path watched
+:param callback: Callback for the directory
+:param _deleted: Directory has been deleted
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        _return = False
+
+        with self._lock:
+            if (_path in self._recursive_callbacks):
+                callbacks = self._recursive_callbacks[_path]
+
+                if (callback is None or _deleted): del(callbacks[:])
+                elif (callback in callbacks): callbacks.remove(callback)
+
+                if (len(callbacks) < 1):
+                    del(self._recursive_callbacks[_path])
+                    self._remove_recursive_watches(self._recursive_roots.pop(_path), _deleted)
+                #
+
+                _return = True
+            #
+        #
+
+        return _return
+    #
+
+    @classmethod
+    def get_singleton(cls):
+        """
+Get the WatcherInotify singleton.
+
+:param cls: Python class
+
+:return: (object) Object on success
+:since:  v1.1.0
+        """
+
+        # pylint: disable=not-callable
+
+        _return = None
+
+        with WatcherInotify._instance_lock:
+            if (WatcherInotify._weakref_instance is not None): _return = WatcherInotify._weakref_instance()
+
+            if (_return is None or _return.fileno() < 0):
+                _return = cls()
+                WatcherInotify._weakref_instance = ref(_return)
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def is_available():
+        """
+True if inotify is supported by the C library.
+
+:return: (bool) True if supported
+:since:  v1.1.0
+        """
+
+        # global: _libc
+
+        return (_libc is not None)
+    #
+#
@@ -19,19 +19,38 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 # pylint: disable=import-error,no-name-in-module
 
+from itertools import repeat
+from os import path
+from threading import Event
 import os
 
+try: from concurrent.futures import ThreadPoolExecutor
+except ImportError: ThreadPoolExecutor = None
+
 try: from urllib.parse import quote_plus
 except ImportError: from urllib import quote_plus
 
-from dpt_logging import ExceptionLogTrap
+from dpt_logging import ExceptionLogTrap, LogLine
+from dpt_runtime import Settings
+from dpt_runtime.exceptions import OperationNotSupportedException
 from dpt_threading import ThreadLock
+from dpt_threading.encapsulated import Thread
 
 from ...abstract_watcher import AbstractWatcher
 
+_scandir = getattr(os, "scandir", None)
+"""
+"os.scandir()" if available
+"""
+
 class WatcherMtime(object):
     """
-"file:///" watcher using os.stat to detect changes.
+"file:///" watcher using os.stat to detect changes. Watched paths are
+either checked on request or swept periodically in the background.
+
+Background sweeps may stat the parent directories first and only re-stat
+watched files of directories changed. In-place changes of file contents do
+not change the directory and are only detected by periodic full sweeps.
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -46,20 +65,120 @@ class WatcherMtime(object):
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _directory_snapshots = { }
+    """
+Dict with latest "(st_mtime_ns, st_nlink, st_ino)" snapshots of parent
+directories swept
     """
     _lock = ThreadLock()
     """
 Thread safety lock
+    """
+    _poll_directories = False
+    """
+True to stat parent directories first while sweeping
+    """
+    _poll_event = None
+    """
+Event set to stop background polling
+    """
+    _poll_full_sweep_interval = None
+    """
+Number of sweeps after which all watched paths are checked even if their
+parent directory is unchanged
+    """
+    _poll_interval = None
+    """
+Current seconds between two background sweeps
+    """
+    _poll_interval_max = None
+    """
+Maximum seconds between two background sweeps
+    """
+    _poll_interval_min = None
+    """
+Minimum seconds between two background sweeps
+    """
+    _poll_max_workers = None
+    """
+Number of threads sweeping watched paths in parallel
+    """
+    _poll_thread = None
+    """
+Thread sweeping watched paths in the background
     """
     _watched_callbacks = { }
     """
 Callbacks for watched files
+    """
+    _watched_directories = set()
+    """
+Watched paths being directories at registration time
     """
     _watched_paths = { }
     """
-Dict with latest modified timestamps
+Dict with latest "(st_mtime_ns, st_size, st_ino)" snapshots; None if a
+path does not exist
     """
 
+    @property
+    def is_polling(self):
+        """
+Returns true if watched paths are swept in the background.
+
+:return: (bool) True if polling
+:since:  v1.1.0
+        """
+
+        return (WatcherMtime._poll_thread is not None)
+    #
+
+    def _apply_snapshots(self, snapshots):
+        """
+Compares and stores the given snapshots of watched paths.
+
+:param snapshots: List of tuples of the path, the snapshot read before and
+                  the current one
+
+:return: (list) List of tuples of the event type, the path and its
+         callbacks
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        with WatcherMtime._lock:
+            if (WatcherMtime._watched_paths is not None):
+                for _path, previous_snapshot, snapshot in snapshots:
+                    # Skip paths unregistered or changed by another thread in the meantime
+                    if (_path not in WatcherMtime._watched_paths
+                        or WatcherMtime._watched_paths[_path] != previous_snapshot
+                       ): continue
+
+                    callbacks = WatcherMtime._watched_callbacks[_path][:]
+
+                    if (snapshot is None):
+                        _return.append(( AbstractWatcher.EVENT_TYPE_DELETED, _path, callbacks ))
+                        self.unregister(_path, None)
+                    else:
+                        _return.append(( (AbstractWatcher.EVENT_TYPE_CREATED
+                                          if (previous_snapshot is None) else
+                                          AbstractWatcher.EVENT_TYPE_MODIFIED
+                                         ),
+                                         _path,
+                                         callbacks
+                                       ))
+
+                        WatcherMtime._watched_paths[_path] = snapshot
+                    #
+                #
+            #
+        #
+
+        return _return
+    #
+
     def check(self, _path):
         """
 Checks a given path for changes if "is_synchronous()" is true.
@@ -71,41 +190,21 @@ Checks a given path for changes if "is_synchronous()" is true.
 :since:  v1.0.0
         """
 
-        _return = False
-
-        event_type = None
-
         with WatcherMtime._lock:
-            if (WatcherMtime._watched_paths is not None
-                and _path in WatcherMtime._watched_paths
-               ):
-                modified_time = (os.stat(_path).st_mtime if (os.access(_path, os.R_OK)) else -1)
-
-                if (modified_time < 0):
-                    event_type = AbstractWatcher.EVENT_TYPE_DELETED
-                    self.unregister(_path, None)
-                elif (WatcherMtime._watched_paths[_path] != modified_time):
-                    event_type = (AbstractWatcher.EVENT_TYPE_CREATED
-                                  if (WatcherMtime._watched_paths[_path] < 0) else
-                                  AbstractWatcher.EVENT_TYPE_MODIFIED
-                                 )
-
-                    WatcherMtime._watched_paths[_path] = modified_time
-                #
-            #
+            is_watched = (WatcherMtime._watched_paths is not None and _path in WatcherMtime._watched_paths)
+            previous_snapshot = (WatcherMtime._watched_paths[_path] if (is_watched) else None)
         #
 
-        if (event_type is not None):
-            _return = True
-
-            url = "file:///{0}".format(quote_plus(_path, "/"))
+        events = [ ]
 
-            for callback in WatcherMtime._watched_callbacks[_path]:
-                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url)
-            #
+        if (is_watched):
+            snapshot = WatcherMtime._get_snapshot(_path)
+            if (snapshot != previous_snapshot): events = self._apply_snapshots([ ( _path, previous_snapshot, snapshot ) ])
         #
 
-        return _return
+        WatcherMtime._dispatch(events)
+
+        return (len(events) > 0)
     #
 
     def free(self):
@@ -116,9 +215,11 @@ Frees all watcher callbacks for garbage collection.
         """
 
         with WatcherMtime._lock:
-            if (WatcherMtime._watched_paths is not None and len(WatcherMtime._watched_paths) > 0):
-                WatcherMtime._watched_callbacks = None
-                WatcherMtime._watched_paths = None
+            if (WatcherMtime._watched_paths is None or len(WatcherMtime._watched_paths) > 0):
+                WatcherMtime._directory_snapshots = { }
+                WatcherMtime._watched_callbacks = { }
+                WatcherMtime._watched_directories = set()
+                WatcherMtime._watched_paths = { }
             #
         #
     #
@@ -144,24 +245,35 @@ if a callback is given but not defined for the watched path.
         return _return
     #
 
-    def register(self, _path, callback):
+    def register(self, _path, callback, recursive = False):
         """
 Handles registration of filesystem watches and its callbacks.
 
 :param _path: Filesystem path to be watched
 :param callback: Callback for the path
+:param recursive: True to watch the directory and all subdirectories
+                  (v1.1.0; not supported)
 
 :return: (bool) True on success
 :since:  v1.0.0
         """
 
+        if (recursive): raise OperationNotSupportedException("Recursive watches are not supported by the mtime watcher")
+
         _return = True
 
+        with WatcherMtime._lock: is_watched = (WatcherMtime._watched_paths is not None and _path in WatcherMtime._watched_paths)
+
+        snapshot = (None if (is_watched) else WatcherMtime._get_snapshot(_path))
+        is_directory = (snapshot is not None and path.isdir(_path))
+
         with WatcherMtime._lock:
             if (WatcherMtime._watched_callbacks is not None):
                 if (_path not in WatcherMtime._watched_paths):
-                    WatcherMtime._watched_paths[_path] = (os.stat(_path).st_mtime if (os.access(_path, os.R_OK)) else -1)
+                    WatcherMtime._watched_paths[_path] = snapshot
                     WatcherMtime._watched_callbacks[_path] = [ ]
+
+                    if (is_directory): WatcherMtime._watched_directories.add(_path)
                 #
 
                 if (callback not in WatcherMtime._watched_callbacks[_path]): WatcherMtime._watched_callbacks[_path].append(callback)
@@ -171,6 +283,90 @@ Handles registration of filesystem watches and its callbacks.
         return _return
     #
 
+    def _run_polling(self, poll_event):
+        """
+Sweeps all watched paths until the given event is set. The interval is
+halved after changes have been detected and increased otherwise.
+
+:param poll_event: Event set to stop polling
+
+:since: v1.1.0
+        """
+
+        # global: ThreadPoolExecutor
+
+        max_workers = WatcherMtime._poll_max_workers
+        executor = (None if (max_workers < 2 or ThreadPoolExecutor is None) else ThreadPoolExecutor(max_workers))
+
+        sweeps = 0
+
+        try:
+            while (not poll_event.wait(WatcherMtime._poll_interval)):
+                with ExceptionLogTrap("dpt_vfs"):
+                    is_full_sweep = ((not WatcherMtime._poll_directories)
+                                     or sweeps % WatcherMtime._poll_full_sweep_interval == 0
+                                    )
+
+                    sweeps += 1
+
+                    events = (self._sweep(executor, max_workers)
+                              if (is_full_sweep) else
+                              self._sweep_directories(executor, max_workers)
+                             )
+                    WatcherMtime._dispatch(events)
+
+                    WatcherMtime._poll_interval = (max(WatcherMtime._poll_interval_min, WatcherMtime._poll_interval / 2.0)
+                                                   if (len(events) > 0) else
+                                                   min(WatcherMtime._poll_interval_max, WatcherMtime._poll_interval * 1.5)
+                                                  )
+                #
+            #
+        finally:
+            if (executor is not None): executor.shutdown(False)
+        #
+    #
+
+    def start_polling(self, interval_min = None, interval_max = None, max_workers = None, use_directories = None, full_sweep_interval = None):
+        """
+Starts sweeping all watched paths in the background.
+
+:param interval_min: Minimum seconds between two sweeps
+:param interval_max: Maximum seconds between two sweeps
+:param max_workers: Number of threads sweeping watched paths in parallel
+:param use_directories: True to stat parent directories first and re-stat
+                        watched files of changed directories only
+:param full_sweep_interval: Number of sweeps after which all watched paths
+                            are checked if "use_directories" is true
+
+:since: v1.1.0
+        """
+
+        if (interval_min is None): interval_min = Settings.get("dpt_vfs_file_watcher_mtime_poll_interval_min", 1.0)
+        if (interval_max is None): interval_max = Settings.get("dpt_vfs_file_watcher_mtime_poll_interval_max", 30.0)
+        if (max_workers is None): max_workers = Settings.get("dpt_vfs_file_watcher_mtime_poll_max_workers", 4)
+        if (use_directories is None): use_directories = Settings.get("dpt_vfs_file_watcher_mtime_poll_directories", False)
+        if (full_sweep_interval is None): full_sweep_interval = Settings.get("dpt_vfs_file_watcher_mtime_poll_full_sweep_interval", 10)
+
+        with WatcherMtime._lock:
+            if (WatcherMtime._poll_thread is None):
+                LogLine.debug("{0!r} starts polling", self, context = "dpt_vfs")
+
+                WatcherMtime._directory_snapshots = { }
+                WatcherMtime._poll_directories = use_directories
+                WatcherMtime._poll_event = Event()
+                WatcherMtime._poll_full_sweep_interval = max(1, full_sweep_interval)
+                WatcherMtime._poll_interval = interval_min
+                WatcherMtime._poll_interval_max = max(interval_min, interval_max)
+                WatcherMtime._poll_interval_min = interval_min
+                WatcherMtime._poll_max_workers = max_workers
+
+                WatcherMtime._poll_thread = Thread(target = self._run_polling, args = ( WatcherMtime._poll_event, ))
+                WatcherMtime._poll_thread.daemon = True
+                WatcherMtime._poll_thread.start()
+            #
+        #
+    #
+
     def stop(self):
         """
 Stops all watchers.
@@ -178,9 +374,119 @@ Stops all watchers.
 :since: v1.0.0
         """
 
+        self.stop_polling()
         self.free()
     #
 
+    def stop_polling(self):
+        """
+Stops sweeping watched paths in the background.
+
+:since: v1.1.0
+        """
+
+        with WatcherMtime._lock:
+            poll_event = WatcherMtime._poll_event
+            poll_thread = WatcherMtime._poll_thread
+
+            WatcherMtime._poll_event = None
+            WatcherMtime._poll_thread = None
+        #
+
+        if (poll_thread is not None):
+            poll_event.set()
+            poll_thread.join()
+        #
+    #
+
+    def _sweep(self, executor = None, shards = 1):
+        """
+Sweeps all watched paths once. Paths are split into the given number of
+shards checked in parallel if an executor is given.
+
+:param executor: "concurrent.futures.Executor" instance
+:param shards: Number of shards
+
+:return: (list) List of tuples of the event type, the path and its
+         callbacks
+:since:  v1.1.0
+        """
+
+        with WatcherMtime._lock:
+            watched_paths = ([ ] if (WatcherMtime._watched_paths is None) else list(WatcherMtime._watched_paths.items()))
+        #
+
+        if (executor is None or len(watched_paths) < shards): changed_snapshots = WatcherMtime._get_changed_snapshots(watched_paths)
+        else:
+            changed_snapshots = [ ]
+
+            for changed_shard_snapshots in executor.map(WatcherMtime._get_changed_snapshots,
+                                                        [ watched_paths[offset::shards] for offset in range(shards) ]
+                                                       ): changed_snapshots += changed_shard_snapshots
+        #
+
+        return (self._apply_snapshots(changed_snapshots) if (len(changed_snapshots) > 0) else [ ])
+    #
+
+    def _sweep_directories(self, executor = None, shards = 1):
+        """
+Sweeps all watched paths once by checking their parent directories first.
+Directories are split into the given number of shards checked in parallel
+if an executor is given.
+
+:param executor: "concurrent.futures.Executor" instance
+:param shards: Number of shards
+
+:return: (list) List of tuples of the event type, the path and its
+         callbacks
+:since:  v1.1.0
+        """
+
+        with WatcherMtime._lock:
+            watched_paths = ({ } if (WatcherMtime._watched_paths is None) else WatcherMtime._watched_paths.copy())
+            watched_directories = WatcherMtime._watched_directories.copy()
+            directory_snapshots = WatcherMtime._directory_snapshots
+        #
+
+        directories = { }
+
+        for _path, snapshot in watched_paths.items():
+            directory_path = path.dirname(_path)
+
+            if (directory_path not in directories): directories[directory_path] = [ ( _path, snapshot ) ]
+            else: directories[directory_path].append(( _path, snapshot ))
+        #
+
+        for directory_path in watched_directories:
+            if (directory_path in watched_paths and directory_path not in directories): directories[directory_path] = [ ]
+        #
+
+        directory_items = list(directories.items())
+
+        if (executor is None or len(directory_items) < shards):
+            changed_snapshots, current_directory_snapshots = WatcherMtime._get_changed_directory_snapshots(directory_items,
+                                                                                                            directory_snapshots,
+                                                                                                            watched_paths
+                                                                                                           )
+        else:
+            changed_snapshots = [ ]
+            current_directory_snapshots = { }
+
+            for changed_shard_snapshots, shard_directory_snapshots in executor.map(WatcherMtime._get_changed_directory_snapshots,
+                                                                                   [ directory_items[offset::shards] for offset in range(shards) ],
+                                                                                   repeat(directory_snapshots),
+                                                                                   repeat(watched_paths)
+                                                                                  ):
+                changed_snapshots += changed_shard_snapshots
+                current_directory_snapshots.update(shard_directory_snapshots)
+            #
+        #
+
+        with WatcherMtime._lock: WatcherMtime._directory_snapshots = current_directory_snapshots
+
+        return (self._apply_snapshots(changed_snapshots) if (len(changed_snapshots) > 0) else [ ])
+    #
+
     def unregister(self, _path, callback):
         """
 Handles deregistration of filesystem watches.
@@ -204,10 +510,179 @@ Handles deregistration of filesystem watches.
                 if (len(WatcherMtime._watched_callbacks[_path]) < 1):
                     del(WatcherMtime._watched_callbacks[_path])
                     del(WatcherMtime._watched_paths[_path])
+
+                    WatcherMtime._watched_directories.discard(_path)
                 #
             else: _return = False
         #
 
         return _return
     #
+
+    @staticmethod
+    def _dispatch(events):
+        """
+Calls the callbacks of the given events.
+
+:param events: List of tuples of the event type, the path and its
+               callbacks
+
+:since: v1.1.0
+        """
+
+        for event_type, _path, callbacks in events:
+            url = "file:///{0}".format(quote_plus(_path, "/"))
+
+            for callback in callbacks:
+                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url)
+            #
+        #
+    #
+
+    @staticmethod
+    def _get_changed_directory_snapshots(directory_items, directory_snapshots, watched_paths):
+        """
+Returns the snapshots of all given paths changed. Paths are only checked if
+the snapshot of their parent directory changed.
+
+:param directory_items: List of tuples of the directory path and a list of
+                        tuples of the watched path and its latest snapshot
+:param directory_snapshots: Dict with the latest directory snapshots
+:param watched_paths: Dict with the latest snapshots of all watched paths
+
+:return: (tuple) List of tuples of the path, the latest snapshot and the
+         current one as well as a dict with the current directory snapshots
+:since:  v1.1.0
+        """
+
+        changed_snapshots = [ ]
+        current_directory_snapshots = { }
+
+        for directory_path, directory_watched_paths in directory_items:
+            directory_snapshot = WatcherMtime._get_directory_snapshot(directory_path)
+            current_directory_snapshots[directory_path] = directory_snapshot
+
+            if (directory_snapshot is None or directory_snapshot != directory_snapshots.get(directory_path)):
+                # Changes of the directory itself are changes of the watched path as well
+                if (directory_path in watched_paths): directory_watched_paths = directory_watched_paths + [ ( directory_path, watched_paths[directory_path] ) ]
+
+                try: names = (None if (directory_snapshot is None) else WatcherMtime._get_directory_names(directory_path))
+                except OSError: names = None
+
+                for _path, previous_snapshot in directory_watched_paths:
+                    name = path.basename(_path)
+
+                    snapshot = (None
+                                if (names is None or (_path != directory_path and name != "" and name not in names)) else
+                                WatcherMtime._get_snapshot(_path)
+                               )
+
+                    if (snapshot != previous_snapshot): changed_snapshots.append(( _path, previous_snapshot, snapshot ))
+                #
+            #
+        #
+
+        return ( changed_snapshots, current_directory_snapshots )
+    #
+
+    @staticmethod
+    def _get_changed_snapshots(watched_paths):
+        """
+Returns the snapshots of all given paths changed.
+
+:param watched_paths: List of tuples of the path and its latest snapshot
+
+:return: (list) List of tuples of the path, the latest snapshot and the
+         current one
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        for _path, previous_snapshot in watched_paths:
+            snapshot = WatcherMtime._get_snapshot(_path)
+            if (snapshot != previous_snapshot): _return.append(( _path, previous_snapshot, snapshot ))
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_directory_snapshot(directory_path):
+        """
+Returns the "(st_mtime_ns, st_nlink, st_ino)" snapshot of the given
+directory.
+
+:param directory_path: Directory path
+
+:return: (tuple) Snapshot; None if the directory does not exist or is not
+         accessible
+:since:  v1.1.0
+        """
+
+        try: stat_result = os.stat(directory_path)
+        except OSError: stat_result = None
+
+        if (stat_result is None): _return = None
+        else:
+            mtime_ns = getattr(stat_result, "st_mtime_ns", None)
+            if (mtime_ns is None): mtime_ns = int(stat_result.st_mtime * 1000000000)
+
+            _return = ( mtime_ns, stat_result.st_nlink, stat_result.st_ino )
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_directory_names(directory_path):
+        """
+Returns the names of all entries of the given directory.
+
+:param directory_path: Directory path
+
+:return: (set) Entry names
+:since:  v1.1.0
+        """
+
+        # global: _scandir
+
+        if (_scandir is None): _return = set(os.listdir(directory_path))
+        else:
+            dir_entries = _scandir(directory_path)
+
+            try: _return = set(dir_entry.name for dir_entry in dir_entries)
+            finally:
+                if (hasattr(dir_entries, "close")): dir_entries.close()
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_snapshot(_path):
+        """
+Returns the "(st_mtime_ns, st_size, st_ino)" snapshot of the given path.
+
+:param _path: Filesystem path
+
+:return: (tuple) Snapshot; None if the path does not exist or is not
+         accessible
+:since:  v1.1.0
+        """
+
+        try: stat_result = os.stat(_path)
+        except OSError: stat_result = None
+
+        if (stat_result is None): _return = None
+        else:
+            mtime_ns = getattr(stat_result, "st_mtime_ns", None)
+            if (mtime_ns is None): mtime_ns = int(stat_result.st_mtime * 1000000000)
+
+            _return = ( mtime_ns, stat_result.st_size, stat_result.st_ino )
+        #
+
+        return _return
+    #
 #
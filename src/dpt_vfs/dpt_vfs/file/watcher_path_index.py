@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from os import path
+
+class WatcherPathIndex(object):
+    """
+"WatcherPathIndex" keeps the callbacks of watched paths and the watch
+descriptor of each watched directory for inotify based watchers. Callback
+tuples are replaced instead of changed and each entry of the dispatch index
+is set or removed with a single operation. Lookups are therefore done
+without locking while changes must be serialized by the watcher.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_dispatch_index", "watched_callbacks", "watched_path_files", "watched_paths", "_watched_wds" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(WatcherPathIndex)
+
+:since: v1.1.0
+        """
+
+        self._dispatch_index = { }
+        """
+Callback tuples for each watch descriptor and entry name (None for the
+watched directory itself)
+        """
+        self.watched_callbacks = { }
+        """
+Callback tuple for each watched path
+        """
+        self.watched_path_files = { }
+        """
+Watched paths for each watched directory
+        """
+        self.watched_paths = { }
+        """
+Watch descriptor for each watched directory
+        """
+        self._watched_wds = { }
+        """
+Watched directory for each watch descriptor
+        """
+    #
+
+    def add(self, _path, directory_path, wd, callback):
+        """
+Adds a callback for the given path.
+
+:param _path: Filesystem path watched
+:param directory_path: Directory path watched for the path
+:param wd: Watch descriptor of the directory
+:param callback: Callback for the path
+
+:since: v1.1.0
+        """
+
+        updated_paths = [ _path ]
+
+        if (directory_path not in self.watched_paths):
+            self.watched_paths[directory_path] = wd
+            self._watched_wds[wd] = directory_path
+
+            # Watched subdirectories are reported with the new watch descriptor as well
+            updated_paths += [ watched_path for watched_path in self.watched_paths if (watched_path != _path and path.dirname(watched_path) == directory_path) ]
+        #
+
+        callbacks = self.watched_callbacks.get(_path)
+
+        # Paths with callbacks are listed for their directory already
+        if (callbacks is None):
+            callbacks = ( )
+
+            if (directory_path not in self.watched_path_files): self.watched_path_files[directory_path] = [ _path ]
+            else: self.watched_path_files[directory_path].append(_path)
+        #
+
+        if (callback not in callbacks): self.watched_callbacks[_path] = callbacks + ( callback, )
+
+        self._update_dispatch_index(updated_paths)
+    #
+
+    def clear(self):
+        """
+Removes all watched paths.
+
+:return: (list) Watch descriptors removed
+:since:  v1.1.0
+        """
+
+        _return = list(self._watched_wds)
+
+        self._dispatch_index = { }
+        self.watched_callbacks = { }
+        self.watched_path_files = { }
+        self.watched_paths = { }
+        self._watched_wds = { }
+
+        return _return
+    #
+
+    def discard_wd(self, wd):
+        """
+Forgets the directory of a watch descriptor removed by the kernel.
+
+:param wd: Watch descriptor
+
+:since: v1.1.0
+        """
+
+        directory_path = self._watched_wds.pop(wd, None)
+        if (directory_path is not None and self.watched_paths.get(directory_path) == wd): del(self.watched_paths[directory_path])
+
+        self._dispatch_index.pop(wd, None)
+    #
+
+    def get_callbacks(self, _path):
+        """
+Returns all registered callbacks for the given path. Callbacks of the
+parent directory are returned for unregistered files.
+
+:param _path: Filesystem path
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        _return = self.watched_callbacks.get(_path)
+
+        while (_return is None):
+            parent_path = path.split(_path)[0]
+
+            if (parent_path == _path or path.isdir(_path)): _return = ( )
+            else:
+                _path = parent_path
+                _return = self.watched_callbacks.get(_path)
+            #
+        #
+
+        return _return
+    #
+
+    def get_directory_path(self, wd):
+        """
+Returns the watched directory of the given watch descriptor.
+
+:param wd: Watch descriptor
+
+:return: (str) Directory path; None if not watched
+:since:  v1.1.0
+        """
+
+        return self._watched_wds.get(wd)
+    #
+
+    def get_dispatch_callbacks(self, wd, name = None):
+        """
+Returns all registered callbacks for the given watch descriptor and entry
+name.
+
+:param wd: Watch descriptor
+:param name: Name of the changed directory entry; None for the watched
+             directory itself
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        return self._dispatch_index.get(wd, { }).get(name, ( ))
+    #
+
+    def get_wd(self, directory_path):
+        """
+Returns the watch descriptor of the given watched directory.
+
+:param directory_path: Directory path
+
+:return: (int) Watch descriptor; None if not watched
+:since:  v1.1.0
+        """
+
+        return self.watched_paths.get(directory_path)
+    #
+
+    def is_watched(self, _path, callback = None):
+        """
+Returns true if the filesystem path is watched. It will return false if a
+callback is given but not defined for the watched path.
+
+:param _path: Filesystem path
+:param callback: Callback to be checked for the watched filesystem path
+
+:return: (bool) True if watched with the defined callback or any if not
+         defined.
+:since:  v1.1.0
+        """
+
+        callbacks = self.watched_callbacks.get(_path)
+        return (callbacks is not None and (callback is None or callback in callbacks))
+    #
+
+    def remove(self, _path, callback, _deleted = False):
+        """
+Removes a callback for the given path. All callbacks are removed if the
+path has been deleted or no callback is given.
+
+:param _path: Filesystem path watched
+:param callback: Callback for the path
+:param _deleted: File has been deleted
+
+:return: (list) Watch descriptors of directories not watched anymore;
+         None if the path is not watched
+:since:  v1.1.0
+        """
+
+        _return = None
+
+        is_directory = (_path in self.watched_paths)
+
+        if (is_directory): directory_path = _path
+        else: directory_path = path.split(_path)[0]
+
+        if (directory_path in self.watched_path_files and _path in self.watched_callbacks):
+            _return = [ ]
+
+            callbacks = (( ) if (callback is None or _deleted) else tuple(value for value in self.watched_callbacks[_path] if value != callback))
+
+            if (len(callbacks) > 0): self.watched_callbacks[_path] = callbacks
+            else:
+                del(self.watched_callbacks[_path])
+                if (_path in self.watched_path_files[directory_path]): self.watched_path_files[directory_path].remove(_path)
+            #
+
+            self._update_dispatch_index([ _path ])
+
+            if (is_directory and _deleted):
+                for file_path_name in list(self.watched_path_files[directory_path]):
+                    _return += (self.remove(file_path_name, None, True) or [ ])
+                #
+            #
+
+            if (directory_path in self.watched_path_files
+                and len(self.watched_path_files[directory_path]) < 1
+               ):
+                wd = self.watched_paths.pop(directory_path)
+                del(self.watched_path_files[directory_path])
+
+                self.discard_wd(wd)
+                _return.append(wd)
+            #
+        #
+
+        return _return
+    #
+
+    def _update_dispatch_index(self, paths):
+        """
+Sets the current callback tuples of the given paths in the dispatch index.
+
+:param paths: Filesystem paths changed
+
+:since: v1.1.0
+        """
+
+        dispatch_index = self._dispatch_index
+
+        for _path in paths:
+            callbacks = self.watched_callbacks.get(_path, ( ))
+            directory_path, name = path.split(_path)
+
+            keys = [ ]
+
+            # Events of a directory are reported by its own watch and by the one of its parent
+            if (_path in self.watched_paths): keys.append(( self.watched_paths[_path], None ))
+            if (directory_path in self.watched_paths): keys.append(( self.watched_paths[directory_path], name ))
+
+            for wd, name in keys:
+                wd_callbacks = dispatch_index.get(wd)
+
+                if (len(callbacks) > 0):
+                    if (wd_callbacks is None): dispatch_index[wd] = { name: callbacks }
+                    else: wd_callbacks[name] = callbacks
+                elif (wd_callbacks is not None):
+                    wd_callbacks.pop(name, None)
+                    if (len(wd_callbacks) < 1): dispatch_index.pop(wd, None)
+                #
+            #
+        #
+    #
+#
@@ -22,19 +22,37 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 from weakref import ref
 from os import path
 
-from dpt_logging import LogLine
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_logging import ExceptionLogTrap, LogLine
 from dpt_module_loader import NamedClassLoader
+from dpt_runtime import Settings
 from dpt_threading import InstanceLock, ThreadLock
 import pyinotify
 
 try: from pyinotify import IN_ATTRIB, IN_CLOSE_WRITE, IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_MODIFY, IN_MOVE_SELF, IN_MOVED_FROM, IN_MOVED_TO
 except ImportError: from pyinotify.EventsCodes import IN_ATTRIB, IN_CLOSE_WRITE, IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_MODIFY, IN_MOVE_SELF, IN_MOVED_FROM, IN_MOVED_TO
 
+from ...abstract_watcher import AbstractWatcher
+from ...watcher_callback_executor import WatcherCallbackExecutor
+from .watcher_path_index import WatcherPathIndex
 from .watcher_pyinotify_callback import WatcherPyinotifyCallback
+from .watcher_recursive_path_index import WatcherRecursivePathIndex
 
 class WatcherPyinotify(pyinotify.WatchManager):
     """
-"file:///" watcher using pyinotify's ThreadedNotifier.
+"file:///" watcher using pyinotify's ThreadedNotifier. Directories
+registered recursively are watched with pyinotify's "auto_add" mode.
+
+Events are resolved to callbacks with an index of the pyinotify watch
+descriptor and entry name. Callback tuples are replaced instead of changed
+and index entries are updated with single operations. Events are therefore
+dispatched without locking and filesystem calls.
+
+Callbacks are called by the notifier thread unless a callback executor is
+used. All watched paths are checked again if the kernel event queue
+overflowed.
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -47,11 +65,13 @@ class WatcherPyinotify(pyinotify.WatchManager):
 
     # pylint: disable=bad-option-value,slots-on-old-class
     __slots__ = ( "__weakref__",
+                  "_callback_executor",
                   "_lock",
+                  "_path_index",
                   "_pyinotify_instance",
-                  "watched_callbacks",
-                  "watched_path_files",
-                  "watched_paths"
+                  "_recursive_path_index",
+                  "watched_recursive_callbacks",
+                  "watched_recursive_paths"
                 )
     """
 python.org: __slots__ reserves space for the declared variables and prevents
@@ -66,34 +86,50 @@ Thread safety instance lock
 WatcherPyinotify weakref instance
     """
 
-    def __init__(self):
+    def __init__(self, callback_executor = None):
         """
 Constructor __init__(WatcherPyinotify)
 
+:param callback_executor: WatcherCallbackExecutor instance to call
+                          callbacks outside of the notifier thread (v1.1.0)
+
 :since: v1.0.0
         """
 
         pyinotify.WatchManager.__init__(self)
 
+        if (callback_executor is None):
+            callback_max_workers = Settings.get("dpt_vfs_file_watcher_pyinotify_callback_max_workers", 0)
+            if (callback_max_workers > 0): callback_executor = WatcherCallbackExecutor(callback_max_workers)
+        #
+
+        self._callback_executor = callback_executor
+        """
+Executor calling callbacks outside of the notifier thread
+        """
         self._lock = ThreadLock()
         """
     Thread safety lock
+        """
+        self._path_index = WatcherPathIndex()
+        """
+Callbacks and pyinotify watch descriptors of watched paths
         """
         self._pyinotify_instance = None
         """
 pyinotify instance
         """
-        self.watched_callbacks = { }
+        self._recursive_path_index = WatcherRecursivePathIndex()
         """
-Callbacks for watched files
+Callbacks of recursively watched directories by path prefix
         """
-        self.watched_path_files = { }
+        self.watched_recursive_callbacks = { }
         """
-pyinotify watch fds
+Callbacks for recursively watched directories
         """
-        self.watched_paths = { }
+        self.watched_recursive_paths = { }
         """
-pyinotify watch fds
+pyinotify watch fds of recursively watched directories
         """
 
         self._init_notifier()
@@ -109,6 +145,42 @@ Destructor __del__(WatcherPyinotify)
         self.stop()
     #
 
+    @property
+    def watched_callbacks(self):
+        """
+Returns the callbacks for each watched path.
+
+:return: (dict) Watched paths and callback tuples
+:since:  v1.0.0
+        """
+
+        return self._path_index.watched_callbacks
+    #
+
+    @property
+    def watched_path_files(self):
+        """
+Returns the watched paths for each watched directory.
+
+:return: (dict) Watched directories and paths
+:since:  v1.0.0
+        """
+
+        return self._path_index.watched_path_files
+    #
+
+    @property
+    def watched_paths(self):
+        """
+Returns the pyinotify watch descriptor for each watched directory.
+
+:return: (dict) Watched directories and watch descriptors
+:since:  v1.0.0
+        """
+
+        return self._path_index.watched_paths
+    #
+
     def check(self, _path):
         """
 Checks a given path for changes if "is_synchronous()" is true.
@@ -123,6 +195,31 @@ Checks a given path for changes if "is_synchronous()" is true.
         return False
     #
 
+    def dispatch_callbacks(self, callbacks, event_type, _path, changed_value = None):
+        """
+Calls the given callbacks in the callback executor if used. Calls for the
+same changed path are called in order.
+
+:param callbacks: Watcher callbacks
+:param event_type: Event type defined in AbstractWatcher
+:param _path: Filesystem path
+:param changed_value: Changed value (e.g. name of deleted or created file)
+
+:since: v1.1.0
+        """
+
+        url = "file:///{0}".format(quote_plus(_path, "/"))
+
+        if (self._callback_executor is None):
+            for callback in callbacks:
+                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url, changed_value)
+            #
+        else:
+            changed_path = (_path if (changed_value is None) else path.join(_path, changed_value))
+            for callback in callbacks: self._callback_executor.submit(changed_path, callback, event_type, url, changed_value)
+        #
+    #
+
     def free(self):
         """
 Frees all watcher callbacks for garbage collection.
@@ -131,9 +228,12 @@ Frees all watcher callbacks for garbage collection.
         """
 
         with self._lock:
-            if (len(self.watched_paths) > 0):
-                self.watched_callbacks = { }
-                self.watched_paths = { }
+            if (len(self._path_index.watched_paths) > 0): self._path_index.clear()
+
+            if (len(self.watched_recursive_paths) > 0):
+                self._recursive_path_index.clear()
+                self.watched_recursive_callbacks = { }
+                self.watched_recursive_paths = { }
             #
         #
     #
@@ -151,6 +251,8 @@ Initializes the pyinotify instance.
 
                 self._pyinotify_instance = pyinotify.ThreadedNotifier(self, WatcherPyinotifyCallback(self), timeout = 5000)
                 self._pyinotify_instance.start()
+
+                if (self._callback_executor is not None): self._callback_executor.start()
             #
         #
     #
@@ -168,10 +270,12 @@ if a callback is given but not defined for the watched path.
 :since:  v1.0.0
         """
 
-        _return = False
+        _return = self._path_index.is_watched(_path, callback)
 
         with self._lock:
-            if (_path in self.watched_callbacks): _return = (True if (callback is None) else (callback in self.watched_callbacks[_path]))
+            if ((not _return) and _path in self.watched_recursive_callbacks):
+                _return = (True if (callback is None) else (callback in self.watched_recursive_callbacks[_path]))
+            #
         #
 
         return _return
@@ -187,22 +291,61 @@ Returns all registered callbacks for the given path.
 :since:  v1.0.0
         """
 
-        _return = [ ]
+        return self._path_index.get_callbacks(_path)
+    #
 
-        with self._lock:
-            if (_path in self.watched_callbacks): _return = self.watched_callbacks[_path]
-            elif (not path.isdir(_path)): _return = self.get_callbacks(path.split(_path)[0])
-        #
+    def get_dispatch_callbacks(self, wd, name = None):
+        """
+Returns all registered callbacks for the given pyinotify watch descriptor
+and entry name without locking.
 
-        return _return
+:param wd: pyinotify watch descriptor
+:param name: Name of the changed directory entry; None for the watched
+             directory itself
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        return self._path_index.get_dispatch_callbacks(wd, name)
+    #
+
+    def get_recursive_callbacks(self, _path):
+        """
+Returns all registered callbacks of recursively watched directories
+containing the given path without locking.
+
+:param _path: Filesystem path
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        return self._recursive_path_index.get_callbacks(_path)
+    #
+
+    def get_recursive_root_callbacks(self, _path):
+        """
+Returns all registered callbacks of the recursively watched directory
+given without locking.
+
+:param _path: Directory path
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        return self._recursive_path_index.get_root_callbacks(_path)
     #
 
-    def register(self, _path, callback):
+    def register(self, _path, callback, recursive = False):
         """
 Handles registration of filesystem watches and its callbacks.
 
 :param _path: Filesystem path to be watched
 :param callback: Callback for the path
+:param recursive: True to watch the directory and all subdirectories
+                  (v1.1.0)
 
 :return: (bool) True on success
 :since:  v1.0.0
@@ -211,30 +354,108 @@ Handles registration of filesystem watches and its callbacks.
         # pylint: disable=no-member
 
         _return = True
+        is_directory = path.isdir(_path)
+
+        if (is_directory): directory_path = _path
+        else: directory_path = path.split(_path)[0]
 
         with self._lock:
-            if (path.isdir(_path)): directory_path = _path
-            else: directory_path = path.split(_path)[0]
+            if (recursive):
+                if (_path not in self.watched_recursive_paths):
+                    inotify_result = (self.add_watch(_path, (IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MODIFY | IN_MOVE_SELF | IN_MOVED_FROM | IN_MOVED_TO), rec = True, auto_add = True)
+                                      if (is_directory) else
+                                      { }
+                                     )
+
+                    if (inotify_result.get(_path, -1) < 0): _return = False
+                    else:
+                        self.watched_recursive_callbacks[_path] = [ ]
+                        self.watched_recursive_paths[_path] = inotify_result[_path]
+                    #
+                #
 
-            if (directory_path not in self.watched_paths):
-                inotify_result = self.add_watch(directory_path, (IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MODIFY | IN_MOVE_SELF | IN_MOVED_FROM | IN_MOVED_TO))
+                if (_return and callback not in self.watched_recursive_callbacks[_path]):
+                    self.watched_recursive_callbacks[_path].append(callback)
+                    self._recursive_path_index.update(self.watched_recursive_callbacks)
+                #
+            else:
+                wd = self._path_index.get_wd(directory_path)
 
-                if (inotify_result[directory_path] < 0): _return = False
-                else: self.watched_paths.update(inotify_result)
-            #
+                # Reuse watches of recursively watched directories to keep "auto_add" enabled
+                if (wd is None): wd = self.get_wd(directory_path)
 
-            if (_return):
-                if (directory_path not in self.watched_path_files): self.watched_path_files[directory_path] = [ _path ]
-                elif (_path not in self.watched_path_files[directory_path]): self.watched_path_files[directory_path].append(_path)
+                if (wd is None):
+                    inotify_result = self.add_watch(directory_path, (IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MODIFY | IN_MOVE_SELF | IN_MOVED_FROM | IN_MOVED_TO))
+                    wd = inotify_result.get(directory_path, -1)
+                #
 
-                if (_path not in self.watched_callbacks): self.watched_callbacks[_path] = [ callback ]
-                elif (callback not in self.watched_callbacks[_path]): self.watched_callbacks[_path].append(callback)
+                if (wd < 0): _return = False
+                else: self._path_index.add(_path, directory_path, wd, callback)
             #
         #
 
         return _return
     #
 
+    def _remove_unused_watches(self, wds):
+        """
+Removes the given pyinotify watch descriptors if they are neither used for
+watched paths nor for recursively watched directories. The lock must be
+held by the caller.
+
+:param wds: pyinotify watch descriptors
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=no-member
+
+        # Watch descriptors are shared by all watches of the same directory
+        used_wds = set(self._path_index.watched_paths.values())
+        root_path_prefixes = tuple(path.join(root_path, "") for root_path in self.watched_recursive_paths)
+
+        unused_wds = [ ]
+
+        for wd in wds:
+            if (wd in used_wds): continue
+
+            watch_path = self.get_path(wd)
+
+            # Watch descriptors unknown to pyinotify have been removed by the kernel already
+            if (watch_path is not None and (not path.join(watch_path, "").startswith(root_path_prefixes))): unused_wds.append(wd)
+        #
+
+        if (len(unused_wds) > 0): self.rm_watch(unused_wds)
+    #
+
+    def resync(self):
+        """
+Reports all watched paths as modified (or deleted if they do not exist
+anymore). It is called if events have been lost. Deleted entries are
+reported with the URL of their directory and their name as for live
+events.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            watched_callbacks = [ ( _path, callbacks, (_path in self._path_index.watched_paths) )
+                                  for _path, callbacks in self._path_index.watched_callbacks.items()
+                                ]
+
+            watched_callbacks += [ ( _path, tuple(callbacks), True ) for _path, callbacks in self.watched_recursive_callbacks.items() ]
+        #
+
+        for _path, callbacks, is_directory in watched_callbacks:
+            if (path.exists(_path)): self.dispatch_callbacks(callbacks, AbstractWatcher.EVENT_TYPE_MODIFIED, _path)
+            elif (is_directory): self.dispatch_callbacks(callbacks, AbstractWatcher.EVENT_TYPE_DELETED, _path)
+            else:
+                directory_path, name = path.split(_path)
+                self.dispatch_callbacks(callbacks, AbstractWatcher.EVENT_TYPE_DELETED, directory_path, name)
+            #
+        #
+    #
+
     def stop(self):
         """
 Stops all watchers.
@@ -250,6 +471,8 @@ Stops all watchers.
                 self._pyinotify_instance = None
             #
         #
+
+        if (self._callback_executor is not None): self._callback_executor.stop()
     #
 
     def unregister(self, _path, callback, _deleted = False):
@@ -264,33 +487,57 @@ Handles deregistration of filesystem watches.
 :since:  v1.0.0
         """
 
-        # pylint: disable=no-member
-
-        _return = True
+        _return = self._unregister_recursive(_path, callback, _deleted)
 
         with self._lock:
-            is_directory = path.isdir(_path)
+            unused_wds = self._path_index.remove(_path, callback, _deleted)
+
+            if (unused_wds is not None):
+                if (not _deleted): self._remove_unused_watches(unused_wds)
+                _return = True
+            #
+        #
 
-            if (is_directory): directory_path = _path
-            else: directory_path = path.split(_path)[0]
+        return _return
+    #
 
-            if (directory_path in self.watched_path_files and _path in self.watched_paths):
-                if (callback is None or _deleted): self.watched_callbacks[_path] = [ ]
-                elif (callback in self.watched_callbacks[_path]): self.watched_callbacks[_path].remove(callback)
+    def _unregister_recursive(self, _path, callback, _deleted = False):
+        """
+Handles deregistration of recursive directory watches.
 
-                if (len(self.watched_callbacks[_path]) < 1): del(self.watched_callbacks[_path])
+:param _path: Directory path watched
+:param callback: Callback for the directory
+:param _deleted: Directory has been deleted
 
-                if (is_directory and _deleted):
-                    for filepath in self.watched_path_files[directory_path]: self.unregister(filepath, None, True)
-                #
+:return: (bool) True on success
+:since:  v1.1.0
+        """
 
-                if (len(self.watched_path_files[directory_path]) < 1):
-                    if (not _deleted): self.rm_watch(self.watched_paths[directory_path])
+        _return = False
 
-                    del(self.watched_path_files[directory_path])
-                    del(self.watched_paths[directory_path])
+        with self._lock:
+            if (_path in self.watched_recursive_callbacks):
+                callbacks = self.watched_recursive_callbacks[_path]
+
+                if (callback is None or _deleted): del(callbacks[:])
+                elif (callback in callbacks): callbacks.remove(callback)
+
+                if (len(callbacks) < 1):
+                    wd = self.watched_recursive_paths.pop(_path)
+                    del(self.watched_recursive_callbacks[_path])
+
+                    if (not _deleted):
+                        root_path_prefix = path.join(_path, "")
+
+                        self._remove_unused_watches([ watch_wd for watch_wd, watch in self.watches.items()
+                                                      if (watch_wd == wd or path.join(watch.path, "").startswith(root_path_prefix))
+                                                    ])
+                    #
                 #
-            else: _return = False
+
+                self._recursive_path_index.update(self.watched_recursive_callbacks)
+                _return = True
+            #
         #
 
         return _return
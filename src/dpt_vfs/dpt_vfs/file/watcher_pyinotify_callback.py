@@ -22,10 +22,7 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 from os import path
 from weakref import ref
 
-try: from urllib.parse import quote_plus
-except ImportError: from urllib import quote_plus
-
-from dpt_logging import ExceptionLogTrap
+from dpt_logging import LogLine
 from dpt_runtime import Binary
 from pyinotify import ProcessEvent
 
@@ -68,30 +65,38 @@ pyinotify manager instance
         """
     #
 
-    def _process_callbacks(self, event_type, _path, changed_value = None):
+    def _process_callbacks(self, event_type, event, is_entry_event = False):
         """
 Handles all inotify events.
 
 :param event_type: Event type defined in AbstractWatcher
-:param _path: Filesystem path
-:param changed_value: Changed value (e.g. name of deleted or created file)
+:param event: pyinotify event
+:param is_entry_event: True if a directory entry has been created or
+                       deleted (v1.1.0)
 
 :since: v1.0.0
         """
 
-        changed_value = Binary.str(changed_value)
         manager = self.manager_weakref()
-        _path = Binary.str(_path)
 
-        changed_path = (_path if (changed_value is None) else path.join(_path, changed_value))
+        if (manager):
+            name = (Binary.str(event.name) if (event.name) else None)
+            callbacks = manager.get_dispatch_callbacks(event.wd, name)
 
-        if (manager and manager.is_watched(changed_path)):
-            callbacks = manager.get_callbacks(changed_path)
-            url = "file:///{0}".format(quote_plus(_path, "/"))
+            if (is_entry_event):
+                _path = path.dirname(Binary.str(event.pathname))
+                changed_value = name
+            else:
+                _path = Binary.str(event.pathname)
+                changed_value = None
+            #
 
-            for callback in callbacks:
-                with ExceptionLogTrap("dpt_vfs"): callback(event_type, url, changed_value)
+            # Recursive callbacks are called for changes inside the directory only
+            if (is_entry_event or event_type == AbstractWatcher.EVENT_TYPE_MODIFIED):
+                callbacks += manager.get_recursive_callbacks(_path)
             #
+
+            if (len(callbacks) > 0): manager.dispatch_callbacks(callbacks, event_type, _path, changed_value)
         #
     #
 
@@ -104,7 +109,7 @@ Handles "IN_ATTRIB" inotify events.
 :since: v1.0.0
         """
 
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED, event.pathname)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED, event)
     #
 
     def process_IN_CLOSE_WRITE(self, event):
@@ -116,7 +121,7 @@ Handles "IN_CLOSE_WRITE" inotify events.
 :since: v1.0.0
         """
 
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED, event.pathname)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_MODIFIED, event)
     #
 
     def process_IN_CREATE(self, event):
@@ -128,10 +133,7 @@ Handles "IN_CREATE" inotify events.
 :since: v1.0.0
         """
 
-        dir_path = path.dirname(event.pathname)
-        name = path.basename(event.pathname)
-
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_CREATED, dir_path, name)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_CREATED, event, True)
     #
 
     def process_IN_DELETE(self, event):
@@ -143,10 +145,7 @@ Handles "IN_DELETE" inotify events.
 :since: v1.0.0
         """
 
-        dir_path = path.dirname(event.pathname)
-        name = path.basename(event.pathname)
-
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, dir_path, name)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, event, True)
     #
 
     def process_IN_DELETE_SELF(self, event):
@@ -158,10 +157,7 @@ Handles "IN_DELETE_SELF" inotify events.
 :since: v1.0.0
         """
 
-        manager = self.manager_weakref()
-        if (manager): manager.unregister(event.pathname, None, True)
-
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, event.pathname)
+        self._process_self_deleted(event)
     #
 
     def process_IN_MOVE_SELF(self, event):
@@ -173,10 +169,7 @@ Handles "IN_MOVE_SELF" inotify events.
 :since: v1.0.0
         """
 
-        manager = self.manager_weakref()
-        if (manager): manager.unregister(event.pathname, None, True)
-
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, event.pathname)
+        self._process_self_deleted(event)
     #
 
     def process_IN_MOVED_FROM(self, event):
@@ -188,10 +181,7 @@ Handles "IN_MOVED_FROM" inotify events.
 :since: v1.0.0
         """
 
-        dir_path = path.dirname(event.pathname)
-        name = path.basename(event.pathname)
-
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, dir_path, name)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_DELETED, event, True)
     #
 
     def process_IN_MOVED_TO(self, event):
@@ -203,9 +193,49 @@ Handles "IN_MOVED_TO" inotify events.
 :since: v1.0.0
         """
 
-        dir_path = path.dirname(event.pathname)
-        name = path.basename(event.pathname)
+        self._process_callbacks(AbstractWatcher.EVENT_TYPE_CREATED, event, True)
+    #
+
+    def process_IN_Q_OVERFLOW(self, event):
+        """
+Handles "IN_Q_OVERFLOW" inotify events. Events have been lost and all
+watched paths are checked again.
+
+:param event: pyinotify event
+
+:since: v1.1.0
+        """
 
-        self._process_callbacks(AbstractWatcher.EVENT_TYPE_CREATED, dir_path, name)
+        manager = self.manager_weakref()
+
+        if (manager):
+            LogLine.warning("{0!r} event queue overflowed", manager, context = "dpt_vfs")
+            manager.resync()
+        #
+    #
+
+    def _process_self_deleted(self, event):
+        """
+Handles the deletion of a watched directory. Callbacks are collected before
+the directory is unregistered.
+
+:param event: pyinotify event
+
+:since: v1.1.0
+        """
+
+        manager = self.manager_weakref()
+
+        if (manager):
+            _path = Binary.str(event.pathname)
+
+            callbacks = (manager.get_dispatch_callbacks(event.wd)
+                         + manager.get_recursive_root_callbacks(_path)
+                        )
+
+            manager.unregister(_path, None, True)
+
+            if (len(callbacks) > 0): manager.dispatch_callbacks(callbacks, AbstractWatcher.EVENT_TYPE_DELETED, _path)
+        #
     #
 #
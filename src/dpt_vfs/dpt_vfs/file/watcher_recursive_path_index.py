@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from os import path
+
+class WatcherRecursivePathIndex(object):
+    """
+"WatcherRecursivePathIndex" keeps the callbacks of recursively watched
+directories by their path prefix. The index is replaced instead of changed.
+Lookups are therefore done without locking while changes must be serialized
+by the watcher.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_dispatch_index", )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self):
+        """
+Constructor __init__(WatcherRecursivePathIndex)
+
+:since: v1.1.0
+        """
+
+        self._dispatch_index = ( )
+        """
+Tuple of the path prefix and callback tuple for each recursively watched
+directory
+        """
+    #
+
+    def clear(self):
+        """
+Removes all recursively watched directories.
+
+:since: v1.1.0
+        """
+
+        self._dispatch_index = ( )
+    #
+
+    def get_callbacks(self, _path):
+        """
+Returns all callbacks of recursively watched directories containing the
+given path.
+
+:param _path: Filesystem path
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        _return = ( )
+
+        for root_path_prefix, callbacks in self._dispatch_index:
+            if (_path.startswith(root_path_prefix) or _path == root_path_prefix[:-1]): _return += callbacks
+        #
+
+        return _return
+    #
+
+    def get_root_callbacks(self, _path):
+        """
+Returns the callbacks of the given recursively watched directory.
+
+:param _path: Directory path
+
+:return: (tuple) Watcher callbacks
+:since:  v1.1.0
+        """
+
+        _return = ( )
+
+        root_path_prefix = path.join(_path, "")
+
+        for watched_root_path_prefix, callbacks in self._dispatch_index:
+            if (watched_root_path_prefix == root_path_prefix):
+                _return = callbacks
+                break
+            #
+        #
+
+        return _return
+    #
+
+    def update(self, watched_callbacks):
+        """
+Replaces the index with the given recursively watched directories.
+
+:param watched_callbacks: Dictionary of recursively watched directories
+                          and their callbacks
+
+:since: v1.1.0
+        """
+
+        self._dispatch_index = tuple(( path.join(root_path, ""), tuple(callbacks) )
+                                     for root_path, callbacks in watched_callbacks.items()
+                                     if (len(callbacks) > 0)
+                                    )
+    #
+#
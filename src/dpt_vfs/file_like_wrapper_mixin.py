@@ -19,10 +19,72 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 from dpt_runtime.exceptions import IOException
 
+class _WrappedResourceAttribute(object):
+    """
+Descriptor returning the attribute of the wrapped resource. Methods are
+bound once when the wrapped resource is set.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "name", )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, name):
+        """
+Constructor __init__(_WrappedResourceAttribute)
+
+:param name: Attribute name
+
+:since: v1.1.0
+        """
+
+        self.name = name
+        """
+Attribute name
+        """
+    #
+
+    def __get__(self, instance, owner):
+        """
+python.org: Called to get the attribute of the owner class (class attribute
+access) or of an instance of that class (instance attribute access).
+
+:param instance: Instance the attribute was accessed through
+:param owner: Owner class
+
+:return: (mixed) Attribute of the wrapped resource
+:since:  v1.1.0
+        """
+
+        # pylint: disable=protected-access
+
+        if (instance is None): _return = self
+        else:
+            wrapped_attributes = instance._wrapped_resource_attributes
+
+            _return = (None if (wrapped_attributes is None) else wrapped_attributes.get(self.name))
+            if (_return is None): _return = instance._get_wrapped_resource_attribute(self.name)
+        #
+
+        return _return
+    #
+#
+
 class FileLikeWrapperMixin(object):
     """
 The "FileLikeWrapperMixin" redirects FileIO to the registered wrapped
-instance.
+instance. Classes using it are decorated with
+"FileLikeWrapperMixin.install_wrapped_attributes".
 
 :author:     direct Netware Group et al.
 :copyright:  direct Netware Group - All rights reserved
@@ -46,7 +108,7 @@ instance.
 File IO methods implemented by an wrapped resource.
     """
 
-    _mixin_slots_ = ( "_wrapped_resource", )
+    _mixin_slots_ = ( "_wrapped_resource", "_wrapped_resource_attributes" )
     """
 Additional __slots__ used for inherited classes.
     """
@@ -67,32 +129,10 @@ Constructor __init__(FileLikeWrapperMixin)
         """
 Wrapped file-like resource
         """
-    #
-
-    def __getattribute__(self, name):
+        self._wrapped_resource_attributes = None
         """
-python.org: Called unconditionally to implement attribute accesses for
-instances of the class.
-
-:param name: Attribute name
-
-:return: (mixed) Instance attribute
-:since:  v1.0.0
+Methods of the wrapped resource bound once it has been set
         """
-
-        # pylint: disable=protected-access
-
-        if (name == "__class__"
-            or name not in self.__class__._FILE_WRAPPED_METHODS
-           ): _return = object.__getattribute__(self, name)
-        else:
-            if (self._wrapped_resource is None): self._open_wrapped_resource()
-            if (self._wrapped_resource is None): raise IOException("'{0}' not available for {1!r}".format(name, self))
-
-            _return = getattr(self._wrapped_resource, name)
-        #
-
-        return _return
     #
 
     @property
@@ -116,8 +156,30 @@ python.org: Flush and close this stream.
 
         if (self._wrapped_resource is not None):
             try: self._wrapped_resource.close()
-            finally: self._wrapped_resource = None
+            finally: self._set_wrapped_resource(None)
+        #
+    #
+
+    def _get_wrapped_resource_attribute(self, name):
+        """
+Returns the attribute of the wrapped resource. The wrapped resource is
+opened if needed.
+
+:param name: Attribute name
+
+:return: (mixed) Attribute of the wrapped resource
+:since:  v1.1.0
+        """
+
+        if (self._wrapped_resource_attributes is None):
+            self._open_wrapped_resource()
+            if (self._wrapped_resource_attributes is None): raise IOException("'{0}' not available for {1!r}".format(name, self))
         #
+
+        _return = self._wrapped_resource_attributes.get(name)
+        if (_return is None): _return = getattr(self._wrapped_resource, name)
+
+        return _return
     #
 
     def _open_wrapped_resource(self):
@@ -139,6 +201,43 @@ Sets the wrapped resource for this object.
 :since: v1.0.0
         """
 
+        # pylint: disable=protected-access
+
+        wrapped_attributes = None
+
+        if (resource is not None):
+            wrapped_attributes = { }
+
+            # Methods not implemented by the resource raise AttributeError once accessed
+            for name in self.__class__._FILE_WRAPPED_METHODS:
+                if (not isinstance(getattr(resource.__class__, name, None), property)):
+                    attribute = getattr(resource, name, None)
+                    if (attribute is not None): wrapped_attributes[name] = attribute
+                #
+            #
+        #
+
         self._wrapped_resource = resource
+        self._wrapped_resource_attributes = wrapped_attributes
+    #
+
+    @staticmethod
+    def install_wrapped_attributes(_class):
+        """
+Installs descriptors for all file IO methods implemented by an wrapped
+resource in the given class. Other attributes are accessed without any
+additional overhead. It is used as class decorator so that the class is
+complete once defined.
+
+:param _class: Class using the "FileLikeWrapperMixin"
+
+:return: (object) Class given
+:since:  v1.1.0
+        """
+
+        # pylint: disable=protected-access
+
+        for name in _class._FILE_WRAPPED_METHODS: setattr(_class, name, _WrappedResourceAttribute(name))
+        return _class
     #
 #
@@ -19,9 +19,12 @@ https://www.direct-netware.de/redirect?licenses;mpl2
 
 from dpt_module_loader import NamedClassLoader
 from dpt_runtime import Binary
-from dpt_runtime.exceptions import IOException
+from dpt_runtime.exceptions import IOException, TypeException, ValueException
+from dpt_threading import ThreadLock
 
 from .abstract import Abstract
+from .stat_record import StatRecord
+from .vfs_url import VfsUrl
 
 class Implementation(object):
     """
@@ -49,12 +52,29 @@ File type
     """
 Link type
     """
+    _UNKNOWN_SCHEMES_MAX_SIZE = 4096
+    """
+Maximum number of URL schemes without a VFS object class cached
+    """
 
     __slots__ = ( )
     """
 python.org: __slots__ reserves space for the declared variables and prevents
 the automatic creation of __dict__ and __weakref__ for each instance.
     """
+    _classes = { }
+    """
+VFS object classes resolved or registered for URL schemes
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _unknown_schemes = { }
+    """
+URL schemes without a VFS object class. It is cleared if a VFS object class
+is registered.
+    """
 
     @staticmethod
     def get_class(scheme):
@@ -65,11 +85,30 @@ Returns an VFS object class for the given scheme.
 :since:  v1.0.0
         """
 
-        _return = NamedClassLoader.get_class_in_namespace("dpt_vfs", "{0}.Object".format(scheme.replace("-", "_")))
+        _return = Implementation._classes.get(scheme)
 
-        if (_return is None
-            or (not issubclass(_return, Abstract))
-           ): raise IOException("VFS object not defined for URL scheme '{0}'".format(scheme))
+        if (_return is None):
+            with Implementation._lock:
+                _return = Implementation._classes.get(scheme)
+
+                if (_return is None and scheme not in Implementation._unknown_schemes):
+                    _return = NamedClassLoader.get_class_in_namespace("dpt_vfs", "{0}.Object".format(scheme.replace("-", "_")))
+
+                    if (_return is not None and issubclass(_return, Abstract)): Implementation._classes[scheme] = _return
+                    else:
+                        _return = None
+
+                        if (len(Implementation._unknown_schemes) >= Implementation._UNKNOWN_SCHEMES_MAX_SIZE):
+                            Implementation._unknown_schemes.pop(next(iter(Implementation._unknown_schemes)))
+                        #
+
+                        Implementation._unknown_schemes[scheme] = True
+                    #
+                #
+            #
+        #
+
+        if (_return is None): raise IOException("VFS object not defined for URL scheme '{0}'".format(scheme))
 
         return _return
     #
@@ -87,6 +126,28 @@ Returns an VFS object instance for the given scheme.
         return vfs_object_class()
     #
 
+    @staticmethod
+    def load_classes(schemes):
+        """
+Resolves and caches the VFS object classes for the given schemes. Schemes
+without a VFS object class are cached as unknown ones.
+
+:param schemes: List of URL schemes
+
+:return: (list) URL schemes without a VFS object class
+:since:  v1.1.0
+        """
+
+        _return = [ ]
+
+        for scheme in schemes:
+            try: Implementation.get_class(scheme)
+            except IOException: _return.append(scheme)
+        #
+
+        return _return
+    #
+
     @staticmethod
     def load_vfs_url(vfs_url, readonly = False):
         """
@@ -99,10 +160,8 @@ Returns the initialized object instance for the given VFS URL.
 :since:  v1.0.0
         """
 
-        # pylint: disable=protected-access
-
         vfs_url = Binary.str(vfs_url)
-        scheme = Abstract._get_scheme_from_vfs_url(vfs_url)
+        scheme = VfsUrl.parse(vfs_url).scheme
 
         _return = Implementation.get_instance(scheme)
         _return.open(vfs_url, readonly)
@@ -122,14 +181,92 @@ Returns a new object instance for the given VFS URL.
 :since:  v1.0.0
         """
 
-        # pylint: disable=protected-access
-
         vfs_url = Binary.str(vfs_url)
-        scheme = Abstract._get_scheme_from_vfs_url(vfs_url)
+        scheme = VfsUrl.parse(vfs_url).scheme
 
         _return = Implementation.get_instance(scheme)
         _return.new(_type, vfs_url)
 
         return _return
     #
+
+    @staticmethod
+    def register_class(scheme, vfs_object_class):
+        """
+Registers the given VFS object class for the given scheme. URL schemes
+cached as unknown are resolved again on next use.
+
+:param scheme: URL scheme
+:param vfs_object_class: VFS object class
+
+:since: v1.1.0
+        """
+
+        if (not issubclass(vfs_object_class, Abstract)): raise TypeException("VFS object class given is invalid")
+
+        with Implementation._lock:
+            Implementation._classes[scheme] = vfs_object_class
+            Implementation._unknown_schemes.clear()
+        #
+    #
+
+    @staticmethod
+    def stat_many(vfs_urls):
+        """
+Returns the metadata of all given VFS URLs. VFS URLs are grouped by scheme
+and read in bulk by the corresponding VFS object class. Errors are
+reported for each VFS URL in the corresponding record.
+
+:param vfs_urls: Iterable of VFS URLs
+
+:return: (list) StatRecord instances in the order of the VFS URLs given
+:since:  v1.1.0
+        """
+
+        vfs_urls = [ Binary.str(vfs_url) for vfs_url in vfs_urls ]
+
+        _return = [ None ] * len(vfs_urls)
+        scheme_positions = { }
+
+        for position, vfs_url in enumerate(vfs_urls):
+            try: scheme = VfsUrl.parse(vfs_url).scheme
+            except ValueException as handled_exception:
+                _return[position] = StatRecord.from_error(vfs_url, handled_exception)
+                continue
+            #
+
+            if (scheme in scheme_positions): scheme_positions[scheme].append(position)
+            else: scheme_positions[scheme] = [ position ]
+        #
+
+        for scheme, positions in scheme_positions.items():
+            scheme_vfs_urls = [ vfs_urls[position] for position in positions ]
+
+            try: records = Implementation.get_class(scheme).stat_many(scheme_vfs_urls)
+            except IOException as handled_exception:
+                records = [ StatRecord.from_error(vfs_url, handled_exception) for vfs_url in scheme_vfs_urls ]
+            #
+
+            for position, record in zip(positions, records): _return[position] = record
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def unregister_class(scheme):
+        """
+Removes the VFS object class resolved or registered for the given scheme.
+It will be resolved again on next use.
+
+:param scheme: URL scheme
+
+:since: v1.1.0
+        """
+
+        with Implementation._lock:
+            Implementation._classes.pop(scheme, None)
+            Implementation._unknown_schemes.pop(scheme, None)
+        #
+    #
 #
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from os import path
+
+from dpt_mime_type import MimeType
+from dpt_runtime import Settings
+from dpt_threading import ThreadLock
+
+class MimetypeTable(object):
+    """
+"MimetypeTable" resolves mime types of file names with a precomputed,
+case-normalized extension table. Extensions not defined by "dpt_mime_type"
+are looked up once and kept in a bounded cache.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    DEFAULT_MIMETYPE = "application/octet-stream"
+    """
+Mime type returned for unknown extensions
+    """
+
+    __slots__ = ( )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock
+    """
+    _table = None
+    """
+Extension to mime type table; replaced as a whole if refreshed
+    """
+    _unknown_extensions = OrderedDict()
+    """
+Bounded cache of mime types resolved for extensions not in the table
+    """
+
+    @staticmethod
+    def get(name):
+        """
+Returns the mime type for the given file name.
+
+:param name: File name or path
+
+:return: (str) Mime type
+:since:  v1.1.0
+        """
+
+        return MimetypeTable.get_by_extension(path.splitext(name)[1][1:])
+    #
+
+    @staticmethod
+    def get_by_extension(extension):
+        """
+Returns the mime type for the given extension.
+
+:param extension: Extension without a leading dot
+
+:return: (str) Mime type
+:since:  v1.1.0
+        """
+
+        extension = extension.lower()
+
+        table = MimetypeTable._table
+        if (table is None): table = MimetypeTable._get_table()
+
+        _return = table.get(extension)
+        if (_return is None): _return = MimetypeTable._get_unknown_extension(extension)
+
+        return _return
+    #
+
+    @staticmethod
+    def _get_table():
+        """
+Returns the extension table and builds it if not already done.
+
+:return: (dict) Extension to mime type table
+:since:  v1.1.0
+        """
+
+        with MimetypeTable._lock:
+            if (MimetypeTable._table is None):
+                mimetype_instance = MimeType.get_instance()
+                table = { }
+
+                for extension in list(mimetype_instance.extensions):
+                    mimetype_definition = mimetype_instance.get(extension)
+                    if (mimetype_definition is not None): table[extension.lower()] = mimetype_definition['type']
+                #
+
+                MimetypeTable._table = table
+            #
+
+            return MimetypeTable._table
+        #
+    #
+
+    @staticmethod
+    def _get_unknown_extension(extension):
+        """
+Returns the mime type for an extension not in the table. Results are
+cached up to the configured number of extensions.
+
+:param extension: Case-normalized extension
+
+:return: (str) Mime type
+:since:  v1.1.0
+        """
+
+        _return = MimetypeTable._unknown_extensions.get(extension)
+
+        if (_return is None):
+            with MimetypeTable._lock:
+                mimetype_definition = MimeType.get_instance().get(extension)
+                _return = (MimetypeTable.DEFAULT_MIMETYPE if (mimetype_definition is None) else mimetype_definition['type'])
+
+                if (extension not in MimetypeTable._unknown_extensions
+                    and len(MimetypeTable._unknown_extensions) >= Settings.get("dpt_vfs_mimetype_cache_size", 1024)
+                   ): MimetypeTable._unknown_extensions.popitem(False)
+
+                MimetypeTable._unknown_extensions[extension] = _return
+            #
+        #
+
+        return _return
+    #
+
+    @staticmethod
+    def mimetypes_for(names):
+        """
+Returns the mime types for the given file names.
+
+:param names: File names or paths
+
+:return: (list) Mime types in the order of the given names
+:since:  v1.1.0
+        """
+
+        return [ MimetypeTable.get(name) for name in names ]
+    #
+
+    @staticmethod
+    def refresh():
+        """
+Discards the extension table and cached mime types. The table is built
+again on next use.
+
+:since: v1.1.0
+        """
+
+        with MimetypeTable._lock:
+            MimetypeTable._table = None
+            MimetypeTable._unknown_extensions.clear()
+        #
+    #
+#
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from dpt_runtime import Binary, Settings
+from dpt_threading import ThreadLock
+
+from .implementation import Implementation
+from .vfs_url import VfsUrl
+
+class ObjectPool(object):
+    """
+"ObjectPool" keeps closed VFS objects for reuse. Instead of creating a new
+instance for each VFS URL an idle instance of the same class is reopened.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_idle", "_lock", "max_size" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_size = None):
+        """
+Constructor __init__(ObjectPool)
+
+:param max_size: Maximum number of idle VFS objects kept for each VFS
+                 object class
+
+:since: v1.1.0
+        """
+
+        if (max_size is None): max_size = Settings.get("dpt_vfs_object_pool_max_size", 64)
+
+        self._idle = { }
+        """
+Idle VFS objects for each VFS object class
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self.max_size = max_size
+        """
+Maximum number of idle VFS objects kept for each VFS object class
+        """
+    #
+
+    @property
+    def idle_count(self):
+        """
+Returns the number of idle VFS objects kept.
+
+:return: (int) Number of idle VFS objects
+:since:  v1.1.0
+        """
+
+        with self._lock: return sum(len(vfs_objects) for vfs_objects in self._idle.values())
+    #
+
+    def acquire(self, vfs_url, readonly = False):
+        """
+Returns an opened VFS object for the given VFS URL. An idle VFS object is
+reopened if available.
+
+:param vfs_url: VFS URL
+:param readonly: Open object in readonly mode
+
+:return: (object) VFS object instance
+:since:  v1.1.0
+        """
+
+        vfs_url = Binary.str(vfs_url)
+        vfs_object_class = Implementation.get_class(VfsUrl.parse(vfs_url).scheme)
+
+        with self._lock:
+            vfs_objects = self._idle.get(vfs_object_class)
+            _return = (vfs_objects.pop() if (vfs_objects) else None)
+        #
+
+        if (_return is None): _return = vfs_object_class()
+
+        is_opened = False
+
+        try:
+            _return.open(vfs_url, readonly)
+            is_opened = True
+        finally:
+            if (not is_opened): self.release(_return)
+        #
+
+        return _return
+    #
+
+    def clear(self):
+        """
+Discards all idle VFS objects.
+
+:since: v1.1.0
+        """
+
+        with self._lock: self._idle.clear()
+    #
+
+    def release(self, vfs_object):
+        """
+Closes the given VFS object and keeps it for reuse if the pool is not full.
+Settings and feature overrides of the VFS object are reset.
+
+:param vfs_object: VFS object acquired before
+
+:since: v1.1.0
+        """
+
+        # pylint: disable=protected-access
+
+        vfs_object.close()
+        vfs_object._reset_state()
+
+        with self._lock:
+            vfs_objects = self._idle.setdefault(vfs_object.__class__, [ ])
+            if (len(vfs_objects) < self.max_size): vfs_objects.append(vfs_object)
+        #
+    #
+#
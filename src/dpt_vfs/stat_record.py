@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import namedtuple
+
+from dpt_runtime.exceptions import OperationNotSupportedException
+
+class StatRecord(namedtuple("_StatRecord", ( "url", "type", "size", "time_created", "time_updated", "error" ))):
+    """
+"StatRecord" is an immutable record of the metadata of a VFS URL. If the
+metadata could not be read all fields except "url" and "error" are None.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    @property
+    def is_valid(self):
+        """
+Returns true if the metadata has been read successfully.
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        return (self.error is None)
+    #
+
+    @staticmethod
+    def from_error(vfs_url, error):
+        """
+Returns a record for a VFS URL the metadata could not be read for.
+
+:param vfs_url: VFS URL
+:param error: Exception raised
+
+:return: (object) StatRecord instance
+:since:  v1.1.0
+        """
+
+        return StatRecord(vfs_url, None, None, None, None, error)
+    #
+
+    @staticmethod
+    def from_vfs_object(vfs_object, vfs_url = None):
+        """
+Returns a record with the metadata of the given opened VFS object.
+Metadata not supported by the VFS object is set to None.
+
+:param vfs_object: VFS object
+:param vfs_url: VFS URL requested; None to use the one of the VFS object
+
+:return: (object) StatRecord instance
+:since:  v1.1.0
+        """
+
+        values = [ ]
+
+        for name in ( "type", "size", "time_created", "time_updated" ):
+            try: values.append(getattr(vfs_object, name))
+            except OperationNotSupportedException: values.append(None)
+        #
+
+        if (vfs_url is None): vfs_url = vfs_object.url
+
+        return StatRecord(vfs_url, values[0], values[1], values[2], values[3], None)
+    #
+#
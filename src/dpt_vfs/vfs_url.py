@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+# pylint: disable=import-error,no-name-in-module
+
+try: from urllib.parse import unquote_plus
+except ImportError: from urllib import unquote_plus
+
+from dpt_runtime.exceptions import ValueException
+from dpt_threading import ThreadLock
+
+class VfsUrl(object):
+    """
+"VfsUrl" represents a parsed VFS URL. Parsed instances are immutable and
+shared by all users of the same VFS URL string.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    _CACHE_MAX_SIZE = 4096
+    """
+Maximum number of parsed VFS URLs cached
+    """
+
+    __slots__ = ( "_id", "_path", "_scheme", "_url" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+    _cache = { }
+    """
+Parsed VFS URLs cached by their string representation
+    """
+    _lock = ThreadLock()
+    """
+Thread safety lock for cache changes
+    """
+
+    def __init__(self, vfs_url):
+        """
+Constructor __init__(VfsUrl)
+
+:param vfs_url: VFS URL
+
+:since: v1.1.0
+        """
+
+        if (type(vfs_url) is not str): raise ValueException("VFS URL given is invalid")
+
+        vfs_url_data = vfs_url.split("://", 1)
+        if (len(vfs_url_data) == 1): raise ValueException("VFS URL '{0}' is invalid".format(vfs_url))
+
+        _id = vfs_url_data[1]
+
+        if (_id in ( "", "/" )): _id = ""
+        else: _id = (_id[1:] if (_id[:1] == "/") else _id).strip()
+
+        self._id = _id
+        """
+VFS URL ID
+        """
+        self._path = unquote_plus(_id)
+        """
+Decoded VFS URL ID
+        """
+        self._scheme = vfs_url_data[0].lower()
+        """
+VFS URL scheme
+        """
+        self._url = vfs_url
+        """
+VFS URL
+        """
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r}>".format(self.__class__.__name__, self._url)
+    #
+
+    def __str__(self):
+        """
+python.org: Called by str(object) and the built-in functions format() and
+print() to compute the "informal" or nicely printable string representation
+of an object.
+
+:return: (str) VFS URL
+:since:  v1.1.0
+        """
+
+        return self._url
+    #
+
+    @property
+    def id(self):
+        """
+Returns the ID part of the VFS URL.
+
+:return: (str) VFS URL ID
+:since:  v1.1.0
+        """
+
+        return self._id
+    #
+
+    @property
+    def path(self):
+        """
+Returns the decoded ID part of the VFS URL. For "file:///" URLs this is the
+filesystem path.
+
+:return: (str) Decoded VFS URL ID
+:since:  v1.1.0
+        """
+
+        return self._path
+    #
+
+    @property
+    def scheme(self):
+        """
+Returns the lower case scheme of the VFS URL.
+
+:return: (str) VFS URL scheme
+:since:  v1.1.0
+        """
+
+        return self._scheme
+    #
+
+    @property
+    def url(self):
+        """
+Returns the VFS URL.
+
+:return: (str) VFS URL
+:since:  v1.1.0
+        """
+
+        return self._url
+    #
+
+    @staticmethod
+    def parse(vfs_url):
+        """
+Returns the parsed, shared representation of the given VFS URL. A bounded
+number of parsed VFS URLs is cached.
+
+:param vfs_url: VFS URL
+
+:return: (object) VfsUrl instance
+:since:  v1.1.0
+        """
+
+        if (type(vfs_url) is not str): raise ValueException("VFS URL given is invalid")
+
+        _return = VfsUrl._cache.get(vfs_url)
+
+        if (_return is None):
+            _return = VfsUrl(vfs_url)
+
+            with VfsUrl._lock:
+                if (len(VfsUrl._cache) >= VfsUrl._CACHE_MAX_SIZE): VfsUrl._cache.pop(next(iter(VfsUrl._cache)))
+                VfsUrl._cache[vfs_url] = _return
+            #
+        #
+
+        return _return
+    #
+#
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+try: from queue import Queue
+except ImportError: from Queue import Queue
+
+from dpt_logging import ExceptionLogTrap
+from dpt_runtime import Settings
+from dpt_threading import ThreadLock
+from dpt_threading.encapsulated import Thread
+
+class WatcherCallbackExecutor(object):
+    """
+"WatcherCallbackExecutor" calls watcher callbacks in a fixed number of
+worker threads. Calls for the same key (e.g. the changed path) are always
+handled by the same worker and are therefore called in order. Each worker
+queue is bounded and blocks the submitting thread if full.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_lock", "_max_queue_size", "_max_workers", "_queues", "_threads" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, max_workers = None, max_queue_size = None):
+        """
+Constructor __init__(WatcherCallbackExecutor)
+
+:param max_workers: Number of worker threads
+:param max_queue_size: Maximum number of calls queued for each worker
+
+:since: v1.1.0
+        """
+
+        if (max_workers is None): max_workers = Settings.get("dpt_vfs_watcher_callback_max_workers", 4)
+        if (max_queue_size is None): max_queue_size = Settings.get("dpt_vfs_watcher_callback_max_queue_size", 1024)
+
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._max_queue_size = max_queue_size
+        """
+Maximum number of calls queued for each worker
+        """
+        self._max_workers = max(1, max_workers)
+        """
+Number of worker threads
+        """
+        self._queues = None
+        """
+Queue of each worker thread
+        """
+        self._threads = None
+        """
+Worker threads
+        """
+    #
+
+    @property
+    def is_running(self):
+        """
+Returns true if the worker threads are running.
+
+:return: (bool) True if running
+:since:  v1.1.0
+        """
+
+        return (self._threads is not None)
+    #
+
+    def _run(self, queue):
+        """
+Calls queued callbacks until stopped.
+
+:param queue: Queue of this worker thread
+
+:since: v1.1.0
+        """
+
+        while True:
+            call = queue.get()
+
+            try:
+                if (call is None): break
+
+                callback, args = call
+                with ExceptionLogTrap("dpt_vfs"): callback(*args)
+            finally: queue.task_done()
+        #
+    #
+
+    def start(self):
+        """
+Starts the worker threads.
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            if (self._threads is None):
+                self._queues = [ Queue(self._max_queue_size) for _ in range(self._max_workers) ]
+                self._threads = [ ]
+
+                for queue in self._queues:
+                    thread = Thread(target = self._run, args = ( queue, ))
+                    thread.daemon = True
+                    thread.start()
+
+                    self._threads.append(thread)
+                #
+            #
+        #
+    #
+
+    def stop(self, wait = True):
+        """
+Stops the worker threads after all calls queued before have been handled.
+
+:param wait: True to wait for the worker threads to finish
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            queues = self._queues
+            threads = self._threads
+
+            self._queues = None
+            self._threads = None
+        #
+
+        if (threads is not None):
+            for queue in queues: queue.put(None)
+
+            if (wait):
+                for thread in threads: thread.join()
+            #
+        #
+    #
+
+    def submit(self, key, callback, *args):
+        """
+Queues a callback call. Callbacks are called inline if the worker threads
+are not running.
+
+:param key: Key calls are ordered by (e.g. the changed path)
+:param callback: Callback to be called
+:param args: Callback arguments
+
+:since: v1.1.0
+        """
+
+        queues = self._queues
+
+        if (queues is None):
+            with ExceptionLogTrap("dpt_vfs"): callback(*args)
+        else: queues[hash(key) % len(queues)].put(( callback, args ))
+    #
+
+    def wait(self):
+        """
+Waits until all calls queued have been handled.
+
+:since: v1.1.0
+        """
+
+        queues = self._queues
+
+        if (queues is not None):
+            for queue in queues: queue.join()
+        #
+    #
+#
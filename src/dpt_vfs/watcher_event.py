@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+class WatcherEvent(object):
+    """
+"WatcherEvent" represents a change event reported by a watcher.
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_changed_value", "_event_type", "_url" )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, event_type, url, changed_value = None):
+        """
+Constructor __init__(WatcherEvent)
+
+:param event_type: Event type
+:param url: Resource URL watched
+:param changed_value: Changed value (e.g. a file name) if reported
+
+:since: v1.1.0
+        """
+
+        self._changed_value = changed_value
+        """
+Changed value if reported
+        """
+        self._event_type = event_type
+        """
+Event type
+        """
+        self._url = url
+        """
+Resource URL watched
+        """
+    #
+
+    def __eq__(self, other):
+        """
+python.org: The correspondence between operator symbols and method names is
+as follows: x==y calls x.__eq__(y)
+
+:param other: Object to compare with
+
+:return: (bool) True if equal
+:since:  v1.1.0
+        """
+
+        return (isinstance(other, WatcherEvent)
+                and self._event_type == other.event_type
+                and self._url == other.url
+                and self._changed_value == other.changed_value
+               )
+    #
+
+    def __hash__(self):
+        """
+python.org: Called by built-in function hash() and for operations on
+members of hashed collections.
+
+:return: (int) Hash value
+:since:  v1.1.0
+        """
+
+        return hash(( self._event_type, self._url, self._changed_value ))
+    #
+
+    def __ne__(self, other):
+        """
+python.org: The correspondence between operator symbols and method names is
+as follows: x!=y calls x.__ne__(y)
+
+:param other: Object to compare with
+
+:return: (bool) True if not equal
+:since:  v1.1.0
+        """
+
+        return (not self.__eq__(other))
+    #
+
+    def __repr__(self):
+        """
+python.org: Called by the repr() built-in function to compute the "official"
+string representation of an object.
+
+:return: (str) String representation
+:since:  v1.1.0
+        """
+
+        return "<{0} {1!r} {2!r} {3!r}>".format(self.__class__.__name__, self._event_type, self._url, self._changed_value)
+    #
+
+    @property
+    def changed_value(self):
+        """
+Returns the changed value (e.g. a file name) if reported.
+
+:return: (mixed) Changed value; None if not reported
+:since:  v1.1.0
+        """
+
+        return self._changed_value
+    #
+
+    @property
+    def event_type(self):
+        """
+Returns the event type.
+
+:return: (int) Event type
+:since:  v1.1.0
+        """
+
+        return self._event_type
+    #
+
+    @property
+    def url(self):
+        """
+Returns the resource URL watched.
+
+:return: (str) Resource URL
+:since:  v1.1.0
+        """
+
+        return self._url
+    #
+#
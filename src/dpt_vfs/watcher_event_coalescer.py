@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+#echo(dptVfsVersion)#
+#echo(__FILEPATH__)#
+"""
+
+from collections import OrderedDict
+from threading import Event
+from time import time
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_logging import ExceptionLogTrap
+from dpt_runtime import Settings
+from dpt_threading import ThreadLock
+from dpt_threading.encapsulated import Thread
+
+from .abstract_watcher import AbstractWatcher
+from .watcher_event import WatcherEvent
+
+class WatcherEventCoalescer(object):
+    """
+"WatcherEventCoalescer" collects watcher events for each changed path until
+no new event has been reported for the debounce delay. Events of the same
+path are merged and all events due are delivered as one list of
+"WatcherEvent" instances.
+
+Merged events:
+* created and modified: created
+* created and deleted: dropped
+* deleted and created: replaced
+* modified or replaced and deleted: deleted
+
+:author:     direct Netware Group et al.
+:copyright:  direct Netware Group - All rights reserved
+:package:    dpt
+:subpackage: vfs
+:since:      v1.1.0
+:license:    https://www.direct-netware.de/redirect?licenses;mpl2
+             Mozilla Public License, v. 2.0
+    """
+
+    __slots__ = ( "_batch_callback",
+                  "_callback",
+                  "_delay",
+                  "_lock",
+                  "_max_delay",
+                  "_pending",
+                  "_thread",
+                  "_wakeup_event"
+                )
+    """
+python.org: __slots__ reserves space for the declared variables and prevents
+the automatic creation of __dict__ and __weakref__ for each instance.
+    """
+
+    def __init__(self, batch_callback, delay = None, max_delay = None):
+        """
+Constructor __init__(WatcherEventCoalescer)
+
+:param batch_callback: Callback called with a list of "WatcherEvent"
+                       instances
+:param delay: Seconds without new events for a path before its events are
+              delivered
+:param max_delay: Maximum seconds events of a path are delayed if changes
+                  are reported continuously
+
+:since: v1.1.0
+        """
+
+        if (delay is None): delay = Settings.get("dpt_vfs_watcher_coalescer_delay", 0.1)
+        if (max_delay is None): max_delay = Settings.get("dpt_vfs_watcher_coalescer_max_delay", 1.0)
+
+        self._batch_callback = batch_callback
+        """
+Callback called with a list of events
+        """
+        self._callback = self._on_event
+        """
+Bound callback registered with watchers
+        """
+        self._delay = delay
+        """
+Debounce delay in seconds
+        """
+        self._lock = ThreadLock()
+        """
+Thread safety lock
+        """
+        self._max_delay = max(delay, max_delay)
+        """
+Maximum delay in seconds
+        """
+        self._pending = OrderedDict()
+        """
+Pending events as a list of event type, URL, changed value, time of the
+first and last event for each changed path
+        """
+        self._thread = None
+        """
+Thread delivering pending events
+        """
+        self._wakeup_event = None
+        """
+Event set to wake up the delivering thread
+        """
+    #
+
+    @property
+    def callback(self):
+        """
+Returns the callback to be registered with watchers.
+
+:return: (object) Watcher callback
+:since:  v1.1.0
+        """
+
+        return self._callback
+    #
+
+    @property
+    def pending_count(self):
+        """
+Returns the number of changed paths with pending events.
+
+:return: (int) Number of changed paths
+:since:  v1.1.0
+        """
+
+        with self._lock: return len(self._pending)
+    #
+
+    def _deliver(self, timestamp = None):
+        """
+Delivers all pending events due at the given time.
+
+:param timestamp: UNIX timestamp; None to deliver all pending events
+
+:return: (float) Seconds until the next pending events are due; None if
+         no events are pending
+:since:  v1.1.0
+        """
+
+        _return = None
+        events = [ ]
+
+        with self._lock:
+            for key in list(self._pending):
+                event_type, url, changed_value, time_first, time_last = self._pending[key]
+                time_due = min(time_last + self._delay, time_first + self._max_delay)
+
+                if (timestamp is None or time_due <= timestamp):
+                    del(self._pending[key])
+                    if (event_type is not None): events.append(WatcherEvent(event_type, url, changed_value))
+                else:
+                    timeout = time_due - timestamp
+                    if (_return is None or timeout < _return): _return = timeout
+                #
+            #
+        #
+
+        if (len(events) > 0):
+            with ExceptionLogTrap("dpt_vfs"): self._batch_callback(events)
+        #
+
+        return _return
+    #
+
+    def flush(self):
+        """
+Delivers all pending events immediately.
+
+:since: v1.1.0
+        """
+
+        self._deliver()
+    #
+
+    def _on_event(self, event_type, url, changed_value = None):
+        """
+Callback called by watchers for each event.
+
+:param event_type: Event type
+:param url: Resource URL watched
+:param changed_value: Changed value if reported
+
+:since: v1.1.0
+        """
+
+        key = (url if (changed_value is None) else "{0}/{1}".format(url, quote_plus(changed_value)))
+        timestamp = time()
+
+        with self._lock:
+            is_wakeup_required = (len(self._pending) < 1)
+
+            if (key in self._pending):
+                pending = self._pending[key]
+                pending[0] = WatcherEventCoalescer._merge_event_types(pending[0], event_type)
+                pending[4] = timestamp
+            else: self._pending[key] = [ event_type, url, changed_value, timestamp, timestamp ]
+
+            if (self._thread is None):
+                self._wakeup_event = Event()
+
+                self._thread = Thread(target = self._run, args = ( self._wakeup_event, ))
+                self._thread.daemon = True
+                self._thread.start()
+            elif (is_wakeup_required): self._wakeup_event.set()
+        #
+    #
+
+    def register(self, watcher, url, recursive = False):
+        """
+Registers this coalescer for the given resource URL.
+
+:param watcher: Watcher instance
+:param url: Resource URL to be watched
+:param recursive: True to watch the collection and all of its descendants
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        return watcher.register(url, self._callback, recursive)
+    #
+
+    def _run(self, wakeup_event):
+        """
+Delivers pending events if due until stopped.
+
+:param wakeup_event: Event set if new events are pending or if stopped
+
+:since: v1.1.0
+        """
+
+        timeout = 0
+
+        while True:
+            wakeup_event.wait(timeout)
+            wakeup_event.clear()
+
+            with self._lock: is_stopped = (self._wakeup_event is not wakeup_event)
+            if (is_stopped): break
+
+            timeout = self._deliver(time())
+        #
+    #
+
+    def stop(self, flush = True):
+        """
+Stops delivering events in the background.
+
+:param flush: True to deliver all pending events before returning
+
+:since: v1.1.0
+        """
+
+        with self._lock:
+            thread = self._thread
+            wakeup_event = self._wakeup_event
+
+            self._thread = None
+            self._wakeup_event = None
+        #
+
+        if (thread is not None):
+            wakeup_event.set()
+            thread.join()
+        #
+
+        if (flush): self.flush()
+        else:
+            with self._lock: self._pending.clear()
+        #
+    #
+
+    def unregister(self, watcher, url):
+        """
+Unregisters this coalescer for the given resource URL.
+
+:param watcher: Watcher instance
+:param url: Resource URL watched
+
+:return: (bool) True on success
+:since:  v1.1.0
+        """
+
+        return watcher.unregister(url, self._callback)
+    #
+
+    @staticmethod
+    def _merge_event_types(pending_event_type, event_type):
+        """
+Merges the event type given with the one pending for the same path.
+
+:param pending_event_type: Event type pending; None if events cancelled
+                           each other out
+:param event_type: Event type reported
+
+:return: (int) Merged event type; None if no event is left
+:since:  v1.1.0
+        """
+
+        _return = event_type
+
+        if (pending_event_type is None):
+            # Created after being created and deleted again
+            if (event_type == AbstractWatcher.EVENT_TYPE_MODIFIED): _return = AbstractWatcher.EVENT_TYPE_CREATED
+        elif (pending_event_type == AbstractWatcher.EVENT_TYPE_CREATED):
+            if (event_type == AbstractWatcher.EVENT_TYPE_DELETED): _return = None
+            else: _return = AbstractWatcher.EVENT_TYPE_CREATED
+        elif (pending_event_type == AbstractWatcher.EVENT_TYPE_DELETED):
+            if (event_type != AbstractWatcher.EVENT_TYPE_DELETED): _return = AbstractWatcher.EVENT_TYPE_REPLACED
+        elif (pending_event_type == AbstractWatcher.EVENT_TYPE_REPLACED):
+            if (event_type != AbstractWatcher.EVENT_TYPE_DELETED): _return = AbstractWatcher.EVENT_TYPE_REPLACED
+        #
+
+        return _return
+    #
+#
@@ -23,6 +23,7 @@ from dpt_runtime.exceptions import IOException, OperationNotSupportedException,
 from dpt_threading import ThreadLock
 
 from .abstract_watcher import AbstractWatcher
+from .vfs_url import VfsUrl
 
 class WatcherImplementation(object):
     """
@@ -140,13 +141,7 @@ Returns the scheme of the VFS URL given.
 :since:  v1.0.0
         """
 
-        vfs_url = Binary.str(vfs_url)
-        if (type(vfs_url) is not str): raise ValueException("VFS URL given is invalid")
-
-        vfs_url_data = vfs_url.split("://", 1)
-        if (len(vfs_url_data) == 1): raise ValueException("VFS URL '{0}' is invalid".format(vfs_url))
-
-        return vfs_url_data[0]
+        return VfsUrl.parse(Binary.str(vfs_url)).scheme
     #
 
     @staticmethod
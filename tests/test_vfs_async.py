@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import os
+import unittest
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_vfs import WatcherEvent
+from dpt_vfs.dpt_vfs.file.object import Object
+from dpt_vfs.dpt_vfs.file.watcher import Watcher
+
+try:
+    import asyncio
+    from dpt_vfs import AsyncImplementation, AsyncObject
+except ImportError:
+    asyncio = None
+    AsyncImplementation = None
+    AsyncObject = None
+#
+
+@unittest.skipIf(AsyncImplementation is None, "asyncio is not supported")
+class TestVfsAsync(unittest.TestCase):
+    """
+UnitTest for dpt_vfs.AsyncImplementation
+
+:since: v1.1.0
+    """
+
+    def setUp(self):
+        """
+Creates a temporary directory with two files and an event loop.
+        """
+
+        self.base_directory = mkdtemp()
+        self.loop = asyncio.new_event_loop()
+
+        for file_name in ( "b_file.txt", "a_file.txt" ):
+            with open(path.join(self.base_directory, file_name), "wb") as file_object: file_object.write(b"unittest")
+        #
+    #
+
+    def tearDown(self):
+        """
+Removes the temporary directory and closes the event loop.
+        """
+
+        AsyncImplementation.shutdown_executor()
+        self.loop.close()
+
+        rmtree(self.base_directory)
+    #
+
+    def get_url(self, file_path_name):
+        """
+Returns the "file:///" URL for the given path.
+
+:param file_path_name: Filesystem path
+
+:return: (str) VFS URL
+        """
+
+        return "file:///{0}".format(quote_plus(file_path_name, "/"))
+    #
+
+    def test_async_object(self):
+        """
+Tests reading, scanning and metadata of asynchronous VFS objects
+        """
+
+        run = self.loop.run_until_complete
+
+        vfs_object = run(AsyncImplementation.load_vfs_url(self.get_url(path.join(self.base_directory, "a_file.txt")), True))
+
+        self.assertEqual(b"unit", run(vfs_object.read(4)))
+        self.assertEqual(4, run(vfs_object.tell()))
+
+        metadata = run(vfs_object.stat())
+        self.assertEqual("a_file.txt", metadata['name'])
+        self.assertEqual(8, metadata['size'])
+        self.assertEqual(AsyncImplementation.TYPE_FILE, metadata['type'])
+
+        run(vfs_object.close())
+
+        directory = run(AsyncImplementation.load_vfs_url(self.get_url(self.base_directory), True))
+
+        self.assertEqual([ "a_file.txt", "b_file.txt" ],
+                         sorted(child.vfs_object.name for child in run(directory.scan()))
+                        )
+
+        names = [ ]
+        iterator = directory.iter_scan(True, 1)
+
+        while True:
+            try: names.append(run(iterator.__anext__()).vfs_object.name)
+            except StopAsyncIteration: break
+        #
+
+        self.assertEqual([ "a_file.txt", "b_file.txt" ], names)
+
+        run(directory.close())
+    #
+
+    def test_async_object_iter_scan_closed(self):
+        """
+Tests closing the directory iterator if iteration ends early
+        """
+
+        closed_list = [ ]
+        iterators = [ ]
+
+        class UnittestObject(Object):
+            """
+VFS object recording if its directory iterator has been closed
+            """
+
+            def iter_scan(self, sort = False, batch_size = None):
+                """
+Returns an iterator over objects of a directory. It is referenced until
+the test ends to not be closed by the garbage collector.
+                """
+
+                _return = self._iter_scan_recorded(sort, batch_size)
+                iterators.append(_return)
+
+                return _return
+            #
+
+            def _iter_scan_recorded(self, sort, batch_size):
+                """
+Iterates over objects of a directory and records if closed.
+                """
+
+                try:
+                    for batch in Object.iter_scan(self, sort, batch_size): yield batch
+                finally: closed_list.append(True)
+            #
+        #
+
+        run = self.loop.run_until_complete
+
+        vfs_object = UnittestObject()
+        vfs_object.open(self.get_url(self.base_directory), True)
+
+        iterator = AsyncObject(vfs_object).iter_scan(True, 1)
+        self.assertEqual("a_file.txt", run(iterator.__anext__()).vfs_object.name)
+
+        run(iterator.aclose())
+        self.assertEqual([ True ], closed_list)
+
+        vfs_object.close()
+    #
+
+    def test_watcher_events(self):
+        """
+Tests the asynchronous event stream of the mtime watcher
+        """
+
+        run = self.loop.run_until_complete
+
+        file_path_name = path.join(self.base_directory, "a_file.txt")
+        url = self.get_url(file_path_name)
+
+        watcher = Watcher()
+        watcher.set_implementation(Watcher.IMPLEMENTATION_MTIME)
+
+        try:
+            events = watcher.events(url, self.loop)
+            self.assertTrue(watcher.is_watched(url))
+
+            os.utime(file_path_name, ( 1, 1 ))
+            watcher.check(url)
+
+            self.assertEqual(WatcherEvent(Watcher.EVENT_TYPE_MODIFIED, url), run(events.__anext__()))
+
+            events.close()
+            self.assertFalse(watcher.is_watched(url))
+            self.assertRaises(StopAsyncIteration, run, events.__anext__())
+        finally: watcher.disable()
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
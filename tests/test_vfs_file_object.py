@@ -0,0 +1,592 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from io import BytesIO
+from os import path
+from shutil import rmtree
+import errno
+import os
+import unittest
+
+try: from tempfile import TemporaryDirectory
+except ImportError:
+    from tempfile import mkdtemp
+
+    class TemporaryDirectory(object):
+        """
+python.org: Create and return a temporary directory.
+        """
+
+        def __init__(self, suffix = "", prefix = "tmp", dir = None):
+            """
+Constructor __init__(TemporaryDirectory)
+            """
+
+            self.dir = dir
+            self.name = None
+            self.prefix = prefix
+            self.suffix = suffix
+        #
+
+        def __enter__(self):
+            """
+python.org: Enter the runtime context related to this object.
+
+:return: (str) Temporary directory path
+            """
+
+            self.name = mkdtemp(self.suffix, self.prefix, self.dir)
+            return self.name
+        #
+
+        def __exit__(self, exc, value, tb):
+            """
+python.org: Exit the runtime context related to this object.
+
+:return: (bool) True to suppress exceptions
+            """
+
+            self.cleanup()
+            return False
+        #
+
+        def cleanup(self, _warn = False):
+            """
+python.org: The directory can be explicitly cleaned up by calling the cleanup() method.
+            """
+
+            rmtree(self.name)
+        #
+    #
+#
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_runtime.exceptions import IOException, OperationNotSupportedException
+
+from dpt_vfs import Implementation, MimetypeTable
+from dpt_vfs.dpt_vfs.file.metadata_cache import MetadataCache
+from dpt_vfs.dpt_vfs.file.object import Object
+from dpt_vfs.dpt_vfs.file.watcher import Watcher
+
+class TestVfsFileObject(unittest.TestCase):
+    """
+UnitTest for dpt_vfs.file.Object
+
+:since: v1.1.0
+    """
+
+    def create_tree(self, base_directory):
+        """
+Creates a simple directory tree.
+
+:param base_directory: Base directory to create the tree in
+        """
+
+        os.mkdir(path.join(base_directory, "b_directory"))
+
+        for file_name in ( "c_file.txt", "a_file.bin", ".hidden", path.join("b_directory", "nested.txt") ):
+            with open(path.join(base_directory, file_name), "wb") as file_object: file_object.write(b"unittest")
+        #
+    #
+
+    def get_url(self, file_path_name):
+        """
+Returns the "file:///" URL for the given path.
+
+:param file_path_name: Filesystem path
+
+:return: (str) VFS URL
+        """
+
+        return "file:///{0}".format(quote_plus(file_path_name, "/"))
+    #
+
+    def test_copy_to(self):
+        """
+Tests copying and sending data to files and file descriptors
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(path.join(base_directory, "c_file.txt")), True)
+
+            with open(path.join(base_directory, "d_file.bin"), "wb") as file_object: file_object.write(b"0123")
+
+            target = Implementation.load_vfs_url(self.get_url(path.join(base_directory, "d_file.bin")))
+            target.seek(4)
+            vfs_object.copy_to(target)
+            target.write(b"4")
+            target.close()
+
+            with open(path.join(base_directory, "d_file.bin"), "rb") as file_object:
+                self.assertEqual(b"0123unittest4", file_object.read())
+            #
+
+            target = BytesIO()
+            vfs_object.copy_to(target)
+            self.assertEqual(b"unittest", target.getvalue())
+
+            read_fd, write_fd = os.pipe()
+
+            try:
+                self.assertEqual(4, vfs_object.send_to_fd(write_fd, 2, 4))
+                self.assertEqual(b"itte", os.read(read_fd, 16))
+            finally:
+                os.close(read_fd)
+                os.close(write_fd)
+            #
+
+            vfs_object.close()
+        #
+    #
+
+    def test_iter_scan(self):
+        """
+Tests iterating over a directory
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt" ],
+                             sorted(vfs_child_object.name for vfs_child_object in vfs_object.iter_scan())
+                            )
+
+            batches = list(vfs_object.iter_scan(True, 2))
+
+            self.assertEqual(2, len(batches))
+            self.assertEqual([ "a_file.bin", "b_directory" ], [ vfs_child_object.name for vfs_child_object in batches[0] ])
+            self.assertEqual([ "c_file.txt" ], [ vfs_child_object.name for vfs_child_object in batches[1] ])
+
+            vfs_object.close()
+        #
+    #
+
+    def test_metadata_cache(self):
+        """
+Tests the process-wide metadata cache invalidated by the mtime watcher
+        """
+
+        watcher = Watcher()
+        watcher.set_implementation(Watcher.IMPLEMENTATION_MTIME)
+
+        MetadataCache.set_max_size(2)
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                self.create_tree(base_directory)
+
+                file_path_name = path.join(base_directory, "c_file.txt")
+                file_url = self.get_url(file_path_name)
+
+                vfs_object = Implementation.load_vfs_url(file_url, True)
+                self.assertEqual(8, vfs_object.size)
+                self.assertEqual("text/plain", vfs_object.mimetype)
+                vfs_object.close()
+
+                self.assertTrue(watcher.is_watched(file_url))
+                self.assertEqual("text/plain", MetadataCache.get(file_path_name)['mimetype'])
+
+                os.utime(file_path_name, ( 1, 1 ))
+
+                self.assertIsNone(MetadataCache.get(file_path_name))
+
+                vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+                self.assertTrue(vfs_object.is_directory)
+                vfs_object.close()
+
+                vfs_object = Implementation.load_vfs_url(self.get_url(path.join(base_directory, "a_file.bin")), True)
+                self.assertTrue(vfs_object.is_file)
+                vfs_object.close()
+
+                vfs_object = Implementation.load_vfs_url(file_url, True)
+                self.assertEqual(1, vfs_object.time_updated)
+                vfs_object.close()
+
+                self.assertIsNone(MetadataCache.get(base_directory))
+                self.assertFalse(watcher.is_watched(self.get_url(base_directory)))
+            #
+        finally:
+            MetadataCache.set_max_size(0)
+            MetadataCache.clear()
+
+            watcher.disable()
+        #
+    #
+
+    def test_mimetype(self):
+        """
+Tests resolving mime types
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(path.join(base_directory, "c_file.txt")), True)
+            self.assertEqual("text/plain", vfs_object.mimetype)
+            vfs_object.close()
+        #
+
+        self.assertEqual([ "text/plain", "text/plain", "application/octet-stream" ],
+                         MimetypeTable.mimetypes_for([ "c_file.txt", "C_FILE.TXT", "a_file.unittest-unknown" ])
+                        )
+
+        MimetypeTable.refresh()
+        self.assertEqual("text/plain", MimetypeTable.get_by_extension("TXT"))
+    #
+
+    def test_mmap(self):
+        """
+Tests reading memory-mapped files
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Object()
+            vfs_object.open(self.get_url(path.join(base_directory, "c_file.txt")), True, True)
+
+            self.assertTrue(vfs_object.is_supported("memoryview"))
+            self.assertEqual(b"test", vfs_object.memoryview[4:].tobytes())
+
+            self.assertEqual(b"unit", vfs_object.read(4))
+            self.assertEqual(4, vfs_object.tell())
+
+            buffer = bytearray(8)
+            self.assertEqual(4, vfs_object.readinto(buffer))
+            self.assertEqual(b"test", bytes(buffer[:4]))
+            self.assertTrue(vfs_object.is_eof)
+
+            vfs_object.seek(2)
+            self.assertEqual(b"ittest", vfs_object.read())
+            self.assertRaises(IOException, vfs_object.write, b"unittest")
+
+            vfs_object.close()
+
+            with open(path.join(base_directory, "empty_file.bin"), "wb"): pass
+
+            vfs_object = Object()
+            vfs_object.open(self.get_url(path.join(base_directory, "empty_file.bin")), True, True)
+
+            self.assertFalse(vfs_object.is_supported("memoryview"))
+            self.assertEqual(b"", vfs_object.read())
+
+            vfs_object.close()
+        #
+    #
+
+    def test_readinto(self):
+        """
+Tests reading into a pre-allocated buffer and copying data
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(path.join(base_directory, "c_file.txt")), True)
+            self.assertTrue(vfs_object.is_supported("readinto"))
+
+            buffer = bytearray(5)
+
+            self.assertEqual(5, vfs_object.readinto(buffer))
+            self.assertEqual(b"unitt", bytes(buffer))
+            self.assertEqual(3, vfs_object.readinto(memoryview(buffer)[1:]))
+            self.assertEqual(b"uest", bytes(buffer[:4]))
+            self.assertTrue(vfs_object.is_eof)
+
+            vfs_object.file_like_copy_io_chunk_size = 3
+            target = BytesIO()
+
+            vfs_object.copy_data(target)
+            self.assertEqual(b"unittest", target.getvalue())
+
+            vfs_object.close()
+        #
+    #
+
+    def test_scan(self):
+        """
+Tests scanning a directory
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+            vfs_child_objects = vfs_object.scan()
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt" ], [ vfs_child_object.name for vfs_child_object in vfs_child_objects ])
+            self.assertTrue(vfs_child_objects[0].is_file)
+            self.assertTrue(vfs_child_objects[1].is_directory)
+            self.assertEqual(8, vfs_child_objects[2].size)
+            self.assertEqual(self.get_url(path.join(base_directory, "c_file.txt")), vfs_child_objects[2].url)
+            self.assertEqual(b"unittest", vfs_child_objects[2].read())
+
+            vfs_child_objects[2].close()
+
+            # Children are opened with the settings of their directory with and without "os.scandir()"
+            vfs_object.stat_cache_ttl = 0
+            vfs_object.use_mmap = (not vfs_object.use_mmap)
+
+            for vfs_child_objects in ( vfs_object._iter_listdir(True), vfs_object.iter_scan(True) ):
+                for vfs_child_object in vfs_child_objects:
+                    self.assertEqual(( 0, vfs_object.use_mmap ), ( vfs_child_object.stat_cache_ttl, vfs_child_object.use_mmap ))
+                #
+            #
+
+            vfs_object.close()
+        #
+    #
+
+    def test_scan_records(self):
+        """
+Tests scanning a directory for records
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+            scan_records = vfs_object.scan_records(True)
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt" ], [ scan_record.name for scan_record in scan_records ])
+            self.assertEqual(vfs_object.TYPE_FILE, scan_records[0].type)
+            self.assertEqual(vfs_object.TYPE_DIRECTORY, scan_records[1].type)
+            self.assertEqual(0, scan_records[1].size)
+            self.assertEqual(8, scan_records[2].size)
+            self.assertEqual(self.get_url(path.join(base_directory, "c_file.txt")), scan_records[2].url)
+
+            vfs_child_object = scan_records[2].to_object(True)
+            self.assertEqual(b"unittest", vfs_child_object.read())
+            vfs_child_object.close()
+
+            scan_records = vfs_object.scan_records(True, False)
+            self.assertEqual(3, len(scan_records))
+            self.assertIsNone(scan_records[2].size)
+            self.assertIsNone(scan_records[2].time_updated)
+
+            vfs_object.close()
+        #
+    #
+
+    def test_scan_table(self):
+        """
+Tests scanning a directory into columns
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+
+            scan_table = vfs_object.scan_table()
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt" ], sorted(scan_table.names))
+            self.assertEqual(16, sum(scan_table.sizes))
+            self.assertEqual(1, list(scan_table.types).count(vfs_object.TYPE_DIRECTORY))
+
+            scan_table = vfs_object.walk_table()
+            nested_path_name = path.join("b_directory", "nested.txt")
+
+            self.assertEqual(4, len(scan_table))
+            self.assertIn(nested_path_name, scan_table.names)
+            self.assertEqual(24, sum(scan_table.sizes))
+            self.assertEqual(os.stat(path.join(base_directory, nested_path_name)).st_ino, scan_table.inodes[scan_table.names.index(nested_path_name)])
+            self.assertEqual(len(scan_table.names_buffer), scan_table.name_offsets[-1])
+
+            if (scan_table.is_numpy_available()):
+                columns = scan_table.to_numpy()
+                self.assertEqual(24, int(columns["sizes"].sum()))
+
+                # Columns shared with NumPy arrays must not be resized
+                self.assertTrue(scan_table.is_frozen)
+                self.assertRaises(OperationNotSupportedException, scan_table.append, "unittest", vfs_object.TYPE_FILE, 0, 0, 0)
+                self.assertEqual(len(columns["sizes"]), len(scan_table))
+                self.assertEqual(len(scan_table.names_buffer), scan_table.name_offsets[-1])
+            #
+
+            vfs_object.close()
+        #
+    #
+
+    def test_stat_cache(self):
+        """
+Tests cached metadata
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+            file_path_name = path.join(base_directory, "c_file.txt")
+
+            vfs_object = Implementation.get_instance("file")
+            vfs_object.stat_cache_ttl = 0
+            vfs_object.open(self.get_url(file_path_name), True)
+
+            self.assertEqual(8, vfs_object.size)
+            self.assertTrue(vfs_object.is_valid)
+
+            with open(file_path_name, "ab") as file_object: file_object.write(b"appended")
+
+            self.assertEqual(8, vfs_object.size)
+
+            vfs_object.refresh()
+            self.assertEqual(16, vfs_object.size)
+
+            vfs_object.close()
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(file_path_name), True)
+            vfs_object.stat_cache_ttl = None
+
+            with open(file_path_name, "ab") as file_object: file_object.write(b"appended")
+
+            self.assertEqual(24, vfs_object.size)
+
+            vfs_object.close()
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+            vfs_object.stat_cache_ttl = None
+
+            vfs_child_object = [ vfs_child_object for vfs_child_object in vfs_object.scan() if vfs_child_object.name == "c_file.txt" ][0]
+            self.assertEqual(24, vfs_child_object.size)
+
+            with open(file_path_name, "ab") as file_object: file_object.write(b"appended")
+
+            self.assertEqual(32, vfs_child_object.size)
+
+            vfs_child_object.close()
+            vfs_object.close()
+
+            # Changes written by the VFS object itself discard cached metadata
+            vfs_object = Implementation.get_instance("file")
+            vfs_object.stat_cache_ttl = 0
+            vfs_object.open(self.get_url(file_path_name), False)
+
+            self.assertEqual(32, vfs_object.size)
+
+            vfs_object.seek(32)
+            vfs_object.write(b"x" * 100)
+            vfs_object.flush()
+            self.assertEqual(132, vfs_object.size)
+
+            vfs_object.truncate(2)
+            self.assertEqual(2, vfs_object.size)
+
+            vfs_object.close()
+        #
+    #
+
+    def test_walk(self):
+        """
+Tests walking a directory tree
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+            os.makedirs(path.join(base_directory, "b_directory", "deep", "deeper"))
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt", "deep", "deeper", "nested.txt" ],
+                             sorted(vfs_child_object.name for vfs_child_object in vfs_object.walk())
+                            )
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt", "deep", "nested.txt" ],
+                             sorted(vfs_child_object.name for vfs_child_object in vfs_object.walk(2))
+                            )
+
+            self.assertEqual([ "a_file.bin", "c_file.txt", "nested.txt" ],
+                             sorted(vfs_child_object.name
+                                    for vfs_child_object in vfs_object.walk(filter_callback = lambda vfs_child_object: vfs_child_object.is_file)
+                                   )
+                            )
+
+            self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt" ],
+                             sorted(vfs_child_object.name
+                                    for vfs_child_object in vfs_object.walk(descend_callback = lambda vfs_child_object: False)
+                                   )
+                            )
+
+            vfs_object.close()
+        #
+    #
+
+    @unittest.skipIf((not hasattr(os, "symlink")), "symbolic links not supported")
+    def test_walk_linked_directory(self):
+        """
+Tests walking a directory tree containing a link to its parent directory
+        """
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+            os.symlink("..", path.join(base_directory, "b_directory", "loop"))
+
+            vfs_object = Implementation.load_vfs_url(self.get_url(base_directory), True)
+
+            # Both the concurrent and the fallback implementation must not descend into "loop"
+            for vfs_child_objects in ( vfs_object.walk(), vfs_object._iter_walk(None, None, None) ):
+                self.assertEqual([ "a_file.bin", "b_directory", "c_file.txt", "loop", "nested.txt" ],
+                                 sorted(vfs_child_object.name for vfs_child_object in vfs_child_objects)
+                                )
+            #
+
+            vfs_object.close()
+        #
+    #
+
+    def test_walk_entry_error(self):
+        """
+Tests walking a directory tree with entries failing to be read
+        """
+
+        class FailingObject(Object):
+            """
+VFS object failing to read "a_file.bin"
+            """
+
+            def _new_child_from_dir_entry(self, dir_entry):
+                """
+Returns a new child VFS object unless "a_file.bin" is read.
+                """
+
+                if (dir_entry.name == "a_file.bin"): raise OSError(errno.EACCES, "unittest", dir_entry.path)
+                return Object._new_child_from_dir_entry(self, dir_entry)
+            #
+        #
+
+        with TemporaryDirectory() as base_directory:
+            self.create_tree(base_directory)
+
+            vfs_object = FailingObject()
+            vfs_object.open(self.get_url(base_directory), True)
+
+            self.assertEqual([ "b_directory", "c_file.txt", "nested.txt" ],
+                             sorted(vfs_child_object.name for vfs_child_object in vfs_object.walk())
+                            )
+
+            vfs_object.close()
+        #
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#
@@ -17,8 +17,10 @@ unittest
 """
 
 from os import path
+from select import select
 from shutil import rmtree
-from time import sleep
+from time import sleep, time
+import errno
 import os
 import unittest
 
@@ -78,7 +80,13 @@ try: from urllib.parse import quote_plus
 except ImportError: from urllib import quote_plus
 
 from dpt_file import File
+from dpt_vfs import WatcherEvent, WatcherEventCoalescer
 from dpt_vfs.dpt_vfs.file.watcher import Watcher
+from dpt_vfs.dpt_vfs.file.watcher_inotify import IN_ISDIR, IN_MOVED_FROM, IN_MOVED_TO, IN_Q_OVERFLOW, WatcherInotify
+from dpt_vfs.watcher_callback_executor import WatcherCallbackExecutor
+from dpt_vfs.dpt_vfs.file.watcher_mtime import WatcherMtime
+from dpt_vfs.dpt_vfs.file.watcher_path_index import WatcherPathIndex
+from dpt_vfs.dpt_vfs.file.watcher_recursive_path_index import WatcherRecursivePathIndex
 
 try: from pyinotify import WatchManager
 except ImportError: WatchManager = None
@@ -156,6 +164,96 @@ Process a simple scenario.
         _file.close(False)
     #
 
+    def test_callback_executor(self):
+        """
+Tests ordered callback calls in worker threads
+        """
+
+        calls = [ ]
+        executor = WatcherCallbackExecutor(2, 8)
+
+        executor.start()
+        self.assertTrue(executor.is_running)
+
+        try:
+            for position in range(64):
+                executor.submit("file:///unittest/{0:d}.txt".format(position % 4), calls.append, ( position % 4, position ))
+            #
+
+            executor.wait()
+        finally: executor.stop()
+
+        self.assertFalse(executor.is_running)
+        self.assertEqual(64, len(calls))
+
+        for key in range(4):
+            positions = [ position for call_key, position in calls if (call_key == key) ]
+            self.assertEqual(list(range(key, 64, 4)), positions)
+        #
+
+        executor.submit("file:///unittest/0.txt", calls.append, None)
+        self.assertIsNone(calls[-1])
+    #
+
+    @unittest.skipIf((WatchManager is not None), "pyinotify.WatchManager is used by default")
+    def test_default_implementation(self):
+        """
+Tests the default implementation if pyinotify is not available
+        """
+
+        self.watcher.set_implementation()
+        self.assertTrue(self.watcher.is_synchronous)
+
+        if (WatcherInotify.is_available()):
+            self.watcher.set_implementation(Watcher.IMPLEMENTATION_INOTIFY_NATIVE)
+            self.assertFalse(self.watcher.is_synchronous)
+        #
+    #
+
+    def test_event_coalescer(self):
+        """
+Tests merging and batch delivery of watcher events
+        """
+
+        batches = [ ]
+        coalescer = WatcherEventCoalescer(batches.append, 0.05, 0.5)
+
+        try:
+            callback = coalescer.callback
+
+            callback(Watcher.EVENT_TYPE_CREATED, "file:///unittest", "created.txt")
+            callback(Watcher.EVENT_TYPE_MODIFIED, "file:///unittest/created.txt")
+            callback(Watcher.EVENT_TYPE_MODIFIED, "file:///unittest/created.txt")
+
+            callback(Watcher.EVENT_TYPE_CREATED, "file:///unittest", "temporary.txt")
+            callback(Watcher.EVENT_TYPE_DELETED, "file:///unittest", "temporary.txt")
+
+            callback(Watcher.EVENT_TYPE_DELETED, "file:///unittest", "replaced.txt")
+            callback(Watcher.EVENT_TYPE_CREATED, "file:///unittest", "replaced.txt")
+            callback(Watcher.EVENT_TYPE_MODIFIED, "file:///unittest/replaced.txt")
+
+            self.assertEqual(3, coalescer.pending_count)
+
+            for _ in range(50):
+                if (len(batches) > 0): break
+                sleep(0.05)
+            #
+
+            self.assertEqual(1, len(batches))
+            self.assertEqual(0, coalescer.pending_count)
+
+            self.assertEqual([ WatcherEvent(Watcher.EVENT_TYPE_CREATED, "file:///unittest", "created.txt"),
+                               WatcherEvent(Watcher.EVENT_TYPE_REPLACED, "file:///unittest", "replaced.txt")
+                             ],
+                             batches[0]
+                            )
+
+            callback(Watcher.EVENT_TYPE_MODIFIED, "file:///unittest/created.txt")
+        finally: coalescer.stop()
+
+        self.assertEqual([ WatcherEvent(Watcher.EVENT_TYPE_MODIFIED, "file:///unittest/created.txt") ], batches[1])
+    #
+
     @unittest.skipIf((WatchManager is None), "pyinotify.WatchManager not usable")
     def test_inotify(self):
         """
@@ -194,6 +292,219 @@ Tests pyinotify ThreadedNotifier
         self.assertEqual(None, self.changed_list[2]['changed_value'])
     #
 
+    @unittest.skipIf((not WatcherInotify.is_available()), "inotify not usable")
+    def test_inotify_native(self):
+        """
+Tests the native inotify implementation waiting for events with select()
+        """
+
+        self.watcher.set_implementation(Watcher.IMPLEMENTATION_INOTIFY_NATIVE)
+        self.assertFalse(self.watcher.is_synchronous)
+        self.watcher.disable()
+
+        watcher = WatcherInotify(False)
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                base_url = "file:///{0}".format(quote_plus(base_directory, "/"))
+
+                self.assertTrue(watcher.register(base_directory, self.changed_callback))
+                os.mkdir(path.join(base_directory, "unittest"))
+                self.assertTrue(watcher.register(path.join(base_directory, "unittest"), self.changed_callback))
+
+                unittest_file = path.join(base_directory, "unittest.txt")
+                self.assertTrue(watcher.register(unittest_file, self.changed_callback))
+
+                _file = File()
+                _file.open(unittest_file)
+                _file.close(False)
+
+                self.assertEqual([ watcher.fileno() ], select([ watcher.fileno() ], [ ], [ ], 5)[0])
+
+                self.assertEqual(3, watcher.process_events())
+
+                self.assertTrue(watcher.unregister(unittest_file, self.changed_callback))
+                self.assertFalse(watcher.is_watched(unittest_file))
+            #
+        finally: watcher.stop()
+
+        self.assertEqual(3, len(self.changed_list))
+
+        # mkdir "unittest"
+        self.assertEqual(Watcher.EVENT_TYPE_CREATED, self.changed_list[0]['event_type'])
+        self.assertEqual(base_url, self.changed_list[0]['url'])
+        self.assertEqual("unittest", self.changed_list[0]['changed_value'])
+
+        # create "unittest.txt"
+        self.assertEqual(Watcher.EVENT_TYPE_CREATED, self.changed_list[1]['event_type'])
+        self.assertEqual(base_url, self.changed_list[1]['url'])
+        self.assertEqual("unittest.txt", self.changed_list[1]['changed_value'])
+
+        # modify "unittest.txt"
+        self.assertEqual(Watcher.EVENT_TYPE_MODIFIED, self.changed_list[2]['event_type'])
+        self.assertEqual("{0}/unittest.txt".format(base_url), self.changed_list[2]['url'])
+        self.assertEqual(None, self.changed_list[2]['changed_value'])
+    #
+
+    @unittest.skipIf((not WatcherInotify.is_available()), "inotify not usable")
+    def test_inotify_native_overflow(self):
+        """
+Tests resynchronisation of watched paths after an event queue overflow
+        """
+
+        watcher = WatcherInotify(False)
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                unittest_file = path.join(base_directory, "unittest.txt")
+                self.assertTrue(watcher.register(unittest_file, self.changed_callback))
+
+                watcher._process_event(-1, IN_Q_OVERFLOW, 0, None)
+            #
+        finally: watcher.stop()
+
+        # Deleted entries are reported as for live events
+        self.assertEqual(1, len(self.changed_list))
+        self.assertEqual(Watcher.EVENT_TYPE_DELETED, self.changed_list[0]['event_type'])
+        self.assertEqual("file:///{0}".format(quote_plus(base_directory, "/")), self.changed_list[0]['url'])
+        self.assertEqual("unittest.txt", self.changed_list[0]['changed_value'])
+    #
+
+    @unittest.skipIf((not WatcherInotify.is_available()), "inotify not usable")
+    def test_inotify_native_recursive(self):
+        """
+Tests recursive watches of the native inotify implementation
+        """
+
+        watcher = WatcherInotify(False)
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                sub_directory = path.join(base_directory, "a", "b")
+                os.makedirs(sub_directory)
+
+                self.assertTrue(watcher.register(base_directory, self.changed_callback, True))
+                self.assertTrue(watcher.is_watched(base_directory, self.changed_callback))
+
+                new_directory = path.join(sub_directory, "c")
+                os.mkdir(new_directory)
+                watcher.process_events()
+
+                with open(path.join(new_directory, "unittest.txt"), "wb") as file_object: file_object.write(b"unittest")
+                os.rename(new_directory, path.join(base_directory, "c"))
+                self.assertEqual(5, watcher.process_events())
+
+                with open(path.join(base_directory, "c", "unittest.txt"), "wb") as file_object: file_object.write(b"unittest")
+                watcher.process_events()
+
+                self.assertTrue(watcher.unregister(base_directory, self.changed_callback))
+                self.assertFalse(watcher.is_watched(base_directory))
+            #
+        finally: watcher.stop()
+
+        self.assertEqual(( Watcher.EVENT_TYPE_CREATED, "c" ),
+                         ( self.changed_list[0]['event_type'], self.changed_list[0]['changed_value'] )
+                        )
+
+        # create and write "c/unittest.txt" watched automatically
+        self.assertEqual(Watcher.EVENT_TYPE_CREATED, self.changed_list[1]['event_type'])
+        self.assertEqual("unittest.txt", self.changed_list[1]['changed_value'])
+        self.assertEqual(Watcher.EVENT_TYPE_MODIFIED, self.changed_list[2]['event_type'])
+
+        # move "c" within the tree
+        self.assertEqual(Watcher.EVENT_TYPE_DELETED, self.changed_list[3]['event_type'])
+        self.assertEqual(Watcher.EVENT_TYPE_CREATED, self.changed_list[4]['event_type'])
+
+        # write "c/unittest.txt" after the move
+        self.assertEqual(Watcher.EVENT_TYPE_MODIFIED, self.changed_list[-1]['event_type'])
+
+        self.assertEqual("file:///{0}".format(quote_plus(path.join(base_directory, "c", "unittest.txt"), "/")),
+                         self.changed_list[-1]['url']
+                        )
+    #
+
+    @unittest.skipIf((not WatcherInotify.is_available()), "inotify not usable")
+    def test_inotify_native_recursive_move(self):
+        """
+Tests recursive watches if move events are read separately
+        """
+
+        watcher = WatcherInotify(False)
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                os.mkdir(path.join(base_directory, "a"))
+                self.assertTrue(watcher.register(base_directory, self.changed_callback, True))
+
+                root_wd = watcher._recursive_roots[base_directory]
+                child_wd = watcher._recursive_children[( root_wd, "a" )]
+
+                os.rename(path.join(base_directory, "a"), path.join(base_directory, "b"))
+
+                # "IN_MOVED_TO" read with the next buffer
+                watcher._process_event(root_wd, IN_MOVED_FROM | IN_ISDIR, 1, "a")
+                watcher._expire_recursive_moves()
+                watcher._process_event(root_wd, IN_MOVED_TO | IN_ISDIR, 1, "b")
+
+                self.assertEqual(child_wd, watcher._recursive_children.get(( root_wd, "b" )))
+
+                # "IN_MOVED_TO" never received
+                watcher._process_event(root_wd, IN_MOVED_FROM | IN_ISDIR, 2, "b")
+                watcher._expire_recursive_moves()
+                self.assertIn(child_wd, watcher._recursive_wds)
+
+                watcher._expire_recursive_moves(time() + WatcherInotify.RECURSIVE_MOVE_TIMEOUT)
+                self.assertNotIn(child_wd, watcher._recursive_wds)
+            #
+        finally: watcher.stop()
+
+        self.assertEqual([ ( Watcher.EVENT_TYPE_DELETED, "a" ), ( Watcher.EVENT_TYPE_CREATED, "b" ), ( Watcher.EVENT_TYPE_DELETED, "b" ) ],
+                         [ ( changed_entry['event_type'], changed_entry['changed_value'] ) for changed_entry in self.changed_list ]
+                        )
+    #
+
+    @unittest.skipIf((not WatcherInotify.is_available()), "inotify not usable")
+    def test_inotify_native_thread(self):
+        """
+Tests that the thread reading inotify events survives errors
+        """
+
+        class FailingWatcherInotify(WatcherInotify):
+            """
+Native inotify implementation failing after each read
+            """
+
+            __slots__ = ( )
+
+            def process_events(self):
+                """
+Reads all events and raises an error afterwards
+                """
+
+                WatcherInotify.process_events(self)
+                raise OSError(errno.EIO, "unittest")
+            #
+        #
+
+        watcher = FailingWatcherInotify()
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                for name in ( "unittest.txt", "unittest.bin" ):
+                    self.assertTrue(watcher.register(path.join(base_directory, name), self.changed_callback))
+                    with open(path.join(base_directory, name), "wb") as file_object: file_object.write(b"unittest")
+                    sleep(0.5)
+                #
+
+                self.assertTrue(watcher._thread.is_alive())
+            #
+        finally: watcher.stop()
+
+        self.assertEqual([ "unittest.txt", "unittest.bin" ],
+                         [ changed_entry['changed_value'] for changed_entry in self.changed_list if changed_entry['event_type'] == Watcher.EVENT_TYPE_CREATED ]
+                        )
+    #
+
     @unittest.skipIf((WatchManager is None), "pyinotify.WatchManager not usable")
     def test_inotify_sync(self):
         """
@@ -231,6 +542,97 @@ Tests pyinotify manually triggered Notifier
         self.assertEqual(None, self.changed_list[2]['changed_value'])
     #
 
+    @unittest.skipIf((WatchManager is None), "pyinotify.WatchManager not usable")
+    def test_inotify_sync_overflow(self):
+        """
+Tests pyinotify resynchronisation of watched paths after an event queue
+overflow
+        """
+
+        from dpt_vfs.dpt_vfs.file.watcher_pyinotify_sync import WatcherPyinotifySync
+
+        watcher = WatcherPyinotifySync()
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                unittest_file = path.join(base_directory, "unittest.txt")
+                self.assertTrue(watcher.register(unittest_file, self.changed_callback))
+
+                watcher.resync()
+
+                with open(unittest_file, "wb") as file_object: file_object.write(b"unittest")
+                watcher.resync()
+            #
+        finally: watcher.stop()
+
+        self.assertEqual(2, len(self.changed_list))
+
+        # Deleted entries are reported as for live events
+        self.assertEqual(Watcher.EVENT_TYPE_DELETED, self.changed_list[0]['event_type'])
+        self.assertEqual("file:///{0}".format(quote_plus(base_directory, "/")), self.changed_list[0]['url'])
+        self.assertEqual("unittest.txt", self.changed_list[0]['changed_value'])
+
+        self.assertEqual(Watcher.EVENT_TYPE_MODIFIED, self.changed_list[1]['event_type'])
+        self.assertEqual("file:///{0}".format(quote_plus(unittest_file, "/")), self.changed_list[1]['url'])
+        self.assertEqual(None, self.changed_list[1]['changed_value'])
+    #
+
+    @unittest.skipIf((WatchManager is None), "pyinotify.WatchManager not usable")
+    def test_inotify_sync_recursive(self):
+        """
+Tests pyinotify recursive watches sharing watch descriptors
+        """
+
+        from dpt_vfs.dpt_vfs.file.watcher_pyinotify_sync import WatcherPyinotifySync
+
+        recursive_changed_list = [ ]
+        recursive_callback = lambda event_type, url, changed_value = None: recursive_changed_list.append(( event_type, url, changed_value ))
+
+        watcher = WatcherPyinotifySync()
+
+        try:
+            with TemporaryDirectory() as base_directory:
+                root_directory = path.join(base_directory, "unittest")
+                sub_directory = path.join(root_directory, "a")
+                os.makedirs(sub_directory)
+
+                file_path_name = path.join(sub_directory, "unittest.txt")
+                root_url = "file:///{0}".format(quote_plus(root_directory, "/"))
+                sub_url = "file:///{0}".format(quote_plus(sub_directory, "/"))
+
+                self.assertTrue(watcher.register(file_path_name, self.changed_callback))
+                self.assertTrue(watcher.register(root_directory, recursive_callback, True))
+                self.assertTrue(watcher.unregister(root_directory, recursive_callback))
+
+                # The watch of "a" is still used for "a/unittest.txt"
+                with open(file_path_name, "wb") as file_object: file_object.write(b"unittest")
+                watcher.check(file_path_name)
+
+                self.assertEqual(( Watcher.EVENT_TYPE_CREATED, sub_url, "unittest.txt" ),
+                                 ( self.changed_list[0]['event_type'], self.changed_list[0]['url'], self.changed_list[0]['changed_value'] )
+                                )
+
+                self.assertTrue(watcher.register(root_directory, recursive_callback, True))
+                self.assertTrue(watcher.unregister(file_path_name, self.changed_callback))
+
+                # The watch of "a" is still used for the recursive watch
+                os.unlink(file_path_name)
+                watcher.check(file_path_name)
+
+                self.assertEqual([ ( Watcher.EVENT_TYPE_DELETED, sub_url, "unittest.txt" ) ], recursive_changed_list)
+
+                rmtree(root_directory)
+                watcher.check(root_directory)
+
+                self.assertFalse(watcher.is_watched(root_directory))
+            #
+        finally: watcher.stop()
+
+        # delete "a" and the recursively watched directory itself
+        self.assertEqual(( Watcher.EVENT_TYPE_DELETED, root_url, "a" ), recursive_changed_list[1])
+        self.assertEqual(( Watcher.EVENT_TYPE_DELETED, root_url, None ), recursive_changed_list[-1])
+    #
+
     def test_mtime(self):
         """
 Tests filesystem mtime based, manually triggered check
@@ -260,6 +662,171 @@ Tests filesystem mtime based, manually triggered check
         self.assertEqual("{0}/unittest.txt".format(base_url), self.changed_list[0]['url'])
         self.assertEqual(None, self.changed_list[0]['changed_value'])
     #
+
+    def test_mtime_polling(self):
+        """
+Tests filesystem mtime based background polling
+        """
+
+        self.watcher = Watcher()
+        self.watcher.set_implementation(Watcher.IMPLEMENTATION_MTIME)
+
+        with TemporaryDirectory() as base_directory:
+            base_url = "file:///{0}".format(quote_plus(base_directory, "/"))
+
+            unittest_file = path.join(base_directory, "unittest.txt")
+            unittest_url = base_url + "/unittest.txt"
+
+            self.watcher.register(unittest_url, self.changed_callback)
+
+            watcher_mtime = WatcherMtime()
+            watcher_mtime.start_polling(0.05, 0.1, 2)
+
+            try:
+                self.assertFalse(self.watcher.is_synchronous)
+
+                _file = File()
+                _file.open(unittest_file)
+                _file.close(False)
+
+                for _ in range(50):
+                    if (len(self.changed_list) > 0): break
+                    sleep(0.1)
+                #
+            finally: watcher_mtime.stop_polling()
+
+            self.assertTrue(self.watcher.is_synchronous)
+            self.watcher.stop()
+        #
+
+        self.assertEqual(1, len(self.changed_list))
+
+        self.assertEqual(Watcher.EVENT_TYPE_CREATED, self.changed_list[0]['event_type'])
+        self.assertEqual(unittest_url, self.changed_list[0]['url'])
+    #
+
+    def test_mtime_polling_directories(self):
+        """
+Tests filesystem mtime based sweeps checking parent directories first
+        """
+
+        self.watcher = Watcher()
+        self.watcher.set_implementation(Watcher.IMPLEMENTATION_MTIME)
+
+        watcher_mtime = WatcherMtime()
+
+        with TemporaryDirectory() as base_directory:
+            base_url = "file:///{0}".format(quote_plus(base_directory, "/"))
+
+            unittest_file = path.join(base_directory, "unittest.txt")
+            unittest_url = base_url + "/unittest.txt"
+
+            self.watcher.register(unittest_url, self.changed_callback)
+
+            # Initial sweep to record the directory snapshot
+            self.assertEqual([ ], watcher_mtime._sweep_directories())
+
+            _file = File()
+            _file.open(unittest_file)
+            _file.close(False)
+
+            events = watcher_mtime._sweep_directories()
+            self.assertEqual(1, len(events))
+            self.assertEqual(Watcher.EVENT_TYPE_CREATED, events[0][0])
+
+            # In-place changes are only detected by full sweeps
+            os.utime(unittest_file, ( 1, 1 ))
+
+            self.assertEqual([ ], watcher_mtime._sweep_directories())
+            self.assertEqual(Watcher.EVENT_TYPE_MODIFIED, watcher_mtime._sweep()[0][0])
+
+            os.unlink(unittest_file)
+
+            events = watcher_mtime._sweep_directories()
+            self.assertEqual(1, len(events))
+            self.assertEqual(Watcher.EVENT_TYPE_DELETED, events[0][0])
+            self.assertFalse(self.watcher.is_watched(unittest_url))
+
+            self.watcher.stop()
+        #
+    #
+
+    def test_path_index(self):
+        """
+Tests the dispatch index of inotify based watchers with fake watch
+descriptors
+        """
+
+        other_callback = lambda event_type, url, changed_value = None: None
+        path_index = WatcherPathIndex()
+
+        with TemporaryDirectory() as base_directory:
+            file_path_name = path.join(base_directory, "unittest.txt")
+            sub_directory = path.join(base_directory, "a")
+            os.mkdir(sub_directory)
+
+            path_index.add(file_path_name, base_directory, 1, self.changed_callback)
+
+            self.assertEqual(1, path_index.get_wd(base_directory))
+            self.assertEqual(( self.changed_callback, ), path_index.get_dispatch_callbacks(1, "unittest.txt"))
+            self.assertEqual(( ), path_index.get_dispatch_callbacks(1))
+
+            path_index.add(base_directory, base_directory, 1, other_callback)
+            path_index.add(sub_directory, sub_directory, 2, self.changed_callback)
+
+            self.assertEqual(( other_callback, ), path_index.get_dispatch_callbacks(1))
+
+            # Events of "a" are reported by its own watch and by the one of its parent
+            self.assertEqual(( self.changed_callback, ), path_index.get_dispatch_callbacks(2))
+            self.assertEqual(( self.changed_callback, ), path_index.get_dispatch_callbacks(1, "a"))
+
+            # Unregistered files are reported with the callbacks of the parent directory
+            self.assertEqual(( self.changed_callback, ), path_index.get_callbacks(path.join(sub_directory, "unittest.txt")))
+
+            self.assertEqual([ ], path_index.remove(file_path_name, self.changed_callback))
+            self.assertEqual(( ), path_index.get_dispatch_callbacks(1, "unittest.txt"))
+
+            self.assertEqual([ 2 ], path_index.remove(sub_directory, None))
+            self.assertEqual(( ), path_index.get_dispatch_callbacks(2))
+            self.assertEqual(( ), path_index.get_dispatch_callbacks(1, "a"))
+            self.assertIsNone(path_index.get_wd(sub_directory))
+
+            self.assertEqual([ 1 ], path_index.remove(base_directory, other_callback))
+            self.assertIsNone(path_index.remove(base_directory, other_callback))
+            self.assertEqual(( ), path_index.get_dispatch_callbacks(1))
+        #
+    #
+
+    def test_recursive_path_index(self):
+        """
+Tests the path prefix lookup of recursively watched directories
+        """
+
+        other_callback = lambda event_type, url, changed_value = None: None
+        recursive_path_index = WatcherRecursivePathIndex()
+
+        root_directory = path.join(path.sep, "unittest")
+        sub_directory = path.join(root_directory, "a")
+
+        recursive_path_index.update({ root_directory: [ self.changed_callback ], sub_directory: [ other_callback ] })
+
+        self.assertEqual({ self.changed_callback, other_callback }, set(recursive_path_index.get_callbacks(path.join(sub_directory, "unittest.txt"))))
+        self.assertEqual(( self.changed_callback, ), recursive_path_index.get_callbacks(root_directory))
+        self.assertEqual(( self.changed_callback, ), recursive_path_index.get_callbacks(path.join(root_directory, "b")))
+
+        # Paths sharing the prefix only are not watched
+        self.assertEqual(( ), recursive_path_index.get_callbacks(root_directory + "2"))
+
+        self.assertEqual(( other_callback, ), recursive_path_index.get_root_callbacks(sub_directory))
+        self.assertEqual(( ), recursive_path_index.get_root_callbacks(path.join(sub_directory, "b")))
+
+        recursive_path_index.update({ root_directory: [ ] })
+        self.assertEqual(( ), recursive_path_index.get_callbacks(sub_directory))
+
+        recursive_path_index.update({ root_directory: [ self.changed_callback ] })
+        recursive_path_index.clear()
+        self.assertEqual(( ), recursive_path_index.get_callbacks(root_directory))
+    #
 #
 
 if (__name__ == "__main__"):
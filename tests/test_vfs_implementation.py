@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+"""
+direct Python Toolbox
+All-in-one toolbox to encapsulate Python runtime variants
+----------------------------------------------------------------------------
+(C) direct Netware Group - All rights reserved
+https://www.direct-netware.de/redirect?dpt;vfs
+
+This Source Code Form is subject to the terms of the Mozilla Public License,
+v. 2.0. If a copy of the MPL was not distributed with this file, You can
+obtain one at http://mozilla.org/MPL/2.0/.
+----------------------------------------------------------------------------
+https://www.direct-netware.de/redirect?licenses;mpl2
+----------------------------------------------------------------------------
+unittest
+"""
+
+from io import BytesIO
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+import unittest
+
+try: from urllib.parse import quote_plus
+except ImportError: from urllib import quote_plus
+
+from dpt_runtime.exceptions import IOException, TypeException, ValueException
+from dpt_vfs import Abstract, FileLikeWrapperMixin, Implementation, ObjectPool, VfsUrl
+from dpt_vfs.dpt_vfs.file.object import Object
+
+class TestVfsImplementation(unittest.TestCase):
+    """
+UnitTest for dpt_vfs.Implementation
+
+:since: v1.1.0
+    """
+
+    def test_class_registry(self):
+        """
+Tests resolving and registering VFS object classes
+        """
+
+        class UnittestObject(Abstract):
+            """
+VFS object class used for testing
+            """
+
+            __slots__ = ( )
+        #
+
+        self.assertEqual([ "unittest-unknown" ], Implementation.load_classes([ "file", "unittest-unknown" ]))
+        self.assertIs(Object, Implementation.get_class("file"))
+        self.assertRaises(IOException, Implementation.get_class, "unittest-unknown")
+
+        Implementation.register_class("unittest-unknown", UnittestObject)
+        self.assertIs(UnittestObject, Implementation.get_class("unittest-unknown"))
+
+        Implementation.unregister_class("unittest-unknown")
+        self.assertRaises(IOException, Implementation.get_class, "unittest-unknown")
+
+        self.assertRaises(TypeException, Implementation.register_class, "unittest-unknown", object)
+
+        unknown_schemes_max_size = Implementation._UNKNOWN_SCHEMES_MAX_SIZE
+        Implementation._UNKNOWN_SCHEMES_MAX_SIZE = 2
+
+        try:
+            for scheme in ( "unittest-unknown-a", "unittest-unknown-b", "unittest-unknown-c" ):
+                self.assertRaises(IOException, Implementation.get_class, scheme)
+            #
+
+            self.assertEqual(2, len(Implementation._unknown_schemes))
+            self.assertIn("unittest-unknown-c", Implementation._unknown_schemes)
+
+            Implementation.register_class("unittest-unknown", UnittestObject)
+            self.assertEqual(0, len(Implementation._unknown_schemes))
+        finally:
+            Implementation._UNKNOWN_SCHEMES_MAX_SIZE = unknown_schemes_max_size
+            Implementation.unregister_class("unittest-unknown")
+        #
+    #
+
+    def test_file_like_wrapper(self):
+        """
+Tests redirecting file IO methods to the wrapped resource
+        """
+
+        class UnittestReader(object):
+            """
+Resource implementing "read()" only
+            """
+
+            def __init__(self, data):
+                """
+Constructor __init__(UnittestReader)
+                """
+
+                self.data = data
+            #
+
+            def close(self):
+                """
+python.org: Flush and close this stream.
+                """
+
+                pass
+            #
+
+            def read(self, n = -1):
+                """
+python.org: Read up to n bytes from the object and return them.
+                """
+
+                return self.data
+            #
+        #
+
+        @FileLikeWrapperMixin.install_wrapped_attributes
+        class UnittestWrapper(FileLikeWrapperMixin):
+            """
+Wrapper opening the resource given once needed
+            """
+
+            def __init__(self):
+                """
+Constructor __init__(UnittestWrapper)
+                """
+
+                FileLikeWrapperMixin.__init__(self)
+                self.resource = None
+            #
+
+            def _open_wrapped_resource(self):
+                """
+Opens the wrapped resource once needed.
+                """
+
+                if (self.resource is not None): self._set_wrapped_resource(self.resource)
+            #
+        #
+
+        # Descriptors are installed once the class is defined
+        self.assertIn("read", UnittestWrapper.__dict__)
+
+        wrapper = UnittestWrapper()
+        self.assertFalse(wrapper._is_wrapped_resource_open)
+        self.assertRaises(IOException, getattr, wrapper, "read")
+
+        wrapper.resource = BytesIO(b"unittest")
+        self.assertEqual(b"unittest", wrapper.read())
+        self.assertTrue(wrapper._is_wrapped_resource_open)
+        self.assertEqual(8, wrapper.tell())
+
+        # Methods are bound again to the resource set after closing
+        wrapper.close()
+        self.assertFalse(wrapper._is_wrapped_resource_open)
+
+        wrapper._set_wrapped_resource(BytesIO(b"reopened"))
+        self.assertEqual(b"reopened", wrapper.read())
+
+        wrapper._set_wrapped_resource(UnittestReader(b"unittest"))
+        self.assertEqual(b"unittest", wrapper.read())
+        self.assertRaises(AttributeError, getattr, wrapper, "write")
+
+        wrapper.close()
+    #
+
+    def test_object_pool(self):
+        """
+Tests reusing VFS objects
+        """
+
+        base_directory = mkdtemp()
+
+        try:
+            with open(path.join(base_directory, "unittest.txt"), "wb") as file_object: file_object.write(b"unittest")
+
+            base_url = "file:///{0}".format(quote_plus(base_directory, "/"))
+            object_pool = ObjectPool(1)
+
+            vfs_object = object_pool.acquire(base_url, True)
+            self.assertTrue(vfs_object.is_directory)
+            self.assertTrue(vfs_object.is_supported("filesystem_path_name"))
+
+            object_pool.release(vfs_object)
+            self.assertEqual(1, object_pool.idle_count)
+
+            vfs_file_object = object_pool.acquire("{0}/unittest.txt".format(base_url), True)
+            self.assertIs(vfs_object, vfs_file_object)
+            self.assertEqual(0, object_pool.idle_count)
+            self.assertEqual(b"unittest", vfs_file_object.read())
+
+            vfs_file_object.supported_features["seek"] = False
+            self.assertFalse(vfs_file_object.is_supported("seek"))
+            self.assertTrue(Object().supported_features["filesystem_path_name"])
+
+            vfs_file_object.reopen("{0}/unittest.txt".format(base_url), True)
+            self.assertTrue(vfs_file_object.is_supported("seek"))
+            self.assertEqual(b"unittest", vfs_file_object.read())
+
+            vfs_file_object.reopen(base_url)
+            self.assertTrue(vfs_file_object.is_directory)
+
+            vfs_file_object.stat_cache_ttl = 1000
+            vfs_file_object.use_mmap = (not vfs_file_object.use_mmap)
+            vfs_file_object.supported_features["seek"] = False
+
+            object_pool.release(vfs_file_object)
+            self.assertEqual(1, object_pool.idle_count)
+
+            vfs_file_object = object_pool.acquire("{0}/unittest.txt".format(base_url), True)
+            self.assertIs(vfs_object, vfs_file_object)
+            self.assertTrue(vfs_file_object.is_supported("seek"))
+            self.assertEqual(Object().stat_cache_ttl, vfs_file_object.stat_cache_ttl)
+            self.assertEqual(Object().use_mmap, vfs_file_object.use_mmap)
+
+            object_pool.release(vfs_file_object)
+        finally: rmtree(base_directory)
+    #
+
+    def test_stat_many(self):
+        """
+Tests reading metadata of VFS URLs in bulk
+        """
+
+        base_directory = mkdtemp()
+
+        try:
+            with open(path.join(base_directory, "unittest.txt"), "wb") as file_object: file_object.write(b"unittest")
+
+            base_url = "file:///{0}".format(quote_plus(base_directory, "/"))
+            vfs_urls = [ "{0}/unittest.txt".format(base_url), base_url, "{0}/missing.txt".format(base_url), "unittest-unknown:///", "unittest" ]
+
+            records = Implementation.stat_many(vfs_urls)
+            self.assertEqual(vfs_urls, [ record.url for record in records ])
+
+            self.assertEqual(( Implementation.TYPE_FILE, 8 ), ( records[0].type, records[0].size ))
+            self.assertTrue(records[0].is_valid)
+            self.assertEqual(Implementation.TYPE_DIRECTORY, records[1].type)
+
+            self.assertIsInstance(records[2].error, OSError)
+            self.assertIsInstance(records[3].error, IOException)
+            self.assertIsInstance(records[4].error, ValueException)
+            self.assertFalse(records[4].is_valid)
+
+            self.assertEqual(records[:2], Object.stat_many(vfs_urls[:2], 1))
+        finally: rmtree(base_directory)
+    #
+
+    def test_vfs_url(self):
+        """
+Tests parsing VFS URLs
+        """
+
+        vfs_url = VfsUrl.parse("FILE:////tmp/unit+test%25.txt")
+
+        self.assertIs(vfs_url, VfsUrl.parse("FILE:////tmp/unit+test%25.txt"))
+        self.assertEqual("file", vfs_url.scheme)
+        self.assertEqual("/tmp/unit+test%25.txt", vfs_url.id)
+        self.assertEqual("/tmp/unit test%.txt", vfs_url.path)
+
+        self.assertEqual("", VfsUrl.parse("file:///").id)
+        self.assertRaises(ValueException, VfsUrl.parse, "/tmp/unittest")
+        self.assertRaises(ValueException, VfsUrl.parse, [ "x" ])
+    #
+#
+
+if (__name__ == "__main__"):
+    unittest.main()
+#